@@ -0,0 +1,83 @@
+import json
+
+from graphene.test import Client
+from graphene.utils.deduplicator import deflate
+from pytest import fixture
+
+from .. import data
+from ..schema import Faction, schema
+
+FLEET_QUERY = """
+    query FleetQuery {
+      node(id: "RmFjdGlvbjoz") {
+        __typename
+        id
+        ... on Faction {
+          name
+          ships(first: 1000) {
+            edges {
+              cursor
+              node {
+                __typename
+                id
+                name
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+@fixture
+def fleet():
+    data.setup()
+    # A fleet of 1000 ships, made of the 8 ships of the saga.
+    data.data["Faction"]["3"] = Faction(
+        id="3", name="Fleet", ships=[str(i % 8 + 1) for i in range(1000)]
+    )
+    yield
+    data.setup()
+
+
+def payload_size(response):
+    return len(json.dumps(response, separators=(",", ":")))
+
+
+def test_deduplicated_fleet_matches_deflate(fleet):
+    response = Client(schema).execute(FLEET_QUERY)
+    deduplicated_response = Client(schema, deduplicate=True).execute(FLEET_QUERY)
+
+    assert deduplicated_response == {"data": deflate(response["data"])}
+    assert payload_size(deduplicated_response) < payload_size(response)
+
+
+def test_fleet_benchmark(fleet, benchmark):
+    client = Client(schema)
+
+    response = benchmark(client.execute, FLEET_QUERY)
+
+    benchmark.extra_info["payload_size"] = payload_size(response)
+    assert "errors" not in response
+
+
+def test_fleet_deflate_benchmark(fleet, benchmark):
+    client = Client(schema)
+
+    def execute_and_deflate():
+        return {"data": deflate(client.execute(FLEET_QUERY)["data"])}
+
+    response = benchmark(execute_and_deflate)
+
+    benchmark.extra_info["payload_size"] = payload_size(response)
+    assert "errors" not in response
+
+
+def test_fleet_deduplicate_benchmark(fleet, benchmark):
+    client = Client(schema, deduplicate=True)
+
+    response = benchmark(client.execute, FLEET_QUERY)
+
+    benchmark.extra_info["payload_size"] = payload_size(response)
+    assert "errors" not in response
@@ -6,6 +6,7 @@ from .relay import (
     ConnectionField,
     DefaultGlobalIDType,
     GlobalID,
+    KeysetSource,
     Node,
     PageInfo,
     SimpleGlobalIDType,
@@ -77,6 +78,7 @@ __all__ = [
     "Int",
     "Interface",
     "JSONString",
+    "KeysetSource",
     "List",
     "Mutation",
     "Node",
@@ -0,0 +1,18 @@
+from .compiled import CompiledQuery
+from .deferred import DeferredExecutionContext
+from .leaf_lists import LeafListExecutionContext
+from .streaming import (
+    StreamingExecutionContext,
+    stream_execution_result,
+    stream_execution_result_async,
+)
+
+
+__all__ = [
+    "CompiledQuery",
+    "DeferredExecutionContext",
+    "LeafListExecutionContext",
+    "StreamingExecutionContext",
+    "stream_execution_result",
+    "stream_execution_result_async",
+]
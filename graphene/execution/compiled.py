@@ -0,0 +1,224 @@
+from collections.abc import Mapping
+from inspect import isawaitable
+from graphql import ExecutionResult, GraphQLError, OperationType, Undefined, execute, execute_sync, is_leaf_type, located_error
+from graphql.execution.collect_fields import collect_fields
+from graphql.execution.execute import get_field_def
+from graphql.execution.values import get_argument_values
+from graphql.language import DirectiveNode, ListValueNode, ObjectValueNode, VariableNode, Visitor, visit
+from graphql.pyutils import inspect
+from ..types.schema import normalize_execute_kwargs
+from ..utils.run_in_executor import execution_mode
+from .leaf_lists import LeafListExecutionContext
+
+class CompiledExecutionContext(LeafListExecutionContext):
+    """
+    Execution context reusing the execution plan of a :class:`CompiledQuery`.
+
+    Collected fields, field definitions, resolvers, constant arguments and leaf
+    serializers are looked up once per compiled query instead of once per execution.
+    """
+    plan = None
+
+    def execute_operation(self, operation, root_value):
+        plan = self.plan
+        self.directive_values = tuple((self.variable_values.get(name) for name in plan.directive_variables))
+        root_type = plan.get_root_type(operation)
+        if root_type is None:
+            raise GraphQLError(f'Schema is not configured to execute {operation.operation.value} operation.', operation)
+        key = (self.directive_values, root_type, id(operation))
+        root_fields = plan.collected_fields.get(key)
+        if root_fields is None:
+            root_fields = collect_fields(self.schema, self.fragments, self.variable_values, root_type, operation.selection_set)
+            plan.collected_fields[key] = root_fields
+        execute_fields = self.execute_fields_serially if operation.operation == OperationType.MUTATION else self.execute_fields
+        return execute_fields(root_type, root_value, None, root_fields)
+
+    def collect_subfields(self, return_type, field_nodes):
+        key = (self.directive_values, return_type, *map(id, field_nodes))
+        sub_field_nodes = self.plan.collected_fields.get(key)
+        if sub_field_nodes is None:
+            sub_field_nodes = super().collect_subfields(return_type, field_nodes)
+            self.plan.collected_fields[key] = sub_field_nodes
+        return sub_field_nodes
+
+    def execute_field(self, parent_type, source, field_nodes, path):
+        key = (parent_type, id(field_nodes[0]))
+        field_plan = self.plan.field_plans.get(key)
+        if field_plan is None:
+            field_plan = self.plan.field_plans[key] = self.plan.get_field_plan(self.schema, parent_type, field_nodes[0])
+        field_def, resolve_fn, args = field_plan
+        if field_def is None:
+            return Undefined
+        return_type = field_def.type
+        resolve_fn = resolve_fn or self.field_resolver
+        if self.middleware_manager:
+            resolve_fn = self.middleware_manager.get_field_resolver(resolve_fn)
+        info = self.build_resolve_info(field_def, field_nodes, parent_type, path)
+        try:
+            if args is None:
+                args = get_argument_values(field_def, field_nodes[0], self.variable_values)
+            result = resolve_fn(source, info, **args)
+            if self.is_awaitable(result):
+
+                async def await_result():
+                    try:
+                        completed = self.complete_value(return_type, field_nodes, info, path, await result)
+                        if self.is_awaitable(completed):
+                            return await completed
+                        return completed
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type, path)
+                        return None
+                return await_result()
+            completed = self.complete_value(return_type, field_nodes, info, path, result)
+            if self.is_awaitable(completed):
+
+                async def await_completed():
+                    try:
+                        return await completed
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type, path)
+                        return None
+                return await_completed()
+            return completed
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, return_type, path)
+            return None
+
+    def complete_value(self, return_type, field_nodes, info, path, result):
+        serialize = self.plan.leaf_serializers.get(return_type, Undefined)
+        if serialize is Undefined:
+            serialize = self.plan.leaf_serializers[return_type] = return_type.serialize if is_leaf_type(return_type) else None
+        if serialize is None or isinstance(result, Exception):
+            return super().complete_value(return_type, field_nodes, info, path, result)
+        if result is None or result is Undefined:
+            return None
+        serialized_result = serialize(result)
+        if serialized_result is Undefined or serialized_result is None:
+            raise TypeError(f'Expected `{inspect(return_type)}.serialize({inspect(result)})` to return non-nullable value, returned: {inspect(serialized_result)}')
+        return serialized_result
+
+class CompiledQuery:
+    """
+    A GraphQL request compiled against a schema into a reusable execution plan.
+
+    The document is parsed and validated once. The fields collected for every
+    selection set, the field definitions and resolvers, the coerced arguments of
+    fields not depending on variables and the leaf serializers are then computed
+    on first execution and shared by every later execution of the query.
+
+    Compiled queries are created with :meth:`graphene.Schema.compile`.
+
+    .. code:: python
+
+        compiled = schema.compile('query getUser($id: ID) { user(id: $id) { name } }')
+        result = compiled.execute(variables={'id': 12})
+
+    Args:
+        schema (graphene.Schema): Schema the query is compiled against.
+        document (DocumentNode, optional): Parsed query. ``None`` if it could not be parsed.
+        errors (List[GraphQLError], optional): Syntax or validation errors of the query.
+        operation_name (str, optional): Operation to execute if the document contains several.
+    """
+
+    def __init__(self, schema, document, errors=None, operation_name=None):
+        self.schema = schema
+        self.document = document
+        self.errors = errors or []
+        self.operation_name = operation_name
+        self.directive_variables = get_directive_variables(document) if document else ()
+        self.collected_fields = {}
+        self.field_plans = {}
+        self.leaf_serializers = {}
+        self.execution_context_class = type('CompiledExecutionContext', (CompiledExecutionContext,), {'plan': self})
+
+    def get_root_type(self, operation):
+        graphql_schema = self.schema.graphql_schema
+        if operation.operation == OperationType.QUERY:
+            return graphql_schema.query_type
+        if operation.operation == OperationType.MUTATION:
+            return graphql_schema.mutation_type
+        return graphql_schema.subscription_type
+
+    @staticmethod
+    def get_field_plan(schema, parent_type, field_node):
+        """
+        Returns the field definition, resolver and (if they do not depend on any
+        variable) coerced arguments for a field node.
+        """
+        field_def = get_field_def(schema, parent_type, field_node)
+        if not field_def:
+            return (None, None, None)
+        args = None
+        if not any((has_variables(argument.value) for argument in field_node.arguments or ())):
+            args = get_argument_values(field_def, field_node)
+            if any((isinstance(value, (Mapping, list)) for value in args.values())):
+                args = None
+        return (field_def, field_def.resolve, args)
+
+    def execute(self, *args, **kwargs):
+        """
+        Executes the compiled query synchronously.
+
+        Accepts the same arguments as :meth:`graphene.Schema.execute`, except the
+        request string, operation name and execution context class.
+        """
+        check_execute_kwargs(kwargs)
+        if self.errors:
+            return ExecutionResult(data=None, errors=self.errors)
+        kwargs['execution_context_class'] = self.execution_context_class
+        with execution_mode(is_async=False):
+            return execute_sync(self.schema.graphql_schema, self.document, *args, operation_name=self.operation_name, **normalize_execute_kwargs(kwargs))
+
+    async def execute_async(self, *args, **kwargs):
+        """
+        Executes the compiled query asynchronously.
+        """
+        check_execute_kwargs(kwargs)
+        if self.errors:
+            return ExecutionResult(data=None, errors=self.errors)
+        kwargs['execution_context_class'] = self.execution_context_class
+        with execution_mode(is_async=True):
+            result = execute(self.schema.graphql_schema, self.document, *args, operation_name=self.operation_name, **normalize_execute_kwargs(kwargs))
+            if isawaitable(result):
+                return await result
+            return result
+
+def check_execute_kwargs(kwargs):
+    if 'execution_context_class' in kwargs:
+        raise TypeError('A compiled query is executed with its own execution context class, execution_context_class cannot be given.')
+
+def has_variables(value_node):
+    """
+    Check if an argument value node references any variable
+    """
+    if isinstance(value_node, VariableNode):
+        return True
+    if isinstance(value_node, ListValueNode):
+        return any((has_variables(value) for value in value_node.values))
+    if isinstance(value_node, ObjectValueNode):
+        return any((has_variables(field.value) for field in value_node.fields))
+    return False
+
+class DirectiveVariablesVisitor(Visitor):
+
+    def __init__(self):
+        super().__init__()
+        self.variables = []
+
+    def enter_directive(self, node: DirectiveNode, *_args):
+        for argument in node.arguments or ():
+            if isinstance(argument.value, VariableNode):
+                self.variables.append(argument.value.name.value)
+
+def get_directive_variables(document):
+    """
+    Returns the names of the variables used as directive arguments, as they
+    change which fields get collected.
+    """
+    visitor = DirectiveVariablesVisitor()
+    visit(document, visitor)
+    return tuple(sorted(set(visitor.variables)))
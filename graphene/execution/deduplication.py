@@ -0,0 +1,114 @@
+from functools import partial
+from weakref import WeakKeyDictionary
+from graphql import ExecutionContext
+from ..utils.sync_dataloader import SyncFuture
+
+class DeduplicatingExecutionContext(ExecutionContext):
+    """
+    Execution context deflating repeated objects while completing the result,
+    like :func:`graphene.utils.deduplicator.deflate` does on a complete result.
+
+    An object selecting both `__typename` and `id` is only completed the first
+    time it appears at a given path (ignoring list indices). The next
+    occurrences are resolved as `{"__typename": ..., "id": ...}`, without
+    executing their other fields. The first occurrence is the first one in
+    the result, whatever the order in which the ids are resolved.
+
+    Used by ``Schema.execute(..., deduplicate=True)``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.completed_objects = {}
+
+    def execute_fields(self, parent_type, source_value, path, fields):
+        if path is None or '__typename' not in fields or 'id' not in fields:
+            return super().execute_fields(parent_type, source_value, path, fields)
+        identity = super().execute_fields(parent_type, source_value, path, {'__typename': fields['__typename'], 'id': fields['id']})
+        return self.then(identity, partial(self.execute_other_fields, parent_type, source_value, path, fields))
+
+    def execute_other_fields(self, parent_type, source_value, path, fields, identity):
+        completed_object = self.claim(path, identity)
+        if completed_object is None:
+            return identity
+        other_fields = {response_name: field_nodes for response_name, field_nodes in fields.items() if response_name not in identity}
+        results = super().execute_fields(parent_type, source_value, path, other_fields)
+        return self.then(results, partial(self.merge_results, fields, completed_object))
+
+    def merge_results(self, fields, completed_object, results):
+        identity = completed_object.identity
+        if completed_object.key is not None and self.completed_objects.get(completed_object.key) is not completed_object:
+            return identity
+        completed_object.result = {response_name: identity[response_name] if response_name in identity else results[response_name] for response_name in fields if response_name in identity or response_name in results}
+        return completed_object.result
+
+    def claim(self, path, identity):
+        """
+        Returns the :class:`CompletedObject` to complete for the object, or None
+        if an object with the same type and id comes before it at the same path.
+
+        Objects may be identified in any order (when their id is awaited), so an
+        object coming before the one already claimed takes its place, the result
+        of the latter being replaced by its identity.
+        """
+        if identity.get('id') is None:
+            return CompletedObject(None, None, identity)
+        keys = path.as_list()
+        key = (tuple((key for key in keys if isinstance(key, str))), str(identity['__typename']), str(identity['id']))
+        position = tuple((key for key in keys if isinstance(key, int)))
+        claimed_object = self.completed_objects.get(key)
+        if claimed_object is not None:
+            if claimed_object.position <= position:
+                return None
+            if claimed_object.result is not None:
+                claimed_object.result.clear()
+                claimed_object.result.update(claimed_object.identity)
+        completed_object = self.completed_objects[key] = CompletedObject(key, position, identity)
+        return completed_object
+
+    def then(self, value, on_resolve):
+        """
+        Calls `on_resolve` with the value once it is resolved, if it is
+        awaitable or a :class:`SyncFuture`.
+        """
+        if isinstance(value, SyncFuture):
+            return value.then(on_resolve)
+        if self.is_awaitable(value):
+
+            async def await_value():
+                result = on_resolve(await value)
+                if self.is_awaitable(result):
+                    return await result
+                return result
+            return await_value()
+        return on_resolve(value)
+
+class CompletedObject:
+    """
+    Object claimed by a :class:`DeduplicatingExecutionContext`: its key, its
+    position (the list indices of its path), its identity (`__typename` and
+    `id`) and its result once completed.
+    """
+    __slots__ = ('key', 'position', 'identity', 'result')
+
+    def __init__(self, key, position, identity):
+        self.key = key
+        self.position = position
+        self.identity = identity
+        self.result = None
+deduplicating_execution_context_classes = WeakKeyDictionary()
+
+def get_deduplicating_execution_context_class(execution_context_class=None):
+    """
+    Returns an execution context class deduplicating the result of the given
+    execution context class.
+    """
+    if execution_context_class is None or execution_context_class is ExecutionContext:
+        return DeduplicatingExecutionContext
+    if issubclass(execution_context_class, DeduplicatingExecutionContext):
+        return execution_context_class
+    deduplicating_class = deduplicating_execution_context_classes.get(execution_context_class)
+    if deduplicating_class is None:
+        deduplicating_class = type(f'Deduplicating{execution_context_class.__name__}', (DeduplicatingExecutionContext, execution_context_class), {})
+        deduplicating_execution_context_classes[execution_context_class] = deduplicating_class
+    return deduplicating_class
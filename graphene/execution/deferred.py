@@ -0,0 +1,93 @@
+from functools import partial
+from graphql import GraphQLError, Undefined, located_error
+from graphql.execution.execute import get_field_def
+from graphql.pyutils import Path
+from ..utils.sync_dataloader import SyncFuture, discard_pending_loads, dispatch_pending_loaders, swap_pending_loaders
+from .leaf_lists import LeafListExecutionContext
+
+class DeferredExecutionContext(LeafListExecutionContext):
+    """
+    Execution context for synchronous execution batching the loads of a
+    :class:`graphene.utils.sync_dataloader.SyncDataLoader` level by level.
+
+    Resolvers can return a :class:`SyncFuture` (or a list of them). The
+    completion of these fields is deferred: the rest of the query is executed
+    first, then the keys queued by every loader are dispatched as one batch
+    per loader, completing the deferred fields (which may queue the loads of
+    the next level), until the whole result is resolved. The loads still
+    pending when the execution ends (after an error) are discarded, so they
+    are not dispatched by a later execution in the same thread.
+
+    .. code:: python
+
+        schema.execute(query, execution_context_class=DeferredExecutionContext)
+    """
+
+    def execute_operation(self, operation, root_value):
+        previous_loaders = swap_pending_loaders([])
+        try:
+            return self.wait(super().execute_operation(operation, root_value))
+        finally:
+            discard_pending_loads(swap_pending_loaders(previous_loaders))
+
+    def execute_fields_serially(self, parent_type, source_value, path, fields):
+        results = {}
+        for response_name, field_nodes in fields.items():
+            field_path = Path(path, response_name, parent_type.name)
+            result = self.execute_field(parent_type, source_value, field_nodes, field_path)
+            if result is not Undefined:
+                results[response_name] = self.wait(result)
+        return results
+
+    def execute_fields(self, parent_type, source_value, path, fields):
+        results = super().execute_fields(parent_type, source_value, path, fields)
+        if self.is_awaitable(results):
+            return results
+        deferred_fields = [response_name for response_name, result in results.items() if isinstance(result, SyncFuture)]
+        if not deferred_fields:
+            return results
+
+        def set_results(values):
+            results.update(zip(deferred_fields, values))
+            return results
+        return SyncFuture.all((results[response_name] for response_name in deferred_fields)).then(set_results)
+
+    def execute_field(self, parent_type, source, field_nodes, path):
+        completed = super().execute_field(parent_type, source, field_nodes, path)
+        if isinstance(completed, SyncFuture):
+            return_type = get_field_def(self.schema, parent_type, field_nodes[0]).type
+            return completed.catch(partial(self.handle_deferred_error, return_type, field_nodes, path))
+        return completed
+
+    def complete_value(self, return_type, field_nodes, info, path, result):
+        if isinstance(result, SyncFuture):
+            return result.then(partial(self.complete_value, return_type, field_nodes, info, path))
+        return super().complete_value(return_type, field_nodes, info, path, result)
+
+    def complete_list_value(self, return_type, field_nodes, info, path, result):
+        completed_results = super().complete_list_value(return_type, field_nodes, info, path, result)
+        if self.is_awaitable(completed_results):
+            return completed_results
+        deferred_indices = [index for index, completed in enumerate(completed_results) if isinstance(completed, SyncFuture)]
+        if not deferred_indices:
+            return completed_results
+        item_type = return_type.of_type
+        for index in deferred_indices:
+            completed_results[index] = completed_results[index].catch(partial(self.handle_deferred_error, item_type, field_nodes, path.add_key(index, None)))
+        return SyncFuture.all(completed_results)
+
+    def handle_deferred_error(self, return_type, field_nodes, path, raw_error):
+        error = located_error(raw_error, field_nodes, path.as_list())
+        return self.handle_field_error(error, return_type, path)
+
+    @staticmethod
+    def wait(result):
+        """
+        Dispatches the pending loads until the deferred result is resolved.
+        """
+        if not isinstance(result, SyncFuture):
+            return result
+        while not result.done():
+            if not dispatch_pending_loaders():
+                raise GraphQLError('Deferred result was not resolved, no load is pending.')
+        return result.result()
@@ -0,0 +1,93 @@
+from math import isfinite
+from graphql import ExecutionContext, GraphQLBoolean, GraphQLFloat, GraphQLID, GraphQLInt, GraphQLNonNull, GraphQLString
+from graphql.pyutils import is_iterable
+from graphql.type.scalars import GRAPHQL_MAX_INT, GRAPHQL_MIN_INT
+
+class LeafListExecutionContext(ExecutionContext):
+    """
+    Execution context completing the lists of `Int`, `Float`, `String`,
+    `Boolean` and `ID` values at once, instead of serializing every item
+    through `complete_value`.
+
+    The values of a list (or tuple, range, memoryview, or array-like object
+    with a `tolist` method, like `array.array` or NumPy arrays) are checked for
+    their types and bounds in bulk. Lists which cannot be serialized as a whole
+    (with null items, values of other types or invalid values) are completed
+    item by item, with the same results and errors. The list returned by
+    `tolist` is used as the completed list, without copying it.
+
+    Used by default by ``Schema.execute``.
+    """
+
+    def complete_list_value(self, return_type, field_nodes, info, path, result):
+        item_type = return_type.of_type
+        if isinstance(item_type, GraphQLNonNull):
+            item_type = item_type.of_type
+        serialize_list = leaf_list_serializers.get(item_type)
+        if serialize_list is not None or isinstance(result, memoryview):
+            values = get_list_values(result)
+            if values is not None:
+                if serialize_list is not None:
+                    serialized = serialize_list(values, range_types if values.__class__ is range else set(map(type, values)))
+                    if serialized is not None:
+                        return list(serialized) if serialized is result else serialized
+                if isinstance(result, memoryview):
+                    result = values
+        return super().complete_list_value(return_type, field_nodes, info, path, result)
+
+def get_list_values(result):
+    """
+    Gets the values of a list result which can be read several times, as a
+    sequence, or None.
+    """
+    if isinstance(result, (list, tuple, range)):
+        return result
+    tolist = getattr(result, 'tolist', None)
+    if tolist is not None and (isinstance(result, memoryview) or is_iterable(result)):
+        values = tolist()
+        if isinstance(values, list):
+            return values
+    return None
+
+def as_list(values):
+    return values if values.__class__ is list else list(values)
+
+def serialize_int_list(values, types):
+    if values.__class__ is range:
+        if not values or (GRAPHQL_MIN_INT <= values[0] <= GRAPHQL_MAX_INT and GRAPHQL_MIN_INT <= values[-1] <= GRAPHQL_MAX_INT):
+            return list(values)
+        return None
+    if not types:
+        return []
+    if types == {int} and GRAPHQL_MIN_INT <= min(values) and max(values) <= GRAPHQL_MAX_INT:
+        return as_list(values)
+    return None
+
+def serialize_float_list(values, types):
+    if not types:
+        return []
+    if not types <= {int, float}:
+        return None
+    try:
+        floats = as_list(values) if types == {float} else list(map(float, values))
+    except OverflowError:
+        return None
+    if not isfinite(sum(floats)):
+        return None
+    return floats
+
+def serialize_string_list(values, types):
+    if not types:
+        return []
+    if types == {str}:
+        return as_list(values)
+    if types == {int}:
+        return list(map(str, values))
+    return None
+
+def serialize_boolean_list(values, types):
+    if not types or types == {bool}:
+        return as_list(values)
+    return None
+range_types = frozenset((int,))
+leaf_list_serializers = {GraphQLInt: serialize_int_list, GraphQLFloat: serialize_float_list, GraphQLString: serialize_string_list, GraphQLBoolean: serialize_boolean_list, GraphQLID: serialize_string_list}
@@ -0,0 +1,354 @@
+from collections.abc import AsyncIterable, Iterator, Mapping
+from itertools import islice
+from json import JSONEncoder
+from json.encoder import encode_basestring
+from graphql import ExecutionResult, GraphQLError, get_nullable_type, is_non_null_type, located_error
+from .leaf_lists import LeafListExecutionContext
+DEFAULT_CHUNK_SIZE = 64 * 1024
+INFINITY = float('inf')
+END = object()
+json_encode = JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+class StreamingExecutionContext(LeafListExecutionContext):
+    """
+    Execution context completing the list fields resolved to iterators (like
+    generators) or asynchronous iterables lazily, while the result is encoded
+    by :func:`stream_execution_result` (or :func:`stream_execution_result_async`
+    for asynchronous iterables), so that their items are never all in memory.
+
+    The errors of the items are only known once the result is encoded, so the
+    streamed response lists them after the data. An error in a non-null item
+    ends its list.
+
+    .. code:: python
+
+        result = schema.execute(query, execution_context_class=StreamingExecutionContext)
+        for chunk in stream_execution_result(result):
+            response.write(chunk)
+    """
+
+    def complete_list_value(self, return_type, field_nodes, info, path, result):
+        if isinstance(result, (Iterator, AsyncIterable)):
+            return StreamedList(self, return_type.of_type, field_nodes, info, path, result)
+        return super().complete_list_value(return_type, field_nodes, info, path, result)
+
+    @staticmethod
+    def build_response(data, errors):
+        return StreamedExecutionResult(data, errors)
+
+class StreamedExecutionResult(ExecutionResult):
+    """
+    Result of an execution with :class:`StreamingExecutionContext`, whose data
+    holds :class:`StreamedList` values. `collected_errors` is the list of
+    errors collected until now, completed while the data is encoded.
+    """
+    __slots__ = ('collected_errors',)
+
+    def __init__(self, data=None, errors=None, extensions=None):
+        super().__init__(data, errors or None, extensions)
+        self.collected_errors = errors
+
+class StreamedList:
+    """
+    Value of a list field completed by :class:`StreamingExecutionContext`,
+    completing its items as they are iterated.
+    """
+    __slots__ = ('context', 'item_type', 'field_nodes', 'info', 'path', 'items')
+
+    def __init__(self, context, item_type, field_nodes, info, path, items):
+        self.context = context
+        self.item_type = item_type
+        self.field_nodes = field_nodes
+        self.info = info
+        self.path = path
+        self.items = items
+
+    def __iter__(self):
+        if not isinstance(self.items, Iterator):
+            raise TypeError(f"List '{self.info.parent_type.name}.{self.info.field_name}' resolved to an asynchronous iterable must be streamed with stream_execution_result_async.")
+        complete_value = self.context.complete_value
+        is_awaitable = self.context.is_awaitable
+        for index, item in enumerate(self.items):
+            item_path = self.path.add_key(index, None)
+            try:
+                completed = complete_value(self.item_type, self.field_nodes, self.info, item_path, item)
+                if is_awaitable(completed):
+                    if hasattr(completed, 'close'):
+                        completed.close()
+                    raise TypeError(f"List '{self.info.parent_type.name}.{self.info.field_name}' completed to awaitable items must be streamed with stream_execution_result_async.")
+            except Exception as raw_error:
+                if self.handle_error(raw_error, item_path):
+                    return
+                completed = None
+            yield completed
+
+    async def __aiter__(self):
+        complete_value = self.context.complete_value
+        is_awaitable = self.context.is_awaitable
+        index = 0
+        async for item in self.iter_items():
+            item_path = self.path.add_key(index, None)
+            index += 1
+            try:
+                if is_awaitable(item):
+                    item = await item
+                completed = complete_value(self.item_type, self.field_nodes, self.info, item_path, item)
+                if is_awaitable(completed):
+                    completed = await completed
+            except Exception as raw_error:
+                if self.handle_error(raw_error, item_path):
+                    return
+                completed = None
+            yield completed
+
+    async def iter_items(self):
+        if isinstance(self.items, Iterator):
+            for item in self.items:
+                yield item
+        else:
+            async for item in self.items:
+                yield item
+
+    def handle_error(self, raw_error, item_path):
+        """
+        Records the error of an item, returning whether it ends the list.
+        """
+        error = located_error(raw_error, self.field_nodes, item_path.as_list())
+        self.context.handle_field_error(error, get_nullable_type(self.item_type), item_path)
+        return is_non_null_type(self.item_type)
+
+class StreamedResponse(Mapping):
+    """
+    Response of a :class:`StreamedExecutionResult`, listing its errors after
+    its data.
+    """
+
+    def __init__(self, execution_result, format_error):
+        self.execution_result = execution_result
+        self.format_error = format_error
+
+    def __getitem__(self, key):
+        if key == 'data':
+            return self.execution_result.data
+        if key == 'errors' and self.execution_result.collected_errors:
+            return [self.format_error(error) for error in self.execution_result.collected_errors]
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield 'data'
+        if self.execution_result.collected_errors:
+            yield 'errors'
+
+    def __len__(self):
+        return 2 if self.execution_result.collected_errors else 1
+
+def stream_execution_result(execution_result, format_error=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Encodes an execution result as JSON, yielding UTF-8 chunks of about
+    `chunk_size` characters.
+
+    The response has the same shape as `graphene.test.format_execution_result`,
+    but is written while walking the result data, so large responses can be
+    sent incrementally without building the whole JSON document in memory.
+
+    .. code:: python
+
+        result = schema.execute(query)
+        for chunk in stream_execution_result(result):
+            response.write(chunk)
+
+    Args:
+        execution_result (ExecutionResult): Result to encode.
+        format_error (Callable, optional): Function formatting a GraphQL error
+            into a JSON serializable value. Defaults to `GraphQLError.formatted`.
+        chunk_size (int, optional): Number of encoded characters above which
+            a chunk is yielded.
+    """
+    return iter_json_chunks(get_response(execution_result, format_error), chunk_size)
+
+def stream_execution_result_async(execution_result, format_error=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Same as :func:`stream_execution_result`, as an asynchronous iterator, which
+    also consumes the lists resolved to asynchronous iterables by
+    :class:`StreamingExecutionContext`.
+
+    .. code:: python
+
+        result = await schema.execute_async(query, execution_context_class=StreamingExecutionContext)
+        async for chunk in stream_execution_result_async(result):
+            await response.write(chunk)
+    """
+    return aiter_json_chunks(get_response(execution_result, format_error), chunk_size)
+
+def get_response(execution_result, format_error=None):
+    format_error = format_error or default_format_error
+    if isinstance(execution_result, StreamedExecutionResult):
+        return StreamedResponse(execution_result, format_error)
+    response = {}
+    if execution_result.errors:
+        response['errors'] = [format_error(error) for error in execution_result.errors]
+    response['data'] = execution_result.data
+    return response
+
+def default_format_error(error):
+    if isinstance(error, GraphQLError):
+        return error.formatted
+    return {'message': str(error)}
+
+def iter_json_chunks(value, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Encodes a value made of mappings, lists, tuples and JSON scalars as
+    compact JSON, yielding UTF-8 chunks of about `chunk_size` characters.
+
+    Mappings are walked field by field. Lists are encoded by slices with the
+    `json` encoder, sized from the previous slices to hold about `chunk_size`
+    characters, so the memory used is bounded by the chunk size (or the size
+    of the largest list item). Other iterables (like the :class:`StreamedList`
+    values of a streamed execution result) are encoded item by item as they are
+    consumed.
+    """
+    return walk_json_chunks(value, chunk_size, False)
+
+async def aiter_json_chunks(value, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Same as :func:`iter_json_chunks`, as an asynchronous iterator, which also
+    consumes asynchronous iterables.
+    """
+    chunks = walk_json_chunks(value, chunk_size, True)
+    sent = None
+    while True:
+        try:
+            chunk = chunks.send(sent)
+        except StopIteration:
+            return
+        if chunk.__class__ is bytes:
+            sent = None
+            yield chunk
+        else:
+            try:
+                sent = await chunk.__anext__()
+            except StopAsyncIteration:
+                sent = END
+
+def walk_json_chunks(value, chunk_size, is_async):
+    """
+    Yields the chunks of :func:`iter_json_chunks`. If `is_async`, the iterables
+    with an `__aiter__` method are consumed by yielding their asynchronous
+    iterator, to be sent back its next item (or END).
+    """
+    parts = []
+    append = parts.append
+    size = 0
+    stack = [[iter((value,)), False, '', '', False]]
+    while stack:
+        frame = stack[-1]
+        iterator, is_mapping, is_async_frame = (frame[0], frame[1], frame[4])
+        if is_async_frame:
+            item = (yield iterator)
+            if item is END:
+                append(frame[3])
+                stack.pop()
+                continue
+            items = (item,)
+        else:
+            items = iterator
+        for item in items:
+            if size >= chunk_size:
+                yield ''.join(parts).encode('utf-8')
+                parts.clear()
+                size = 0
+            append(frame[2])
+            frame[2] = ','
+            if is_mapping:
+                key, item = item
+                key = encode_basestring(key if isinstance(key, str) else encode_key(key))
+                append(key)
+                append(':')
+                size += len(key)
+            if isinstance(item, Mapping):
+                append('{')
+                stack.append([iter(item.items()), True, '', '}', False])
+                size += 1
+                break
+            if isinstance(item, (list, tuple)):
+                append('[')
+                start, count, slice_size = (0, len(item), 1)
+                while start < count:
+                    try:
+                        encoded = json_encode(item[start:start + slice_size])[1:-1]
+                    except TypeError:
+                        stack.append([islice(item, start, None), False, ',' if start else '', ']', False])
+                        break
+                    if start:
+                        append(',')
+                    append(encoded)
+                    size += len(encoded) + 1
+                    start += slice_size
+                    if size >= chunk_size:
+                        yield ''.join(parts).encode('utf-8')
+                        parts.clear()
+                        size = 0
+                    slice_size = max(1, chunk_size * slice_size // (len(encoded) + 1))
+                else:
+                    append(']')
+                    size += 1
+                    continue
+                break
+            if item is not None and (not isinstance(item, (str, int, float))):
+                if is_async and hasattr(item, '__aiter__'):
+                    append('[')
+                    stack.append([item.__aiter__(), False, '', ']', True])
+                    size += 1
+                    break
+                if hasattr(item, '__iter__'):
+                    append('[')
+                    stack.append([iter(item), False, '', ']', False])
+                    size += 1
+                    break
+            encoded = encode_scalar(item)
+            append(encoded)
+            size += len(encoded) + 1
+        else:
+            if not is_async_frame:
+                append(frame[3])
+                stack.pop()
+    if parts:
+        yield ''.join(parts).encode('utf-8')
+
+def encode_key(key):
+    if key is True:
+        return 'true'
+    if key is False:
+        return 'false'
+    if key is None:
+        return 'null'
+    if isinstance(key, float):
+        return encode_float(key)
+    return str(key)
+
+def encode_float(value):
+    if value != value:
+        return 'NaN'
+    if value == INFINITY:
+        return 'Infinity'
+    if value == -INFINITY:
+        return '-Infinity'
+    return float.__repr__(value)
+
+def encode_scalar(value):
+    """
+    Encodes a JSON scalar (string, number, boolean or null).
+    """
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return encode_float(value)
+    return json_encode(value)
@@ -0,0 +1,207 @@
+from graphql import ExecutionContext
+from pytest import mark, raises
+
+from ...types import Field, Int, List, Mutation, NonNull, ObjectType, Schema, String
+from ...utils.document_cache import DocumentCache
+from ..compiled import CompiledQuery
+
+
+class Pet(ObjectType):
+    name = String()
+    age = Int()
+
+
+PETS = [Pet(name="Rex", age=3), Pet(name="Tom", age=5)]
+
+
+class Query(ObjectType):
+    pets = List(Pet, first=Int())
+    pet = Field(Pet, name=String(required=True))
+    hello = String(name=String(default_value="World"))
+    required = NonNull(String)
+    async_hello = String()
+
+    def resolve_pets(root, info, first=None):
+        return PETS[:first]
+
+    def resolve_pet(root, info, name):
+        return next((pet for pet in PETS if pet.name == name), None)
+
+    def resolve_hello(root, info, name):
+        return f"Hello {name}"
+
+    def resolve_required(root, info):
+        return None
+
+    async def resolve_async_hello(root, info):
+        return "Hello async"
+
+
+class CreatePet(Mutation):
+    class Arguments:
+        name = String()
+
+    Output = Pet
+
+    def mutate(root, info, name):
+        return Pet(name=name, age=0)
+
+
+class MyMutation(ObjectType):
+    create_pet = CreatePet.Field()
+
+
+schema = Schema(query=Query, mutation=MyMutation)
+
+
+def test_compile_returns_compiled_query():
+    compiled = schema.compile("{ hello }")
+    assert isinstance(compiled, CompiledQuery)
+    assert compiled.document is not None
+    assert compiled.errors == []
+
+
+def test_compiled_query_executes_repeatedly():
+    compiled = schema.compile("{ pets { name age } hello }")
+    for _ in range(3):
+        result = compiled.execute()
+        assert not result.errors
+        assert result.data == {
+            "pets": [{"name": "Rex", "age": 3}, {"name": "Tom", "age": 5}],
+            "hello": "Hello World",
+        }
+
+
+@mark.asyncio
+async def test_compiled_query_rejects_execution_context_class():
+    compiled = schema.compile("{ hello }")
+
+    with raises(TypeError, match="execution_context_class cannot be given"):
+        compiled.execute(execution_context_class=ExecutionContext)
+    with raises(TypeError, match="execution_context_class cannot be given"):
+        await compiled.execute_async(execution_context_class=ExecutionContext)
+
+
+def test_compiled_query_reuses_plan():
+    compiled = schema.compile('{ pets { name } pet(name: "Tom") { age } }')
+    compiled.execute()
+    collected_fields = dict(compiled.collected_fields)
+    field_plans = dict(compiled.field_plans)
+    assert collected_fields
+    assert field_plans
+
+    result = compiled.execute()
+    assert result.data == {"pets": [{"name": "Rex"}, {"name": "Tom"}], "pet": {"age": 5}}
+    assert compiled.collected_fields == collected_fields
+    assert compiled.field_plans == field_plans
+
+
+def test_compiled_query_constant_arguments_are_precomputed():
+    compiled = schema.compile('query ($n: String!) { a: pet(name: "Rex") { name } b: pet(name: $n) { name } }')
+    compiled.execute(variables={"n": "Tom"})
+    args = sorted(
+        (str(args) for _, _, args in compiled.field_plans.values() if args is not None)
+    )
+    assert "{'name': 'Rex'}" in args
+    assert "{'name': 'Tom'}" not in args
+
+
+def test_compiled_query_with_variables():
+    compiled = schema.compile("query ($name: String!) { pet(name: $name) { age } }")
+    assert compiled.execute(variables={"name": "Rex"}).data == {"pet": {"age": 3}}
+    assert compiled.execute(variable_values={"name": "Tom"}).data == {"pet": {"age": 5}}
+
+
+def test_compiled_query_with_directive_variables():
+    compiled = schema.compile(
+        "query ($withAge: Boolean!) { pets(first: 1) { name age @include(if: $withAge) } }"
+    )
+    assert compiled.directive_variables == ("withAge",)
+    assert compiled.execute(variables={"withAge": True}).data == {
+        "pets": [{"name": "Rex", "age": 3}]
+    }
+    assert compiled.execute(variables={"withAge": False}).data == {
+        "pets": [{"name": "Rex"}]
+    }
+    assert compiled.execute(variables={"withAge": True}).data == {
+        "pets": [{"name": "Rex", "age": 3}]
+    }
+
+
+def test_compiled_query_with_context_and_root():
+    class Query(ObjectType):
+        context = String()
+        root = String()
+
+        def resolve_context(root, info):
+            return info.context["value"]
+
+        def resolve_root(root, info):
+            return root
+
+    compiled = Schema(query=Query).compile("{ context root }")
+    result = compiled.execute("my root", context={"value": "my context"})
+    assert result.data == {"context": "my context", "root": "my root"}
+
+
+def test_compiled_query_operation_name():
+    compiled = schema.compile(
+        "query First { hello } query Second { pets { name } }", operation_name="Second"
+    )
+    assert compiled.execute().data == {"pets": [{"name": "Rex"}, {"name": "Tom"}]}
+
+
+def test_compiled_mutation():
+    compiled = schema.compile('mutation { createPet(name: "Garfield") { name age } }')
+    result = compiled.execute()
+    assert not result.errors
+    assert result.data == {"createPet": {"name": "Garfield", "age": 0}}
+
+
+def test_compiled_query_validation_errors():
+    compiled = schema.compile("{ unknown }")
+    assert compiled.document is not None
+    result = compiled.execute()
+    assert result.data is None
+    assert result.errors[0].message == "Cannot query field 'unknown' on type 'Query'."
+
+    compiled = schema.compile("{ hello ")
+    assert compiled.document is None
+    assert compiled.execute().errors[0].message == "Syntax Error: Expected Name, found <EOF>."
+
+
+def test_compiled_query_field_errors():
+    result = schema.compile("{ hello required }").execute()
+    assert result.data is None
+    assert result.errors[0].message == "Cannot return null for non-nullable field Query.required."
+    assert result.errors[0].path == ["required"]
+
+
+def test_compiled_query_uses_document_cache():
+    cached_schema = Schema(query=Query, document_cache=DocumentCache())
+    cached_schema.compile("{ hello }")
+    cached_schema.execute("{ hello }")
+    assert cached_schema.document_cache.hits == 1
+
+
+def test_compiled_query_introspection():
+    result = schema.compile("{ __typename pets { __typename } }").execute()
+    assert result.data == {"__typename": "Query", "pets": [{"__typename": "Pet"}] * 2}
+
+
+def test_compiled_query_middleware():
+    def upper_middleware(next_, root, info, **args):
+        result = next_(root, info, **args)
+        return result.upper() if isinstance(result, str) else result
+
+    result = schema.compile("{ hello }").execute(middleware=[upper_middleware])
+    assert result.data == {"hello": "HELLO WORLD"}
+
+
+@mark.asyncio
+async def test_compiled_query_execute_async():
+    compiled = schema.compile("{ hello asyncHello }")
+    for _ in range(2):
+        result = await compiled.execute_async()
+        assert not result.errors
+        assert result.data == {"hello": "Hello World", "asyncHello": "Hello async"}
@@ -0,0 +1,253 @@
+from asyncio import sleep
+
+from pytest import mark
+
+from ...test import Client
+from ...types import ID, Field, List, NonNull, ObjectType, Schema, String
+from ...utils.deduplicator import deflate
+from ...utils.sync_dataloader import SyncDataLoader
+from ..deduplication import (
+    DeduplicatingExecutionContext,
+    get_deduplicating_execution_context_class,
+)
+from ..deferred import DeferredExecutionContext
+
+resolved_names = []
+
+
+class Movie(ObjectType):
+    id = ID(required=True)
+    name = String()
+
+    def resolve_name(root, info):
+        resolved_names.append(root["id"])
+        return root["name"]
+
+
+class Event(ObjectType):
+    id = ID()
+    movie = Field(Movie)
+    other_movie = Field(Movie)
+
+    def resolve_movie(root, info):
+        return root["movie"]
+
+    def resolve_other_movie(root, info):
+        return root["movie"]
+
+
+class SlowMovie(ObjectType):
+    id = ID(required=True)
+    name = String()
+
+    async def resolve_id(root, info):
+        await sleep(root["delay"])
+        return root["id"]
+
+
+class LoadedMovie(ObjectType):
+    id = ID(required=True)
+    name = String()
+
+    def resolve_id(root, info):
+        return info.context["ids"].load(root["id"])
+
+
+class Query(ObjectType):
+    events = List(NonNull(Event))
+    async_events = List(NonNull(Event))
+    slow_movies = List(SlowMovie)
+    loaded_movies = List(LoadedMovie)
+
+    def resolve_events(root, info):
+        return EVENTS
+
+    async def resolve_async_events(root, info):
+        return EVENTS
+
+    def resolve_slow_movies(root, info):
+        return [
+            {"id": "1", "name": "first", "delay": 0.02},
+            {"id": "1", "name": "second", "delay": 0},
+            {"id": "2", "name": "third", "delay": 0.01},
+            {"id": "2", "name": "fourth", "delay": 0.01},
+        ]
+
+    def resolve_loaded_movies(root, info):
+        return [MOVIE, {"id": "2", "name": "Excalibur"}, MOVIE]
+
+
+MOVIE = {"id": "1", "name": "King Arthur"}
+EVENTS = [
+    {"id": "1", "movie": MOVIE},
+    {"id": "2", "movie": MOVIE},
+    {"id": "2", "movie": MOVIE},
+    {"id": None, "movie": MOVIE},
+    {"id": None, "movie": MOVIE},
+]
+
+schema = Schema(query=Query)
+
+QUERY = """
+    {
+        events {
+            __typename
+            id
+            movie { __typename name id }
+            otherMovie { __typename id name }
+        }
+    }
+"""
+
+
+def test_deduplicates_objects_at_the_same_path():
+    resolved_names.clear()
+
+    result = schema.execute(QUERY, deduplicate=True)
+
+    assert not result.errors
+    movie = {"__typename": "Movie", "name": "King Arthur", "id": "1"}
+    movie_ref = {"__typename": "Movie", "id": "1"}
+    assert result.data == {
+        "events": [
+            {
+                "__typename": "Event",
+                "id": "1",
+                "movie": movie,
+                "otherMovie": {"__typename": "Movie", "id": "1", "name": "King Arthur"},
+            },
+            {
+                "__typename": "Event",
+                "id": "2",
+                "movie": movie_ref,
+                "otherMovie": movie_ref,
+            },
+            {"__typename": "Event", "id": "2"},
+            {
+                "__typename": "Event",
+                "id": None,
+                "movie": movie_ref,
+                "otherMovie": movie_ref,
+            },
+            {
+                "__typename": "Event",
+                "id": None,
+                "movie": movie_ref,
+                "otherMovie": movie_ref,
+            },
+        ]
+    }
+    # The fields of the duplicated objects are not resolved.
+    assert resolved_names == ["1", "1"]
+
+
+def test_matches_deflate():
+    result = schema.execute(QUERY)
+    deduplicated_result = schema.execute(QUERY, deduplicate=True)
+
+    # deflate also deduplicates objects with a null id
+    events = deflate(result.data)["events"]
+    events[4] = deduplicated_result.data["events"][4]
+    assert deduplicated_result.data == {"events": events}
+
+
+def test_does_not_deduplicate_by_default():
+    result = schema.execute(QUERY)
+
+    assert not result.errors
+    assert result.data["events"][2]["movie"]["name"] == "King Arthur"
+
+
+def test_does_not_deduplicate_objects_without_typename_or_id():
+    result = schema.execute("{ events { id movie { id name } } }", deduplicate=True)
+
+    assert not result.errors
+    assert all(event["movie"]["name"] for event in result.data["events"])
+
+
+@mark.asyncio
+async def test_deduplicates_async_execution():
+    result = await schema.execute_async(
+        QUERY.replace("events", "asyncEvents"), deduplicate=True
+    )
+
+    assert not result.errors
+    assert result.data["asyncEvents"][2] == {"__typename": "Event", "id": "2"}
+    assert result.data["asyncEvents"][1]["movie"] == {"__typename": "Movie", "id": "1"}
+
+
+@mark.asyncio
+async def test_deduplicates_in_result_order():
+    result = await schema.execute_async(
+        "{ slowMovies { __typename id name } }", deduplicate=True
+    )
+
+    assert not result.errors
+    assert result.data == {
+        "slowMovies": [
+            {"__typename": "SlowMovie", "id": "1", "name": "first"},
+            {"__typename": "SlowMovie", "id": "1"},
+            {"__typename": "SlowMovie", "id": "2", "name": "third"},
+            {"__typename": "SlowMovie", "id": "2"},
+        ]
+    }
+
+
+def test_deduplicates_deferred_execution():
+    load_calls = []
+
+    def load_ids(keys):
+        load_calls.append(keys)
+        return keys
+
+    result = schema.execute(
+        "{ loadedMovies { __typename id name } }",
+        context_value={"ids": SyncDataLoader(load_ids)},
+        execution_context_class=DeferredExecutionContext,
+        deduplicate=True,
+    )
+
+    assert not result.errors
+    assert result.data == {
+        "loadedMovies": [
+            {"__typename": "LoadedMovie", "id": "1", "name": "King Arthur"},
+            {"__typename": "LoadedMovie", "id": "2", "name": "Excalibur"},
+            {"__typename": "LoadedMovie", "id": "1"},
+        ]
+    }
+    assert load_calls == [["1", "2"]]
+
+
+def test_client_option():
+    client = Client(schema, deduplicate=True)
+
+    response = client.execute(QUERY)
+
+    assert response["data"]["events"][2] == {"__typename": "Event", "id": "2"}
+
+
+def test_compiled_query():
+    compiled_query = schema.compile(QUERY)
+
+    result = compiled_query.execute(deduplicate=True)
+
+    assert not result.errors
+    assert result.data == schema.execute(QUERY, deduplicate=True).data
+    assert compiled_query.execute().data == schema.execute(QUERY).data
+
+
+def test_execution_context_classes():
+    assert get_deduplicating_execution_context_class() is DeduplicatingExecutionContext
+    execution_context_class = get_deduplicating_execution_context_class(
+        DeferredExecutionContext
+    )
+    assert issubclass(execution_context_class, DeduplicatingExecutionContext)
+    assert issubclass(execution_context_class, DeferredExecutionContext)
+    assert (
+        get_deduplicating_execution_context_class(DeferredExecutionContext)
+        is execution_context_class
+    )
+    assert (
+        get_deduplicating_execution_context_class(execution_context_class)
+        is execution_context_class
+    )
@@ -0,0 +1,170 @@
+from ...types import Field, ID, List, NonNull, ObjectType, Schema, String
+from ...utils.sync_dataloader import SyncDataLoader, get_pending_loaders
+from ..deferred import DeferredExecutionContext
+
+USERS = {
+    "1": {"id": "1", "name": "Alice", "friends": ["2", "3"], "best_friend": "2"},
+    "2": {"id": "2", "name": "Bob", "friends": ["1"], "best_friend": "3"},
+    "3": {"id": "3", "name": "Carol", "friends": ["1", "2"], "best_friend": "1"},
+}
+
+
+class User(ObjectType):
+    id = ID()
+    name = String()
+    best_friend = Field(lambda: User)
+    friends = List(lambda: User)
+    required_friend = NonNull(lambda: User)
+
+    def resolve_best_friend(root, info):
+        return info.context["users"].load(root["best_friend"])
+
+    def resolve_friends(root, info):
+        return info.context["users"].load_many(root["friends"])
+
+    def resolve_required_friend(root, info):
+        return info.context["users"].load("404")
+
+
+class Query(ObjectType):
+    users = List(User, ids=List(ID))
+    user = Field(User, id=ID(required=True))
+    broken = String()
+
+    def resolve_users(root, info, ids):
+        return [info.context["users"].load(user_id) for user_id in ids]
+
+    def resolve_user(root, info, id):
+        return info.context["users"].load(id)
+
+    def resolve_broken(root, info):
+        info.context["users"].load("3")
+        raise Exception("Broken")
+
+
+schema = Schema(query=Query)
+
+
+def get_context():
+    load_calls = []
+
+    def load_users(keys):
+        load_calls.append(keys)
+        return [USERS.get(key, KeyError(key)) for key in keys]
+
+    return {"users": SyncDataLoader(load_users)}, load_calls
+
+
+def execute(query, context):
+    return schema.execute(
+        query, context_value=context, execution_context_class=DeferredExecutionContext
+    )
+
+
+def test_batches_loads_level_by_level():
+    context, load_calls = get_context()
+
+    result = execute(
+        """
+        {
+            users(ids: ["1", "2"]) {
+                name
+                bestFriend { name }
+                friends { name friends { name } }
+            }
+        }
+        """,
+        context,
+    )
+
+    assert not result.errors
+    assert result.data == {
+        "users": [
+            {
+                "name": "Alice",
+                "bestFriend": {"name": "Bob"},
+                "friends": [
+                    {"name": "Bob", "friends": [{"name": "Alice"}]},
+                    {"name": "Carol", "friends": [{"name": "Alice"}, {"name": "Bob"}]},
+                ],
+            },
+            {
+                "name": "Bob",
+                "bestFriend": {"name": "Carol"},
+                "friends": [
+                    {"name": "Alice", "friends": [{"name": "Bob"}, {"name": "Carol"}]}
+                ],
+            },
+        ]
+    }
+    assert load_calls == [["1", "2"], ["3"]]
+
+
+def test_errors_of_deferred_fields():
+    context, load_calls = get_context()
+
+    result = execute(
+        """
+        {
+            user(id: "1") { name }
+            missing: user(id: "404") { name }
+        }
+        """,
+        context,
+    )
+
+    assert result.data == {"user": {"name": "Alice"}, "missing": None}
+    assert len(result.errors) == 1
+    assert result.errors[0].path == ["missing"]
+    assert load_calls == [["1", "404"]]
+
+
+def test_errors_of_deferred_non_null_fields_propagate():
+    context, _ = get_context()
+
+    result = execute(
+        """
+        {
+            user(id: "1") { name requiredFriend { name } }
+        }
+        """,
+        context,
+    )
+
+    assert result.data == {"user": None}
+    assert len(result.errors) == 1
+    assert result.errors[0].path == ["user", "requiredFriend"]
+
+
+def test_executes_without_deferred_values():
+    result = schema.execute(
+        "{ __typename }", execution_context_class=DeferredExecutionContext
+    )
+
+    assert not result.errors
+    assert result.data == {"__typename": "Query"}
+
+
+def test_pending_loads_are_scoped_to_the_execution():
+    context, load_calls = get_context()
+    outer_loader = SyncDataLoader(lambda keys: keys)
+    outer_future = outer_loader.load("outer")
+
+    result = execute("{ broken }", context)
+
+    assert result.errors[0].message == "Broken"
+    assert get_pending_loaders() == [outer_loader]
+    assert load_calls == []
+
+    result = execute('{ user(id: "1") { name } }', context)
+
+    assert not result.errors
+    assert load_calls == [["1"]]
+    assert get_pending_loaders() == [outer_loader]
+    assert outer_future.result() == "outer"
+    assert get_pending_loaders() == []
+
+    result = execute('{ user(id: "3") { name } }', context)
+
+    assert result.data == {"user": {"name": "Carol"}}
+    assert load_calls == [["1"], ["3"]]
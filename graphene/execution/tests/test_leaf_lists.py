@@ -0,0 +1,178 @@
+from array import array
+
+from graphql import ExecutionContext
+from pytest import mark
+
+from ...types import ID, Boolean, Float, Int, List, NonNull, ObjectType, Schema, String
+from ..leaf_lists import LeafListExecutionContext, get_list_values
+
+
+class Query(ObjectType):
+    ints = List(Int, values=List(String))
+    floats = List(Float, values=List(String))
+    strings = List(String, values=List(String))
+    booleans = List(Boolean, values=List(String))
+    ids = List(ID, values=List(String))
+    required_ints = List(NonNull(Int), values=List(String))
+    matrix = List(List(Int), values=List(String))
+
+    def resolve_ints(root, info, values=None):
+        return root[values[0]] if values else root
+
+    resolve_floats = resolve_ints
+    resolve_strings = resolve_ints
+    resolve_booleans = resolve_ints
+    resolve_ids = resolve_ints
+    resolve_required_ints = resolve_ints
+    resolve_matrix = resolve_ints
+
+
+schema = Schema(query=Query)
+
+
+def execute_both(query, root):
+    result = schema.execute(query, root=root)
+    expected = schema.execute(query, root=root, execution_context_class=ExecutionContext)
+    assert result.data == expected.data
+    assert [error.formatted for error in result.errors or []] == [
+        error.formatted for error in expected.errors or []
+    ]
+    return result
+
+
+@mark.parametrize(
+    "field,values,expected",
+    [
+        ("ints", [1, 2, 3], [1, 2, 3]),
+        ("ints", (1, 2, 3), [1, 2, 3]),
+        ("ints", range(5), [0, 1, 2, 3, 4]),
+        ("ints", range(0), []),
+        ("ints", [], []),
+        ("floats", [1.5, 2.5], [1.5, 2.5]),
+        ("floats", [1, 2.5], [1.0, 2.5]),
+        ("floats", range(3), [0.0, 1.0, 2.0]),
+        ("strings", ["a", "b"], ["a", "b"]),
+        ("strings", [1, 2], ["1", "2"]),
+        ("booleans", [True, False], [True, False]),
+        ("ids", ["1", "2"], ["1", "2"]),
+        ("ids", range(3), ["0", "1", "2"]),
+        ("requiredInts", [1, 2], [1, 2]),
+    ],
+)
+def test_leaf_lists_are_completed_in_bulk(field, values, expected):
+    result = execute_both(f"{{ {field} }}", values)
+    assert not result.errors
+    assert result.data == {field: expected}
+    assert all(type(value) is type(item) for value, item in zip(result.data[field], expected))
+
+
+@mark.parametrize(
+    "field,values",
+    [
+        ("ints", [1, 2**31, 3]),
+        ("ints", range(2**31 - 1, 2**31 + 1)),
+        ("ints", [1, None, 3]),
+        ("ints", [1, True]),
+        ("ints", [1, 2.0]),
+        ("ints", [1, "2"]),
+        ("floats", [1.5, True]),
+        ("floats", [1.5, float("inf")]),
+        ("floats", [1.5, float("nan")]),
+        ("floats", [1.5, 10**400]),
+        ("strings", ["a", 1]),
+        ("strings", ["a", 1.5]),
+        ("strings", ["a", None]),
+        ("booleans", [True, 1]),
+        ("ids", ["1", None]),
+        ("requiredInts", [1, None, 3]),
+    ],
+)
+def test_leaf_lists_fall_back_to_item_completion(field, values):
+    execute_both(f"{{ {field} }}", values)
+
+
+def test_leaf_lists_of_arrays():
+    result = execute_both(
+        '{ ints(values: ["i"]) floats(values: ["d"]) }',
+        {"i": array("i", [1, 2, 3]), "d": array("d", [1.5, 2.5])},
+    )
+    assert not result.errors
+    assert result.data == {"ints": [1, 2, 3], "floats": [1.5, 2.5]}
+
+
+def test_leaf_lists_of_memoryviews():
+    result = schema.execute(
+        '{ ints(values: ["i"]) floats(values: ["d"]) bytes: ints(values: ["b"]) }',
+        root={
+            "i": memoryview(array("i", [1, -2, 3])),
+            "d": memoryview(array("d", [1.5])),
+            "b": memoryview(b"ab"),
+        },
+    )
+    assert not result.errors
+    assert result.data == {"ints": [1, -2, 3], "floats": [1.5], "bytes": [97, 98]}
+
+
+def test_lists_of_multidimensional_memoryviews():
+    matrix = memoryview(array("i", [1, 2, 3, 4])).cast("B").cast("i", [2, 2])
+    result = schema.execute('{ matrix(values: ["m"]) }', root={"m": matrix})
+    assert not result.errors
+    assert result.data == {"matrix": [[1, 2], [3, 4]]}
+
+
+def test_leaf_lists_reuse_tolist_values():
+    class Buffer:
+        def __init__(self, values):
+            self.values = values
+
+        def __iter__(self):
+            return iter(self.values)
+
+        def tolist(self):
+            return self.values
+
+    values = [1, 2, 3]
+    result = schema.execute('{ ints(values: ["b"]) }', root={"b": Buffer(values)})
+    assert not result.errors
+    assert result.data["ints"] is values
+
+    result = schema.execute('{ ints(values: ["l"]) }', root={"l": values})
+    assert result.data["ints"] == values
+    assert result.data["ints"] is not values
+
+
+def test_get_list_values():
+    values = [1, 2]
+    assert get_list_values(values) is values
+    assert get_list_values(range(2)) == range(2)
+    assert get_list_values(array("i", [1, 2])) == [1, 2]
+    assert get_list_values(memoryview(b"ab")) == [97, 98]
+    assert get_list_values(iter(values)) is None
+    assert get_list_values({1, 2}) is None
+
+
+def test_leaf_list_items_are_not_completed_one_by_one():
+    class RecordingExecutionContext(LeafListExecutionContext):
+        calls = 0
+
+        def complete_value(self, *args):
+            RecordingExecutionContext.calls += 1
+            return super().complete_value(*args)
+
+    result = schema.execute(
+        "{ ints }", root=list(range(100)), execution_context_class=RecordingExecutionContext
+    )
+    assert not result.errors
+    assert result.data == {"ints": list(range(100))}
+    assert RecordingExecutionContext.calls == 1
+
+
+def test_big_leaf_list_query_benchmark(benchmark):
+    big_list = list(range(100000))
+    result = benchmark(schema.execute, "{ ints floats ids }", root=big_list)
+    assert not result.errors
+    assert result.data == {
+        "ints": big_list,
+        "floats": [float(value) for value in big_list],
+        "ids": [str(value) for value in big_list],
+    }
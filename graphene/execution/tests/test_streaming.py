@@ -0,0 +1,292 @@
+import json
+from collections import OrderedDict
+
+from graphql import ExecutionResult, GraphQLError
+from pytest import mark, raises
+
+from ...test import default_format_error, format_execution_result
+from ...types import Int, List, NonNull, ObjectType, Schema, String
+from ..streaming import (
+    StreamedList,
+    StreamingExecutionContext,
+    iter_json_chunks,
+    stream_execution_result,
+    stream_execution_result_async,
+)
+
+
+class Query(ObjectType):
+    all_ints = List(Int)
+    hello = String()
+    required = NonNull(String)
+
+    def resolve_all_ints(root, info):
+        return range(100000)
+
+    def resolve_hello(root, info):
+        return "Hëllo \"world\"\n"
+
+    def resolve_required(root, info):
+        raise Exception("Boom")
+
+
+schema = Schema(query=Query)
+
+
+def decode(chunks):
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def test_encodes_like_format_execution_result():
+    result = schema.execute("{ hello allInts }")
+
+    assert decode(stream_execution_result(result)) == format_execution_result(
+        result, default_format_error
+    )
+
+
+def test_encodes_errors():
+    result = schema.execute("{ hello required }")
+
+    assert decode(stream_execution_result(result)) == {
+        "errors": [
+            {
+                "message": "Boom",
+                "locations": [{"line": 1, "column": 9}],
+                "path": ["required"],
+            }
+        ],
+        "data": None,
+    }
+
+
+def test_custom_format_error():
+    result = ExecutionResult(data=None, errors=[GraphQLError("Boom")])
+
+    assert decode(
+        stream_execution_result(result, lambda error: {"msg": error.message})
+    ) == {"errors": [{"msg": "Boom"}], "data": None}
+
+
+def test_yields_bounded_chunks():
+    result = schema.execute("{ allInts }")
+
+    chunks = list(stream_execution_result(result, chunk_size=1024))
+
+    assert len(chunks) > 100
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert max(len(chunk) for chunk in chunks) < 2 * 1024 + 100
+    assert decode(chunks) == {"data": {"allInts": list(range(100000))}}
+
+
+def test_encodes_json_values():
+    value = OrderedDict(
+        [
+            ("string", "é \"\\"),
+            ("int", -12),
+            ("float", 1.5),
+            ("big", 10**30),
+            ("true", True),
+            ("false", False),
+            ("null", None),
+            ("empty_list", []),
+            ("empty_object", {}),
+            ("tuple", (1, [2, {"a": ()}])),
+            (1, "int key"),
+        ]
+    )
+
+    encoded = b"".join(iter_json_chunks(value, chunk_size=1)).decode("utf-8")
+
+    assert encoded == json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def test_yields_chunks_of_lists_of_objects():
+    users = [{"id": i, "friends": [{"id": i}]} for i in range(1000)]
+    value = {"data": {"users": users}}
+
+    chunks = list(iter_json_chunks(value, chunk_size=1024))
+
+    assert len(chunks) > 10
+    assert max(len(chunk) for chunk in chunks) < 2 * 1024 + 100
+    assert json.loads(b"".join(chunks)) == value
+
+
+def test_stream_big_list_benchmark(benchmark):
+    result = schema.execute("{ allInts }")
+
+    chunks = benchmark(lambda: list(stream_execution_result(result)))
+
+    assert decode(chunks) == {"data": {"allInts": list(range(100000))}}
+
+
+consumed = []
+
+
+class Row(ObjectType):
+    id = Int()
+    name = String()
+
+    def resolve_name(root, info):
+        if root["id"] < 0:
+            raise Exception(f"Bad row {root['id']}")
+        return f"row {root['id']}"
+
+
+class AsyncRow(Row):
+    async def resolve_name(root, info):
+        return f"async row {root['id']}"
+
+
+class StreamingQuery(ObjectType):
+    ints = List(Int, count=Int())
+    rows = List(Row, ids=List(Int))
+    async_rows = List(AsyncRow, count=Int())
+    matrix = List(List(Int))
+
+    def resolve_ints(root, info, count):
+        for i in range(count):
+            consumed.append(i)
+            yield i
+
+    def resolve_rows(root, info, ids):
+        return ({"id": i} for i in ids)
+
+    async def resolve_async_rows(root, info, count):
+        for i in range(count):
+            yield {"id": i}
+
+    def resolve_matrix(root, info):
+        return [(i for i in range(3)), [3, 4]]
+
+
+streaming_schema = Schema(query=StreamingQuery)
+
+
+def execute_streaming(query):
+    return streaming_schema.execute(
+        query, execution_context_class=StreamingExecutionContext
+    )
+
+
+def test_streams_lists_lazily():
+    consumed.clear()
+    result = execute_streaming("{ ints(count: 100000) }")
+
+    assert isinstance(result.data["ints"], StreamedList)
+    assert not consumed
+
+    chunks = stream_execution_result(result, chunk_size=1024)
+    first_chunk = next(chunks)
+    assert 0 < len(consumed) < 1000
+
+    assert decode([first_chunk, *chunks]) == {"data": {"ints": list(range(100000))}}
+    assert len(consumed) == 100000
+
+
+def test_streams_lists_of_objects():
+    result = execute_streaming("{ rows(ids: [1, 2]) { name } matrix }")
+
+    assert decode(stream_execution_result(result)) == {
+        "data": {
+            "rows": [{"name": "row 1"}, {"name": "row 2"}],
+            "matrix": [[0, 1, 2], [3, 4]],
+        }
+    }
+
+
+def test_streams_errors_after_data():
+    result = execute_streaming("{ hello: ints(count: 1) rows(ids: [1, -2, 3]) { id name } }")
+
+    assert not result.errors
+    encoded = b"".join(stream_execution_result(result)).decode("utf-8")
+    assert encoded.index('"data"') < encoded.index('"errors"')
+    assert json.loads(encoded) == {
+        "data": {
+            "rows": [
+                {"id": 1, "name": "row 1"},
+                {"id": -2, "name": None},
+                {"id": 3, "name": "row 3"},
+            ],
+            "hello": [0],
+        },
+        "errors": [
+            {
+                "message": "Bad row -2",
+                "locations": [{"line": 1, "column": 52}],
+                "path": ["rows", 1, "name"],
+            },
+        ],
+    }
+
+
+def test_non_null_item_errors_end_streamed_lists():
+    class RequiredQuery(ObjectType):
+        names = List(NonNull(String))
+
+        def resolve_names(root, info):
+            yield "a"
+            yield None
+            yield "c"
+
+    result = Schema(query=RequiredQuery).execute(
+        "{ names }", execution_context_class=StreamingExecutionContext
+    )
+
+    response = decode(stream_execution_result(result))
+    assert response["data"] == {"names": ["a"]}
+    assert [error["path"] for error in response["errors"]] == [["names", 1]]
+
+
+def test_encodes_iterables():
+    value = {"a": (i for i in range(3)), "b": [1, {"c": iter("xy")}]}
+
+    assert json.loads(b"".join(iter_json_chunks(value))) == {
+        "a": [0, 1, 2],
+        "b": [1, {"c": ["x", "y"]}],
+    }
+
+
+@mark.asyncio
+async def test_streams_async_iterables():
+    result = await streaming_schema.execute_async(
+        "{ asyncRows(count: 3) { id name } rows(ids: [1]) { name } }",
+        execution_context_class=StreamingExecutionContext,
+    )
+
+    chunks = [chunk async for chunk in stream_execution_result_async(result)]
+
+    assert decode(chunks) == {
+        "data": {
+            "asyncRows": [
+                {"id": 0, "name": "async row 0"},
+                {"id": 1, "name": "async row 1"},
+                {"id": 2, "name": "async row 2"},
+            ],
+            "rows": [{"name": "row 1"}],
+        }
+    }
+
+
+@mark.asyncio
+async def test_async_iterables_need_async_streaming():
+    result = await streaming_schema.execute_async(
+        "{ asyncRows(count: 3) { id } }",
+        execution_context_class=StreamingExecutionContext,
+    )
+
+    with raises(TypeError) as exc_info:
+        list(stream_execution_result(result))
+
+    assert "stream_execution_result_async" in str(exc_info.value)
+
+
+def test_stream_big_generator_benchmark(benchmark):
+    def stream():
+        result = execute_streaming("{ ints(count: 100000) }")
+        return list(stream_execution_result(result))
+
+    consumed.clear()
+    chunks = benchmark(stream)
+
+    assert decode(chunks) == {"data": {"ints": list(range(100000))}}
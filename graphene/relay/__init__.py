@@ -1,6 +1,7 @@
 from .node import Node, is_node, GlobalID
 from .mutation import ClientIDMutation
 from .connection import Connection, ConnectionField, PageInfo
+from .keyset import KeysetSource
 from .id_type import (
     BaseGlobalIDType,
     DefaultGlobalIDType,
@@ -15,6 +16,7 @@ __all__ = [
     "ConnectionField",
     "DefaultGlobalIDType",
     "GlobalID",
+    "KeysetSource",
     "Node",
     "PageInfo",
     "SimpleGlobalIDType",
@@ -1,12 +1,15 @@
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from functools import partial
+from itertools import count, islice
+from operator import itemgetter
 from typing import Type
-from graphql_relay import connection_from_array
+from graphql_relay import connection_from_array_slice, get_offset_with_default
 from ..types import Boolean, Enum, Int, Interface, List, NonNull, Scalar, String, Union
 from ..types.field import Field
 from ..types.objecttype import ObjectType, ObjectTypeOptions
 from ..utils.thenables import maybe_thenable
+from .keyset import KeysetSource, connection_from_keyset
 from .node import is_node, AbstractNode
 
 class PageInfo(ObjectType):
@@ -29,6 +32,21 @@ def page_info_adapter(startCursor, endCursor, hasPreviousPage, hasNextPage):
 
 class ConnectionOptions(ObjectTypeOptions):
     node = None
+    total_count = False
+
+def resolve_total_count(root, info):
+    """
+    Counts the items of a connection once, when its `totalCount` is selected.
+    A connection returned as is by a resolver, without a `total_count`, counts
+    its edges.
+    """
+    if root.total_count is None:
+        iterable = getattr(root, 'iterable', None)
+        if iterable is None:
+            root.total_count = len(root.edges or ())
+        else:
+            root.total_count = count_items(iterable, getattr(root, 'iterable_length', None))
+    return root.total_count
 
 class Connection(ObjectType):
 
@@ -36,7 +54,7 @@ class Connection(ObjectType):
         abstract = True
 
     @classmethod
-    def __init_subclass_with_meta__(cls, node=None, name=None, strict_types=False, _meta=None, **options):
+    def __init_subclass_with_meta__(cls, node=None, name=None, strict_types=False, total_count=False, _meta=None, **options):
         if not _meta:
             _meta = ConnectionOptions(cls)
         assert node, f'You have to provide a node in {cls.__name__}.Meta'
@@ -46,6 +64,7 @@ class Connection(ObjectType):
             name = f'{base_name}Connection'
         options['name'] = name
         _meta.node = node
+        _meta.total_count = total_count
         if not _meta.fields:
             _meta.fields = {}
         if 'page_info' not in _meta.fields:
@@ -54,6 +73,8 @@ class Connection(ObjectType):
             edge_class = get_edge_class(cls, node, base_name, strict_types)
             cls.Edge = edge_class
             _meta.fields['edges'] = Field(NonNull(List(NonNull(edge_class) if strict_types else edge_class)), description='Contains the nodes in this connection.')
+        if total_count and 'total_count' not in _meta.fields:
+            _meta.fields['total_count'] = Field(Int, required=True, name='totalCount', description='The total number of items in this connection.', resolver=resolve_total_count)
         return super(Connection, cls).__init_subclass_with_meta__(_meta=_meta, **options)
 
 def connection_adapter(cls, edges, pageInfo):
@@ -76,4 +97,74 @@ class IterableConnectionField(Field):
         kwargs.setdefault('first', Int())
         kwargs.setdefault('last', Int())
         super(IterableConnectionField, self).__init__(type_, *args, **kwargs)
+
+    @classmethod
+    def resolve_connection(cls, connection_type, args, resolved):
+        if isinstance(resolved, connection_type):
+            return resolved
+        if isinstance(resolved, KeysetSource):
+            return connection_from_keyset(resolved, args, connection_type, PageInfo)
+        assert isinstance(resolved, Iterable), f'Resolved value from the connection field has to be an iterable or instance of {connection_type}. Received "{resolved}"'
+        if hasattr(resolved, '__len__') and hasattr(resolved, '__getitem__'):
+            items, slice_start, length = (resolved, 0, get_length(resolved))
+        else:
+            items, slice_start, length = slice_iterable(resolved, args)
+        connection = connection_from_array_slice(items, args, slice_start=slice_start, array_length=length, array_slice_length=length - slice_start, connection_type=partial(connection_adapter, connection_type), edge_type=connection_type.Edge, page_info_type=page_info_adapter)
+        connection.iterable = resolved
+        connection.iterable_length = length
+        return connection
 ConnectionField = IterableConnectionField
+
+def get_length(sequence):
+    """
+    Gets the length of a sequence, with its `count` method for the sequence-like
+    objects which are not sequences (like ORM querysets, counted by the
+    database instead of being loaded).
+    """
+    if not isinstance(sequence, Sequence):
+        count = getattr(sequence, 'count', None)
+        if callable(count):
+            return count()
+    return len(sequence)
+
+def slice_iterable(iterable, args):
+    """
+    Gets the items of an iterable without length or slicing (like a generator)
+    covering the page of the connection arguments, as a list, with the offset
+    of its first item and the length of the iterable, as far as it was read.
+    Only paginating forwards stops consuming the iterable after the page.
+
+    Like `connection_from_array_slice`, an `after` cursor past the end of the
+    iterable is ignored: the first items are kept while skipping to the
+    cursor, to be paginated from the start instead.
+    """
+    first = args.get('first')
+    if isinstance(first, int) and (not isinstance(args.get('last'), int)) and (args.get('before') is None):
+        if first < 0:
+            raise ValueError("Argument 'first' must be a non-negative integer.")
+        start = max(get_offset_with_default(args.get('after'), -1) + 1, 0)
+        counter = count()
+        items = map(itemgetter(0), zip(iterable, counter))
+        head = list(islice(items, min(start, first + 1)))
+        next(islice(items, start - len(head), start - len(head)), None)
+        page = list(islice(items, first + 1))
+        length = next(counter)
+        if length < start:
+            return (head, 0, length)
+        return (page, start, length)
+    items = list(iterable)
+    return (items, 0, len(items))
+
+def count_items(iterable, length=None):
+    """
+    Counts the items of the iterable of a connection, of which `length` items
+    were read by the pagination: sequences are counted by their length (or
+    `count` method), and the rest of iterators are consumed.
+    """
+    if length is not None and hasattr(iterable, '__len__') and hasattr(iterable, '__getitem__'):
+        return length
+    if hasattr(iterable, '__len__') or callable(getattr(iterable, 'count', None)):
+        return get_length(iterable)
+    if iter(iterable) is iterable:
+        return (length or 0) + sum((1 for _ in iterable))
+    return sum((1 for _ in iterable))
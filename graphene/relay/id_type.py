@@ -1,7 +1,29 @@
+from binascii import b2a_base64
+from functools import lru_cache
+from graphql import GraphQLID
 from graphql_relay import from_global_id, to_global_id
 from ..types import ID, UUID
 from ..types.base import BaseType
 from typing import Type
+GLOBAL_ID_CACHE_SIZE = 4096
+
+def encode_global_id(type_, id_):
+    """
+    Same as `graphql_relay.to_global_id`, serializing string and integer ids
+    directly.
+    """
+    cls = id_.__class__
+    if cls is not str and cls is not int:
+        id_ = GraphQLID.serialize(id_)
+    return b2a_base64(f'{type_}:{id_}'.encode('utf-8'), newline=False).decode('ascii')
+
+@lru_cache(maxsize=GLOBAL_ID_CACHE_SIZE)
+def decode_global_id(global_id):
+    """
+    Same as `graphql_relay.from_global_id`, caching the most recently decoded
+    global IDs.
+    """
+    return from_global_id(global_id)
 
 class BaseGlobalIDType:
     """
@@ -15,6 +37,20 @@ class DefaultGlobalIDType(BaseGlobalIDType):
     """
     graphene_type = ID
 
+    @classmethod
+    def resolve_global_id(cls, info, global_id):
+        try:
+            _type, _id = decode_global_id(global_id)
+            if not _type:
+                raise ValueError('Invalid Global ID')
+            return (_type, _id)
+        except Exception as e:
+            raise Exception(f'Unable to parse global ID "{global_id}". Make sure it is a base64 encoded string in the format: "TypeName:id". Exception message: {e}')
+
+    @classmethod
+    def to_global_id(cls, _type, _id):
+        return encode_global_id(_type, _id)
+
 class SimpleGlobalIDType(BaseGlobalIDType):
     """
     Simple global ID type: simply the id of the object.
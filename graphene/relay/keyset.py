@@ -0,0 +1,115 @@
+from functools import partial
+from json import dumps, loads
+from graphql_relay.utils import base64, unbase64
+from ..utils.thenables import maybe_thenable
+KEYSET_PREFIX = 'keyset:'
+
+class KeysetSource:
+    """
+    Source of the items of a connection paginated by key ("keyset" or "seek"
+    pagination) instead of by offset. Returned by the resolver of a
+    `ConnectionField`, it is queried for the requested page only.
+
+    The items are ordered by a unique key, and the `after` and `before`
+    cursors of the connection hold the key of an item. `fetch` is meant to
+    push them down to the data store, like
+    ``WHERE key > :after AND key < :before ORDER BY key LIMIT :limit``, so that
+    every page costs the same whatever its depth.
+
+    .. code:: python
+
+        class ShipSource(KeysetSource):
+
+            def get_key(self, ship):
+                return ship.id
+
+            def fetch(self, after, before, limit, reverse):
+                query = Ship.query.order_by(Ship.id.desc() if reverse else Ship.id)
+                if after is not None:
+                    query = query.filter(Ship.id > after)
+                if before is not None:
+                    query = query.filter(Ship.id < before)
+                return query.limit(limit).all()
+    """
+
+    def get_key(self, item):
+        """
+        Gets the key of an item, as a JSON serializable value (a list key is
+        given back to `fetch` as a tuple).
+        """
+        raise NotImplementedError
+
+    def fetch(self, after, before, limit, reverse):
+        """
+        Gets the items with a key greater than `after` and lower than `before`
+        (either being None when unbounded), in the order of their keys, or in
+        the reverse order if `reverse`, stopping after `limit` items (unless
+        None). May return an awaitable.
+        """
+        raise NotImplementedError
+
+    def count(self):
+        """
+        Counts all the items, for the `totalCount` field of the connections
+        with the `total_count` option.
+        """
+        raise NotImplementedError
+
+def key_to_cursor(key):
+    """Creates the cursor string of a key."""
+    return base64(KEYSET_PREFIX + dumps(key, separators=(',', ':')))
+
+def cursor_to_key(cursor):
+    """Extracts the key of a cursor string, or None if it isn't a key cursor."""
+    if not isinstance(cursor, str):
+        return None
+    value = unbase64(cursor)
+    if not value.startswith(KEYSET_PREFIX):
+        return None
+    try:
+        key = loads(value[len(KEYSET_PREFIX):])
+    except ValueError:
+        return None
+    return tuple(key) if isinstance(key, list) else key
+
+def connection_from_keyset(source, args, connection_type, page_info_type):
+    """
+    Creates a connection of type `connection_type` from a :class:`KeysetSource`
+    and the connection arguments, fetching a single page of at most
+    `first + 1` (or `last + 1`) items to know whether there is a next (or
+    previous) page.
+    """
+    after = cursor_to_key(args.get('after'))
+    before = cursor_to_key(args.get('before'))
+    first = args.get('first')
+    last = args.get('last')
+    if isinstance(first, int) and first < 0:
+        raise ValueError("Argument 'first' must be a non-negative integer.")
+    if isinstance(last, int) and last < 0:
+        raise ValueError("Argument 'last' must be a non-negative integer.")
+    if isinstance(first, int):
+        items = source.fetch(after, before, first + 1, False)
+    elif isinstance(last, int):
+        items = source.fetch(after, before, last + 1, True)
+    else:
+        items = source.fetch(after, before, None, False)
+    return maybe_thenable(items, partial(build_keyset_connection, source, connection_type, page_info_type, first, last))
+
+def build_keyset_connection(source, connection_type, page_info_type, first, last, items):
+    items = list(items)
+    has_previous_page = has_next_page = False
+    if isinstance(first, int):
+        has_next_page = len(items) > first
+        del items[first:]
+        if isinstance(last, int):
+            has_previous_page = len(items) > last
+            del items[:max(len(items) - last, 0)]
+    elif isinstance(last, int):
+        has_previous_page = len(items) > last
+        del items[last:]
+        items.reverse()
+    edge_type = connection_type.Edge
+    edges = [edge_type(node=item, cursor=key_to_cursor(source.get_key(item))) for item in items]
+    connection = connection_type(edges=edges, page_info=page_info_type(start_cursor=edges[0].cursor if edges else None, end_cursor=edges[-1].cursor if edges else None, has_previous_page=has_previous_page, has_next_page=has_next_page))
+    connection.iterable = source
+    return connection
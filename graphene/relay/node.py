@@ -1,6 +1,7 @@
+from asyncio import gather
 from functools import partial
-from inspect import isclass
-from ..types import Field, Interface, ObjectType
+from inspect import isawaitable, isclass
+from ..types import Field, Interface, List, NonNull, ObjectType
 from ..types.interface import InterfaceOptions
 from ..types.utils import get_type
 from .id_type import BaseGlobalIDType, DefaultGlobalIDType
@@ -27,6 +28,23 @@ class NodeField(Field):
         global_id_type = node._meta.global_id_type
         super(NodeField, self).__init__(type_ or node, id=global_id_type.graphene_type(required=True, description='The ID of the object'), **kwargs)
 
+class NodesField(Field):
+    """
+    Field fetching a list of nodes from their global IDs, with the
+    `get_nodes(info, ids)` class method of their types when they define it,
+    called once per type, instead of resolving every ID on its own.
+    """
+
+    def __init__(self, node, type_=False, **kwargs):
+        assert issubclass(node, Node), 'NodesField can only operate in Nodes'
+        self.node_type = node
+        self.field_type = type_
+        global_id_type = node._meta.global_id_type
+        super(NodesField, self).__init__(NonNull(List(type_ or node)), ids=NonNull(List(NonNull(global_id_type.graphene_type)), description='The IDs of the objects'), **kwargs)
+
+    def wrap_resolve(self, parent_resolver):
+        return partial(self.node_type.nodes_resolver, get_type(self.field_type))
+
 class AbstractNode(Interface):
 
     class Meta:
@@ -42,3 +60,97 @@ class AbstractNode(Interface):
 
 class Node(AbstractNode):
     """An object with an ID"""
+
+    @classmethod
+    def NodesField(cls, *args, **kwargs):
+        return NodesField(cls, *args, **kwargs)
+
+    @classmethod
+    def nodes_resolver(cls, only_type, root, info, ids):
+        return cls.get_nodes_from_global_ids(info, ids, only_type=only_type)
+
+    @classmethod
+    def get_nodes_from_global_ids(cls, info, global_ids, only_type=None):
+        """
+        Gets the nodes of a list of global IDs, in the same order. The IDs are
+        grouped by type, and each type with a `get_nodes(info, ids)` class
+        method gets its nodes in one call (returning them in the order of the
+        IDs, with None for the missing ones, or an awaitable of such a list).
+        The other types get every node with `get_node(info, id)`. The IDs which
+        cannot be resolved are replaced by their error, like the IDs of a batch
+        which failed, or did not return one node per ID.
+        """
+        nodes = [None] * len(global_ids)
+        ids_by_type = {}
+        for index, global_id in enumerate(global_ids):
+            try:
+                _type, _id = cls.resolve_global_id(info, global_id)
+                graphene_type = cls.get_node_type(info, _type, only_type)
+            except Exception as error:
+                nodes[index] = error
+                continue
+            indices, ids = ids_by_type.setdefault(graphene_type, ([], []))
+            indices.append(index)
+            ids.append(_id)
+        pending_batches = []
+        for graphene_type, (indices, ids) in ids_by_type.items():
+            get_nodes = getattr(graphene_type, 'get_nodes', None)
+            if get_nodes:
+                try:
+                    batch = get_nodes(info, ids)
+                except Exception as error:
+                    batch = error
+                if isawaitable(batch):
+                    pending_batches.append((graphene_type, indices, batch))
+                else:
+                    set_nodes(nodes, graphene_type, indices, batch)
+                continue
+            get_node = getattr(graphene_type, 'get_node', None)
+            if get_node:
+                for index, _id in zip(indices, ids):
+                    try:
+                        nodes[index] = get_node(info, _id)
+                    except Exception as error:
+                        nodes[index] = error
+        if not pending_batches:
+            return nodes
+
+        async def await_nodes():
+            batches = await gather(*(batch for _, _, batch in pending_batches), return_exceptions=True)
+            for (graphene_type, indices, _), batch in zip(pending_batches, batches):
+                set_nodes(nodes, graphene_type, indices, batch)
+            return nodes
+        return await_nodes()
+
+    @classmethod
+    def get_node_type(cls, info, type_name, only_type=None):
+        """Gets the Graphene type of the nodes of a global ID type name, checking it."""
+        graphql_type = info.schema.get_type(type_name)
+        if graphql_type is None:
+            raise Exception(f'Relay Node "{type_name}" not found in schema')
+        graphene_type = graphql_type.graphene_type
+        if only_type:
+            assert graphene_type == only_type, f'Must receive a {only_type._meta.name} id.'
+        if cls not in graphene_type._meta.interfaces:
+            raise Exception(f'ObjectType "{type_name}" does not implement the "{cls}" interface.')
+        return graphene_type
+
+def set_nodes(nodes, graphene_type, indices, batch):
+    """
+    Sets the nodes of a `get_nodes` batch at the indices of their IDs, or the
+    error of the batch if it failed or does not have one node per ID.
+    """
+    if not isinstance(batch, Exception):
+        try:
+            batch = list(batch)
+        except TypeError as error:
+            batch = error
+    if not isinstance(batch, Exception):
+        if len(batch) != len(indices):
+            batch = ValueError(f'{graphene_type._meta.name}.get_nodes must return a list of the same length as the list of IDs. Expected {len(indices)} nodes, received {len(batch)}.')
+    if isinstance(batch, Exception):
+        for index in indices:
+            nodes[index] = batch
+        return
+    for index, node in zip(indices, batch):
+        nodes[index] = node
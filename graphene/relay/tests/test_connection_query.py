@@ -284,3 +284,265 @@ async def test_connection_async():
             "pageInfo": {"hasPreviousPage": False, "hasNextPage": True},
         }
     }
+
+
+class Number(ObjectType):
+    value = String()
+
+    def resolve_value(root, info):
+        return str(root)
+
+
+class NumberConnection(Connection):
+    class Meta:
+        node = Number
+
+
+class CountedSequence:
+    """A sequence-like object counted without being loaded, like a queryset"""
+
+    def __init__(self, values):
+        self.values = values
+        self.calls = []
+
+    def count(self):
+        self.calls.append("count")
+        return len(self.values)
+
+    def __len__(self):
+        self.calls.append("len")
+        return len(self.values)
+
+    def __getitem__(self, key):
+        self.calls.append(key)
+        return self.values[key]
+
+    def __iter__(self):
+        self.calls.append("iter")
+        return iter(self.values)
+
+
+class NumbersQuery(ObjectType):
+    numbers = ConnectionField(NumberConnection)
+
+    def resolve_numbers(root, info, **args):
+        return root
+
+
+numbers_schema = Schema(NumbersQuery)
+
+
+def query_numbers(numbers, args):
+    result = numbers_schema.execute(
+        """{
+            numbers(%s) {
+                edges { node { value } cursor }
+                pageInfo { hasPreviousPage hasNextPage }
+            }
+        }"""
+        % args,
+        root=numbers,
+    )
+    assert not result.errors
+    return result.data["numbers"]
+
+
+def numbers_page(values, has_previous_page=False, has_next_page=False):
+    return {
+        "edges": [
+            {
+                "node": {"value": str(value)},
+                "cursor": base64("arrayconnection:%s" % value),
+            }
+            for value in values
+        ],
+        "pageInfo": {
+            "hasPreviousPage": has_previous_page,
+            "hasNextPage": has_next_page,
+        },
+    }
+
+
+def test_connection_slices_sequences_once():
+    numbers = CountedSequence(list(range(100)))
+
+    assert query_numbers(
+        numbers, f'first: 2, after: "{base64("arrayconnection:9")}"'
+    ) == numbers_page([10, 11], has_next_page=True)
+    assert numbers.calls == ["count", slice(10, 12)]
+
+
+def test_connection_from_iterator_paginating_forwards():
+    consumed = []
+
+    def numbers():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    assert query_numbers(
+        numbers(), f'first: 2, after: "{base64("arrayconnection:9")}"'
+    ) == numbers_page([10, 11], has_next_page=True)
+    assert consumed == list(range(13))
+
+    assert query_numbers(iter(range(3)), "first: 3") == numbers_page([0, 1, 2])
+
+
+@mark.parametrize(
+    "after,first",
+    [(-1, 2), (0, 2), (1, 2), (5, 2), (8, 2), (9, 2), (10, 2), (20, 2), (20, 20)],
+)
+def test_connection_from_iterator_matches_sequences(after, first):
+    args = f'first: {first}, after: "{base64("arrayconnection:%s" % after)}"'
+    expected = query_numbers(list(range(10)), args)
+
+    assert query_numbers(iter(range(10)), args) == expected
+    assert query_numbers((i for i in range(10)), args) == expected
+
+
+def test_connection_from_iterator_paginating_backwards():
+    assert query_numbers(iter(range(100)), "last: 2") == numbers_page(
+        [98, 99], has_previous_page=True
+    )
+    assert query_numbers(
+        (i for i in range(100)), f'first: 2, before: "{base64("arrayconnection:1")}"'
+    ) == numbers_page([0])
+
+
+def test_connection_from_set():
+    assert query_numbers({2, 0, 1}, "first: 5") == numbers_page([0, 1, 2])
+
+
+def test_big_range_connection_benchmark(benchmark):
+    numbers = range(10_000_000)
+
+    result = benchmark(
+        query_numbers, numbers, f'first: 10, after: "{base64("arrayconnection:5000000")}"'
+    )
+
+    assert result == numbers_page(range(5_000_001, 5_000_011), has_next_page=True)
+
+
+class CountedNumberConnection(Connection):
+    class Meta:
+        node = Number
+        total_count = True
+
+
+class CountedNumbersQuery(ObjectType):
+    numbers = ConnectionField(CountedNumberConnection)
+
+    def resolve_numbers(root, info, **args):
+        return root
+
+
+counted_numbers_schema = Schema(CountedNumbersQuery)
+
+
+def count_numbers(numbers, args="first: 2", selection="totalCount"):
+    result = counted_numbers_schema.execute(
+        "{ numbers(%s) { %s } }" % (args, selection), root=numbers
+    )
+    assert not result.errors
+    return result.data["numbers"]
+
+
+def test_connection_total_count_field():
+    fields = CountedNumberConnection._meta.fields
+    assert list(fields) == ["page_info", "edges", "total_count"]
+    assert str(fields["total_count"].type) == "Int!"
+    assert "total_count" not in NumberConnection._meta.fields
+    assert "totalCount: Int!" in str(counted_numbers_schema)
+
+
+def test_connection_total_count_is_only_counted_when_selected():
+    numbers = CountedSequence(list(range(100)))
+
+    assert count_numbers(numbers, selection="edges { cursor }") == {
+        "edges": [
+            {"cursor": base64("arrayconnection:0")},
+            {"cursor": base64("arrayconnection:1")},
+        ]
+    }
+    assert numbers.calls == ["count", slice(0, 2)]
+
+    numbers.calls.clear()
+    assert count_numbers(numbers, selection="totalCount a: totalCount") == {
+        "totalCount": 100,
+        "a": 100,
+    }
+    assert numbers.calls == ["count", slice(0, 2)]
+
+
+@mark.parametrize(
+    "get_numbers",
+    [
+        lambda: list(range(10)),
+        lambda: range(10),
+        lambda: {i for i in range(10)},
+        lambda: (i for i in range(10)),
+        lambda: iter(range(10)),
+    ],
+)
+@mark.parametrize(
+    "args",
+    [
+        "first: 2",
+        "last: 2",
+        "first: 0",
+        f'first: 2, after: "{base64("arrayconnection:20")}"',
+    ],
+)
+def test_connection_total_count(get_numbers, args):
+    assert count_numbers(get_numbers(), args) == {"totalCount": 10}
+
+
+def test_connection_total_count_of_iterables():
+    class Numbers:
+        def __iter__(self):
+            return iter(range(10))
+
+    assert count_numbers(Numbers()) == {"totalCount": 10}
+
+
+def test_connection_total_count_of_iterables_with_a_count_attribute():
+    class Numbers:
+        count = 3
+
+        def __iter__(self):
+            return iter(range(10))
+
+    assert count_numbers(Numbers()) == {"totalCount": 10}
+
+
+def test_connection_total_count_of_connections():
+    class NumbersQuery(ObjectType):
+        numbers = ConnectionField(CountedNumberConnection)
+
+        def resolve_numbers(root, info, **args):
+            return CountedNumberConnection(
+                edges=[],
+                page_info=PageInfo(has_next_page=False, has_previous_page=False),
+                total_count=42,
+            )
+
+    result = Schema(NumbersQuery).execute("{ numbers { totalCount } }")
+    assert not result.errors
+    assert result.data == {"numbers": {"totalCount": 42}}
+
+
+def test_connection_total_count_of_connections_without_total_count():
+    class NumbersQuery(ObjectType):
+        numbers = ConnectionField(CountedNumberConnection, required=True)
+
+        def resolve_numbers(root, info, **args):
+            return CountedNumberConnection(
+                edges=[
+                    CountedNumberConnection.Edge(node=i, cursor=str(i)) for i in range(3)
+                ],
+                page_info=PageInfo(has_next_page=False, has_previous_page=False),
+            )
+
+    result = Schema(NumbersQuery).execute("{ numbers { totalCount } }")
+    assert not result.errors
+    assert result.data == {"numbers": {"totalCount": 3}}
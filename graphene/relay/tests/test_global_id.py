@@ -1,7 +1,12 @@
-from graphql_relay import to_global_id
+from uuid import UUID
 
-from ...types import ID, NonNull, ObjectType, String
+from graphql_relay import from_global_id, to_global_id
+from pytest import mark, raises
+
+from ...types import ID, NonNull, ObjectType, Schema, String
 from ...types.definitions import GrapheneObjectType
+from ..connection import Connection, ConnectionField
+from ..id_type import DefaultGlobalIDType, decode_global_id, encode_global_id
 from ..node import GlobalID, Node
 
 
@@ -56,3 +61,63 @@ def test_global_id_allows_setting_customer_parent_type():
     id_resolver = gid.wrap_resolve(lambda *_: my_id)
     my_global_id = id_resolver(None, None)
     assert my_global_id == to_global_id(User._meta.name, my_id)
+
+
+@mark.parametrize(
+    "id_",
+    ["1", "äb:c", "", 0, 12345678901234567890, -3, 1.0, UUID(int=1)],
+)
+def test_encode_global_id_matches_graphql_relay(id_):
+    assert encode_global_id("User", id_) == to_global_id("User", id_)
+    assert DefaultGlobalIDType.to_global_id("User", id_) == to_global_id("User", id_)
+
+
+def test_encode_global_id_rejects_invalid_ids():
+    with raises(Exception) as exc_info:
+        to_global_id("User", True)
+    with raises(type(exc_info.value), match=str(exc_info.value)):
+        encode_global_id("User", True)
+
+
+def test_decode_global_id_is_cached():
+    global_id = to_global_id("User", "cached")
+    decode_global_id.cache_clear()
+
+    assert decode_global_id(global_id) == from_global_id(global_id)
+    assert decode_global_id(global_id) == ("User", "cached")
+    assert decode_global_id.cache_info().hits == 1
+
+
+def test_default_global_id_type_resolves_global_ids():
+    global_id = to_global_id("User", "1")
+    assert DefaultGlobalIDType.resolve_global_id(None, global_id) == ("User", "1")
+
+    with raises(Exception) as exc_info:
+        DefaultGlobalIDType.resolve_global_id(None, "invalid")
+    assert str(exc_info.value).startswith('Unable to parse global ID "invalid".')
+
+
+class UserConnection(Connection):
+    class Meta:
+        node = User
+
+
+class Query(ObjectType):
+    users = ConnectionField(UserConnection)
+
+    def resolve_users(root, info, **args):
+        return root
+
+
+def test_big_node_connection_global_ids_benchmark(benchmark):
+    users = [User(id=i, name="user") for i in range(50_000)]
+    schema = Schema(query=Query)
+
+    result = benchmark(
+        schema.execute, "{ users(first: 50000) { edges { node { id } } } }", root=users
+    )
+
+    assert not result.errors
+    edges = result.data["users"]["edges"]
+    assert len(edges) == 50_000
+    assert edges[-1] == {"node": {"id": to_global_id("User", 49_999)}}
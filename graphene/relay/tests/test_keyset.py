@@ -0,0 +1,177 @@
+import sqlite3
+
+from pytest import fixture, mark
+
+from ...types import Int, ObjectType, Schema, String
+from ..connection import Connection, ConnectionField
+from ..keyset import KeysetSource, cursor_to_key, key_to_cursor
+
+
+class Row(ObjectType):
+    id = Int()
+    letter = String()
+
+
+class RowConnection(Connection):
+    class Meta:
+        node = Row
+
+
+class RowSource(KeysetSource):
+    def __init__(self, database):
+        self.database = database
+        self.queries = []
+
+    def get_key(self, row):
+        return row.id
+
+    def fetch(self, after, before, limit, reverse):
+        conditions = []
+        params = []
+        if after is not None:
+            conditions.append("id > ?")
+            params.append(after)
+        if before is not None:
+            conditions.append("id < ?")
+            params.append(before)
+        query = "SELECT id, letter FROM letters"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY id DESC" if reverse else " ORDER BY id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        self.queries.append((query, params))
+        return [
+            Row(id=id, letter=letter)
+            for id, letter in self.database.execute(query, params)
+        ]
+
+
+class AsyncRowSource(RowSource):
+    async def fetch(self, after, before, limit, reverse):
+        return super().fetch(after, before, limit, reverse)
+
+
+class Query(ObjectType):
+    rows = ConnectionField(RowConnection)
+    async_rows = ConnectionField(RowConnection)
+
+    def resolve_rows(root, info, **args):
+        return root
+
+    def resolve_async_rows(root, info, **args):
+        return AsyncRowSource(root.database)
+
+
+schema = Schema(query=Query)
+
+
+@fixture
+def source():
+    database = sqlite3.connect(":memory:")
+    database.execute("CREATE TABLE letters (id INTEGER PRIMARY KEY, letter TEXT)")
+    database.executemany(
+        "INSERT INTO letters VALUES (?, ?)",
+        [(i, letter) for i, letter in enumerate("ABCDE")],
+    )
+    return RowSource(database)
+
+
+def cursor_for(letter):
+    return key_to_cursor("ABCDE".index(letter))
+
+
+def query_rows(source, args="", field="rows"):
+    result = schema.execute(
+        """{
+            %s%s {
+                edges { node { letter } cursor }
+                pageInfo { hasPreviousPage hasNextPage startCursor endCursor }
+            }
+        }"""
+        % (field, f"({args})" if args else ""),
+        root=source,
+    )
+    assert not result.errors
+    return result.data[field]
+
+
+def check(source, args, letters, has_previous_page=False, has_next_page=False):
+    cursors = [cursor_for(letter) for letter in letters]
+    assert query_rows(source, args) == {
+        "edges": [
+            {"node": {"letter": letter}, "cursor": cursor}
+            for letter, cursor in zip(letters, cursors)
+        ],
+        "pageInfo": {
+            "hasPreviousPage": has_previous_page,
+            "hasNextPage": has_next_page,
+            "startCursor": cursors[0] if cursors else None,
+            "endCursor": cursors[-1] if cursors else None,
+        },
+    }
+
+
+def test_keyset_cursors():
+    assert cursor_to_key(key_to_cursor(12)) == 12
+    assert cursor_to_key(key_to_cursor("a")) == "a"
+    assert cursor_to_key(key_to_cursor(["2024-01-01", 3])) == ("2024-01-01", 3)
+    assert cursor_to_key("YXJyYXljb25uZWN0aW9uOjA=") is None
+    assert cursor_to_key("not a cursor") is None
+    assert cursor_to_key(None) is None
+
+
+@mark.parametrize(
+    "args,letters,has_previous_page,has_next_page",
+    [
+        ("", "ABCDE", False, False),
+        ("first: 2", "AB", False, True),
+        ("first: 10", "ABCDE", False, False),
+        ("first: 0", "", False, True),
+        ("last: 2", "DE", True, False),
+        ("last: 10", "ABCDE", False, False),
+        ('first: 2, after: "{B}"', "CD", False, True),
+        ('first: 10, after: "{B}"', "CDE", False, False),
+        ('last: 2, before: "{D}"', "BC", True, False),
+        ('last: 10, before: "{D}"', "ABC", False, False),
+        ('first: 2, after: "{A}", before: "{E}"', "BC", False, True),
+        ('first: 3, after: "{A}", before: "{E}"', "BCD", False, False),
+        ('last: 2, after: "{A}", before: "{E}"', "CD", True, False),
+        ("first: 4, last: 2", "CD", True, True),
+        ('first: 2, after: "invalid"', "AB", False, True),
+    ],
+)
+def test_keyset_pagination(source, args, letters, has_previous_page, has_next_page):
+    for letter in "ABCDE":
+        args = args.replace("{%s}" % letter, cursor_for(letter))
+    check(source, args, letters, has_previous_page, has_next_page)
+
+
+def test_keyset_pagination_pushes_down_arguments(source):
+    query_rows(source, f'first: 2, after: "{cursor_for("B")}"')
+    query_rows(source, f'last: 1, before: "{cursor_for("D")}"')
+
+    assert source.queries == [
+        ("SELECT id, letter FROM letters WHERE id > ? ORDER BY id LIMIT ?", [1, 3]),
+        ("SELECT id, letter FROM letters WHERE id < ? ORDER BY id DESC LIMIT ?", [3, 2]),
+    ]
+
+
+def test_keyset_pagination_negative_first(source):
+    result = schema.execute("{ rows(first: -1) { edges { cursor } } }", root=source)
+
+    assert result.errors[0].message == (
+        "Argument 'first' must be a non-negative integer."
+    )
+
+
+@mark.asyncio
+async def test_keyset_pagination_async_fetch(source):
+    result = await schema.execute_async(
+        f'{{ asyncRows(first: 1, after: "{cursor_for("C")}") {{ edges {{ node {{ letter }} }} }} }}',
+        root=source,
+    )
+
+    assert not result.errors
+    assert result.data == {"asyncRows": {"edges": [{"node": {"letter": "D"}}]}}
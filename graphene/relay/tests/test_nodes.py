@@ -0,0 +1,242 @@
+from graphql_relay import to_global_id
+from pytest import mark
+
+from ...types import ObjectType, Schema, String
+from ..node import Node
+
+fetched = []
+
+
+class Ship(ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    name = String()
+
+    @classmethod
+    def get_nodes(cls, info, ids):
+        fetched.append(("Ship", ids))
+        return [Ship(id=id, name=f"ship {id}") if id != "0" else None for id in ids]
+
+
+class Faction(ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    name = String()
+
+    @classmethod
+    def get_node(cls, info, id):
+        fetched.append(("Faction", id))
+        return Faction(id=id, name=f"faction {id}")
+
+
+class AsyncShip(ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    name = String()
+
+    @classmethod
+    async def get_nodes(cls, info, ids):
+        fetched.append(("AsyncShip", ids))
+        return [AsyncShip(id=id, name=f"async ship {id}") for id in ids]
+
+
+class Faulty(ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    @classmethod
+    def get_node(cls, info, id):
+        if id == "0":
+            raise Exception("Faulty node")
+        return Faulty(id=id)
+
+
+class ShortBatch(ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    @classmethod
+    def get_nodes(cls, info, ids):
+        return [ShortBatch(id=id) for id in ids[1:]]
+
+
+class FailingBatch(ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    @classmethod
+    def get_nodes(cls, info, ids):
+        raise Exception("Failing batch")
+
+
+class AsyncFailingBatch(ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    @classmethod
+    async def get_nodes(cls, info, ids):
+        raise Exception("Async failing batch")
+
+
+class Planet(ObjectType):
+    name = String()
+
+
+class Query(ObjectType):
+    nodes = Node.NodesField()
+    ships = Node.NodesField(Ship)
+    planet = String()
+
+
+schema = Schema(
+    query=Query,
+    types=[
+        Ship,
+        Faction,
+        AsyncShip,
+        Faulty,
+        ShortBatch,
+        FailingBatch,
+        AsyncFailingBatch,
+        Planet,
+    ],
+)
+
+
+def test_nodes_field_schema():
+    printed_schema = str(schema)
+
+    assert '"""The IDs of the objects"""\n    ids: [ID!]!\n  ): [Node]!' in printed_schema
+    assert '"""The IDs of the objects"""\n    ids: [ID!]!\n  ): [Ship]!' in printed_schema
+
+
+def test_nodes_are_fetched_by_type():
+    fetched.clear()
+    ids = [
+        to_global_id("Ship", 1),
+        to_global_id("Faction", 2),
+        to_global_id("Ship", 0),
+        to_global_id("Ship", 3),
+        to_global_id("Faction", 4),
+    ]
+
+    result = schema.execute(
+        """query ($ids: [ID!]!) {
+            nodes(ids: $ids) { id ... on Ship { name } ... on Faction { name } }
+        }""",
+        variables={"ids": ids},
+    )
+
+    assert not result.errors
+    assert result.data == {
+        "nodes": [
+            {"id": ids[0], "name": "ship 1"},
+            {"id": ids[1], "name": "faction 2"},
+            None,
+            {"id": ids[3], "name": "ship 3"},
+            {"id": ids[4], "name": "faction 4"},
+        ]
+    }
+    assert fetched == [("Ship", ["1", "0", "3"]), ("Faction", "2"), ("Faction", "4")]
+
+
+def test_nodes_errors():
+    ids = [
+        to_global_id("Ship", 1),
+        "invalid",
+        to_global_id("Unknown", 1),
+        to_global_id("Planet", 1),
+        to_global_id("Faction", 2),
+    ]
+
+    result = schema.execute(
+        "query ($ids: [ID!]!) { nodes(ids: $ids) { id } ships(ids: $ids) { id } }",
+        variables={"ids": ids},
+    )
+
+    assert result.data == {
+        "nodes": [{"id": ids[0]}, None, None, None, {"id": ids[4]}],
+        "ships": [{"id": ids[0]}, None, None, None, None],
+    }
+    errors = {tuple(error.path): error.message for error in result.errors}
+    assert errors[("nodes", 1)].startswith('Unable to parse global ID "invalid".')
+    assert errors[("nodes", 2)] == 'Relay Node "Unknown" not found in schema'
+    assert errors[("nodes", 3)] == (
+        'ObjectType "Planet" does not implement the "Node" interface.'
+    )
+    assert errors[("ships", 4)] == "Must receive a Ship id."
+    assert len(result.errors) == 7
+
+
+@mark.asyncio
+async def test_nodes_are_fetched_asynchronously():
+    fetched.clear()
+    ids = [
+        to_global_id("AsyncShip", 1),
+        to_global_id("Ship", 2),
+        to_global_id("AsyncShip", 3),
+    ]
+
+    result = await schema.execute_async(
+        "query ($ids: [ID!]!) { nodes(ids: $ids) { id ... on AsyncShip { name } } }",
+        variables={"ids": ids},
+    )
+
+    assert not result.errors
+    assert result.data == {
+        "nodes": [
+            {"id": ids[0], "name": "async ship 1"},
+            {"id": ids[1]},
+            {"id": ids[2], "name": "async ship 3"},
+        ]
+    }
+    assert sorted(fetched) == [("AsyncShip", ["1", "3"]), ("Ship", ["2"])]
+
+
+def test_nodes_errors_are_reported_per_id():
+    ids = [
+        to_global_id("Ship", 1),
+        to_global_id("Faulty", 0),
+        to_global_id("Faulty", 1),
+        to_global_id("ShortBatch", 1),
+        to_global_id("ShortBatch", 2),
+        to_global_id("FailingBatch", 1),
+    ]
+
+    result = schema.execute(
+        "query ($ids: [ID!]!) { nodes(ids: $ids) { id } }", variables={"ids": ids}
+    )
+
+    assert result.data == {
+        "nodes": [{"id": ids[0]}, None, {"id": ids[2]}, None, None, None]
+    }
+    errors = {tuple(error.path): error.message for error in result.errors}
+    assert errors == {
+        ("nodes", 1): "Faulty node",
+        ("nodes", 3): (
+            "ShortBatch.get_nodes must return a list of the same length as the list"
+            " of IDs. Expected 2 nodes, received 1."
+        ),
+        ("nodes", 4): (
+            "ShortBatch.get_nodes must return a list of the same length as the list"
+            " of IDs. Expected 2 nodes, received 1."
+        ),
+        ("nodes", 5): "Failing batch",
+    }
+
+
+@mark.asyncio
+async def test_nodes_errors_of_async_batches_are_reported_per_id():
+    ids = [to_global_id("AsyncFailingBatch", 1), to_global_id("AsyncShip", 2)]
+
+    result = await schema.execute_async(
+        "query ($ids: [ID!]!) { nodes(ids: $ids) { id } }", variables={"ids": ids}
+    )
+
+    assert result.data == {"nodes": [None, {"id": ids[1]}]}
+    assert [(error.path, error.message) for error in result.errors] == [
+        (["nodes", 0], "Async failing batch")
+    ]
@@ -19,13 +19,16 @@ def format_execution_result(execution_result, format_error):
 
 
 class Client:
-    def __init__(self, schema, format_error=None, **execute_options):
+    def __init__(self, schema, format_error=None, crunch=False, **execute_options):
         assert isinstance(schema, Schema)
         self.schema = schema
         self.execute_options = execute_options
         self.format_error = format_error or default_format_error
+        self.crunch = crunch
 
     def format_result(self, result):
+        if self.crunch:
+            result = Schema.crunch_result(result)
         return format_execution_result(result, self.format_error)
 
     def execute(self, *args, **kwargs):
@@ -8,6 +8,7 @@ from .structures import NonNull
 from .unmountedtype import UnmountedType
 from .utils import get_type
 from ..utils.deprecated import warn_deprecation
+from ..utils.run_in_executor import run_in_executor as run_in_executor_decorator
 base_type = type
 
 class Field(MountedType):
@@ -49,11 +50,14 @@ class Field(MountedType):
             name.
         description (optional, str): the description of the GraphQL field in the schema.
         default_value (optional, Any): Default value to resolve if none set from schema.
+        run_in_executor (optional, Union[bool, concurrent.futures.Executor]): run the resolver of
+            this field in a thread pool (the given executor or the shared default one) when the
+            query is executed asynchronously, so a blocking resolver does not block the event loop.
         **extra_args (optional, Dict[str, Union[graphene.Argument, graphene.UnmountedType]): any
             additional arguments to mount on the field.
     """
 
-    def __init__(self, type_, args=None, resolver=None, source=None, deprecation_reason=None, name=None, description=None, required=False, _creation_counter=None, default_value=None, **extra_args):
+    def __init__(self, type_, args=None, resolver=None, source=None, deprecation_reason=None, name=None, description=None, required=False, _creation_counter=None, default_value=None, run_in_executor=False, **extra_args):
         super(Field, self).__init__(_creation_counter=_creation_counter)
         assert not args or isinstance(args, Mapping), f'Arguments in a field have to be a mapping, received "{args}".'
         assert not (source and resolver), 'A Field cannot have a source and a resolver in at the same time.'
@@ -66,6 +70,9 @@ class Field(MountedType):
         if isinstance(source, (Argument, UnmountedType)):
             extra_args['source'] = source
             source = None
+        if isinstance(run_in_executor, (Argument, UnmountedType)):
+            extra_args['run_in_executor'] = run_in_executor
+            run_in_executor = False
         self.name = name
         self._type = type_
         self.args = to_arguments(args or {}, extra_args)
@@ -75,32 +82,26 @@ class Field(MountedType):
         self.deprecation_reason = deprecation_reason
         self.description = description
         self.default_value = default_value
+        self.run_in_executor = run_in_executor
     get_resolver = None
 
     def wrap_resolve(self, parent_resolver):
         """
         Wraps a function resolver, using the ObjectType resolve_{FIELD_NAME}
         (parent_resolver) if the Field definition has no resolver.
+        The resolver is returned as is (unless it runs in an executor), so
+        resolving the field does not go through an extra call.
         """
         resolver = self.resolver or parent_resolver
         if not resolver:
             return None
-        
-        def wrapped_resolver(root, info, **args):
-            return resolver(root, info, **args)
-        
-        return wrapped_resolver
+        if self.run_in_executor:
+            return run_in_executor_decorator(resolver, executor=None if self.run_in_executor is True else self.run_in_executor)
+        return resolver
 
     def wrap_subscribe(self, parent_subscribe):
         """
         Wraps a function subscribe, using the ObjectType subscribe_{FIELD_NAME}
         (parent_subscribe) if the Field definition has no subscribe.
         """
-        subscribe = getattr(self, 'subscribe', None) or parent_subscribe
-        if not subscribe:
-            return None
-        
-        def wrapped_subscribe(root, info, **args):
-            return subscribe(root, info, **args)
-        
-        return wrapped_subscribe
+        return getattr(self, 'subscribe', None) or parent_subscribe or None
@@ -1,47 +1,115 @@
+from functools import lru_cache
+from keyword import iskeyword
+from reprlib import recursive_repr
+from types import FunctionType
 from typing import TYPE_CHECKING
 from .base import BaseOptions, BaseType, BaseTypeMeta
 from .field import Field
 from .interface import Interface
 from .utils import yank_fields_from_attrs
-try:
-    from dataclasses import make_dataclass, field
-except ImportError:
-    from ..pyutils.dataclasses import make_dataclass, field
 if TYPE_CHECKING:
     from typing import Dict, Iterable, Type
+INIT_CODE_CACHE_SIZE = 1024
 
 class ObjectTypeOptions(BaseOptions):
     fields = None
     interfaces = ()
+    slots = False
 
 class ObjectTypeMeta(BaseTypeMeta):
 
     def __new__(cls, name_, bases, namespace, **options):
         # Create an intermediate class
         class InterObjectType:
-            pass
+            __slots__ = ()
+        
+        # Slotted types have no instance __dict__, their instances are created from a value class
+        if get_slots_option(namespace, options):
+            namespace = dict(namespace, __slots__=namespace.get('__slots__', ()))
         
         # Create the base class using super().__new__
         base_cls = super().__new__(cls, name_, (InterObjectType,) + bases, namespace, **options)
         
         # If the base class has a _meta attribute
         if base_cls._meta:
-            # Create fields for the dataclass
-            fields = [
-                (key, 'typing.Any', field(default=field_value.default_value if isinstance(field_value, Field) else None))
-                for key, field_value in base_cls._meta.fields.items()
-            ]
-            
-            # Create a dataclass with the same name and fields
-            dataclass = make_dataclass(name_, fields, bases=())
-            
-            # Copy the dataclass methods to InterObjectType
-            InterObjectType.__init__ = dataclass.__init__
-            InterObjectType.__eq__ = dataclass.__eq__
-            InterObjectType.__repr__ = dataclass.__repr__
+            # Give InterObjectType the value object methods a dataclass of the fields would have
+            fields = base_cls._meta.fields
+            init = FunctionType(get_init_code(tuple(fields)), {}, '__init__', get_init_defaults(fields))
+            init.__qualname__ = f'{name_}.__init__'
+            InterObjectType.__init__ = init
+            InterObjectType.__eq__ = objecttype_eq
+            InterObjectType.__repr__ = objecttype_repr
+            if base_cls._meta.slots:
+                base_cls._slotted_class = super().__new__(cls, name_, (base_cls,), {'__slots__': tuple(fields), '__module__': base_cls.__module__, '__qualname__': base_cls.__qualname__, '__reduce__': reduce_slotted_objecttype}, abstract=True)
+                InterObjectType.__new__ = staticmethod(new_slotted_objecttype)
         
         return base_cls
 
+def get_slots_option(namespace, options):
+    if 'slots' in options:
+        return options['slots']
+    meta = namespace.get('Meta')
+    if isinstance(meta, dict):
+        return meta.get('slots', False)
+    return getattr(meta, 'slots', False)
+
+def new_slotted_objecttype(cls, *args, **kwargs):
+    """
+    Creates the instances of a slotted ObjectType from its value class, which
+    stores the fields in slots (shadowing the fields of the ObjectType).
+    """
+    return object.__new__(cls.__dict__.get('_slotted_class', cls))
+
+def reduce_slotted_objecttype(self):
+    """
+    Pickles the instances of a slotted ObjectType as a call to the ObjectType with
+    the values of the fields, as their value class can't be found by its name.
+    """
+    return (self.__class__.__bases__[0], tuple((getattr(self, name) for name in self._meta.fields)))
+
+@lru_cache(maxsize=INIT_CODE_CACHE_SIZE)
+def get_init_code(field_names):
+    """
+    Gets the code of an `__init__` setting the given fields from positional or
+    keyword arguments, like the one generated by `dataclasses`. It is compiled
+    once per tuple of field names (the `INIT_CODE_CACHE_SIZE` most recently used
+    tuples are cached), the defaults are given to each function.
+    """
+    for name in field_names:
+        if not name.isidentifier() or iskeyword(name):
+            raise TypeError(f'Field names must be valid identifiers: {name!r}')
+    self_name = '__dataclass_self__' if 'self' in field_names else 'self'
+    arguments = ''.join((f', {name}=None' for name in field_names))
+    body = ''.join((f'\n    {self_name}.{name} = {name}' for name in field_names)) or '\n    pass'
+    namespace = {}
+    exec(f'def __init__({self_name}{arguments}):{body}', {}, namespace)
+    return namespace['__init__'].__code__
+
+def get_init_defaults(fields):
+    """
+    Gets the defaults of the `__init__` arguments from the default values of the
+    fields. Like `dataclasses`, mutable (unhashable) defaults are rejected, as
+    they would be shared by every instance.
+    """
+    defaults = []
+    for name, field in fields.items():
+        default = field.default_value if isinstance(field, Field) else None
+        if default.__class__.__hash__ is None:
+            raise ValueError(f'mutable default {type(default)} for field {name} is not allowed: use default_factory')
+        defaults.append(default)
+    return tuple(defaults)
+
+def objecttype_eq(self, other):
+    if other.__class__ is self.__class__:
+        field_names = self._meta.fields
+        return [getattr(self, name) for name in field_names] == [getattr(other, name) for name in field_names]
+    return NotImplemented
+
+@recursive_repr()
+def objecttype_repr(self):
+    fields = ', '.join((f'{name}={getattr(self, name)!r}' for name in self._meta.fields))
+    return f'{self.__class__.__qualname__}({fields})'
+
 class ObjectType(BaseType, metaclass=ObjectTypeMeta):
     """
     Object Type Definition
@@ -101,6 +169,10 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
             key with the same name as the field.
         fields (Dict[str, graphene.Field]): Dictionary of field name to Field. Not recommended to
             use (prefer class attributes).
+        slots (bool): Store the fields of the value objects in ``__slots__`` instead of an instance
+            ``__dict__``, which uses less memory for large lists of value objects. The instances
+            are created from a slotted subclass (so ``type(obj) is Cls`` is false, use
+            ``isinstance``) and can only hold the fields. Defaults to False.
 
     An _ObjectType_ can be used as a simple value object by creating an instance of the class.
 
@@ -113,9 +185,10 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
         *args (List[Any]): Positional values to use for Field values of value object
         **kwargs (Dict[str: Any]): Keyword arguments to use for Field values of value object
     """
+    __slots__ = ()
 
     @classmethod
-    def __init_subclass_with_meta__(cls, interfaces=(), possible_types=(), default_resolver=None, _meta=None, **options):
+    def __init_subclass_with_meta__(cls, interfaces=(), possible_types=(), default_resolver=None, slots=False, _meta=None, **options):
         if not _meta:
             _meta = ObjectTypeOptions(cls)
         fields = {}
@@ -133,5 +206,6 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
             _meta.interfaces = interfaces
         _meta.possible_types = possible_types
         _meta.default_resolver = default_resolver
+        _meta.slots = slots
         super(ObjectType, cls).__init_subclass_with_meta__(_meta=_meta, **options)
     is_type_of = None
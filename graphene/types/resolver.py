@@ -1 +1,35 @@
-default_resolver = dict_or_attr_resolver
\ No newline at end of file
+from functools import partial
+default_resolver = dict_or_attr_resolver
+
+def inlined_dict_or_attr_resolver(attname, default_value, root, info, **args):
+    """Same as `dict_or_attr_resolver`, without the call of a second resolver for each value."""
+    if isinstance(root, dict):
+        return root.get(attname, default_value)
+    return getattr(root, attname, default_value)
+
+def get_default_resolver_for_type(graphene_type, attname, default_value, is_root_type=False):
+    """
+    Gets the default resolver of the field `attname` of an ObjectType, bound
+    to the field name and default value.
+
+    The stock `dict_or_attr_resolver` is specialized for the parent values of
+    the type: when `Meta.possible_types` are all dicts (or none is), every
+    value is checked against them by `is_type_of` before its fields are
+    resolved, so a key (or attribute) lookup is enough. Otherwise the check
+    is inlined. The root value of the root types (`is_root_type`) is never
+    checked by `is_type_of`, so their check is always inlined. A default
+    resolver set on the type or globally is used as is.
+    """
+    resolver = graphene_type._meta.default_resolver or get_default_resolver()
+    if resolver is dict_or_attr_resolver:
+        resolver = inlined_dict_or_attr_resolver if is_root_type else get_dict_or_attr_resolver(graphene_type._meta.possible_types)
+    return partial(resolver, attname, default_value)
+
+def get_dict_or_attr_resolver(possible_types):
+    if possible_types:
+        dict_types = [issubclass(possible_type, dict) for possible_type in possible_types]
+        if all(dict_types):
+            return dict_resolver
+        if not any(dict_types):
+            return attr_resolver
+    return inlined_dict_or_attr_resolver
@@ -1,9 +1,16 @@
+from asyncio import gather
+from collections.abc import Mapping
 from enum import Enum as PyEnum
 import inspect
 from functools import partial
-from graphql import default_type_resolver, get_introspection_query, graphql, graphql_sync, introspection_types, parse, print_schema, subscribe, validate, ExecutionResult, GraphQLArgument, GraphQLBoolean, GraphQLError, GraphQLEnumValue, GraphQLField, GraphQLFloat, GraphQLID, GraphQLInputField, GraphQLInt, GraphQLList, GraphQLNonNull, GraphQLObjectType, GraphQLSchema, GraphQLString
+from inspect import isawaitable
+from threading import Lock
+from graphql import default_type_resolver, execute, execute_sync, get_introspection_query, graphql, graphql_sync, introspection_types, parse, print_schema, subscribe, validate, ExecutionResult, GraphQLArgument, GraphQLBoolean, GraphQLError, GraphQLEnumValue, GraphQLField, GraphQLFloat, GraphQLID, GraphQLInputField, GraphQLInt, GraphQLList, GraphQLNonNull, GraphQLObjectType, GraphQLSchema, GraphQLString
 from ..utils.str_converters import to_camel_case
+from ..utils.crunch import crunch
+from ..utils.document_cache import DocumentCache, parse_and_validate
 from ..utils.get_unbound_function import get_unbound_function
+from ..utils.run_in_executor import execution_mode
 from .definitions import GrapheneEnumType, GrapheneGraphQLType, GrapheneInputObjectType, GrapheneInterfaceType, GrapheneObjectType, GrapheneScalarType, GrapheneUnionType
 from .dynamic import Dynamic
 from .enum import Enum
@@ -11,13 +18,14 @@ from .field import Field
 from .inputobjecttype import InputObjectType
 from .interface import Interface
 from .objecttype import ObjectType
-from .resolver import get_default_resolver
+from .resolver import get_default_resolver_for_type
 from .scalars import ID, Boolean, Float, Int, Scalar, String
 from .structures import List, NonNull
 from .union import Union
 from .utils import get_field_as
 introspection_query = get_introspection_query()
 IntrospectionSchema = introspection_types['__Schema']
+graphql_signatures = {graphql: inspect.signature(graphql), graphql_sync: inspect.signature(graphql_sync)}
 
 class TypeMap(dict):
 
@@ -30,12 +38,43 @@ class TypeMap(dict):
         for type_ in types:
             assert is_graphene_type(type_)
         self.auto_camelcase = auto_camelcase
+        self.root_types = (query, mutation, subscription)
         create_graphql_type = self.add_type
         self.query = create_graphql_type(query) if query else None
         self.mutation = create_graphql_type(mutation) if mutation else None
         self.subscription = create_graphql_type(subscription) if subscription else None
         self.types = [create_graphql_type(graphene_type) for graphene_type in types]
 
+    def create_fields_for_type(self, graphene_type, is_input_type=False):
+        create_graphql_type = self.add_type
+        fields = {}
+        for name, field in graphene_type._meta.fields.items():
+            if isinstance(field, Dynamic):
+                field = get_field_as(field.get_type(self), _as=Field)
+                if not field:
+                    continue
+            field_type = create_graphql_type(field.type)
+            if is_input_type:
+                _field = GraphQLInputField(field_type, default_value=field.default_value, out_name=name, description=field.description, deprecation_reason=field.deprecation_reason)
+            else:
+                args = {}
+                for arg_name, arg in field.args.items():
+                    arg_type = create_graphql_type(arg.type)
+                    processed_arg_name = arg.name or self.get_name(arg_name)
+                    args[processed_arg_name] = GraphQLArgument(arg_type, out_name=arg_name, description=arg.description, default_value=arg.default_value, deprecation_reason=arg.deprecation_reason)
+                subscribe = field.wrap_subscribe(self.get_function_for_type(graphene_type, f'subscribe_{name}', name, field.default_value))
+                if subscribe:
+                    field_default_resolver = identity_resolve
+                elif issubclass(graphene_type, ObjectType):
+                    field_default_resolver = get_default_resolver_for_type(graphene_type, name, field.default_value, is_root_type=graphene_type in self.root_types)
+                else:
+                    field_default_resolver = None
+                resolve = field.wrap_resolve(self.get_function_for_type(graphene_type, f'resolve_{name}', name, field.default_value) or field_default_resolver)
+                _field = GraphQLField(field_type, args=args, resolve=resolve, subscribe=subscribe, deprecation_reason=field.deprecation_reason, description=field.description)
+            field_name = field.name or self.get_name(name)
+            fields[field_name] = _field
+        return fields
+
     def get_function_for_type(self, graphene_type, func_name, name, default_value):
         """Gets a resolve or subscribe function for a given ObjectType"""
         if isinstance(graphene_type, GrapheneGraphQLType):
@@ -67,14 +106,80 @@ class Schema:
             and @skip) [GraphQLIncludeDirective, GraphQLSkipDirective].
         auto_camelcase (bool): Fieldnames will be transformed in Schema's TypeMap from snake_case
             to camelCase (preferred by GraphQL standard). Default True.
+        document_cache (DocumentCache, optional): Cache of parsed and validated documents reused
+            by `execute` and `execute_async` for repeated query strings. Defaults to no caching.
+        lazy (bool): Defer the conversion of the Graphene types into the GraphQL schema until it is
+            first needed (by an execution, introspection, printing the schema or accessing
+            `graphql_schema`), instead of doing it when the Schema is created. Errors in the type
+            definitions are then raised on first use. Default False.
     """
 
-    def __init__(self, query=None, mutation=None, subscription=None, types=None, directives=None, auto_camelcase=True):
+    def __init__(self, query=None, mutation=None, subscription=None, types=None, directives=None, auto_camelcase=True, document_cache=None, lazy=False):
+        assert document_cache is None or isinstance(document_cache, DocumentCache), f'Schema document_cache must be a DocumentCache instance, received "{document_cache}".'
+        self._graphql_schema = None
+        self._graphql_schema_lock = Lock()
         self.query = query
         self.mutation = mutation
         self.subscription = subscription
-        type_map = TypeMap(query, mutation, subscription, types, auto_camelcase=auto_camelcase)
-        self.graphql_schema = GraphQLSchema(type_map.query, type_map.mutation, type_map.subscription, type_map.types, directives)
+        self.types = types
+        self.directives = directives
+        self.auto_camelcase = auto_camelcase
+        self.document_cache = document_cache
+        if not lazy:
+            self.build_graphql_schema()
+
+    @property
+    def graphql_schema(self):
+        """The graphql-core schema, built on first access if the Schema is lazy."""
+        if self._graphql_schema is None:
+            self.build_graphql_schema()
+        return self._graphql_schema
+
+    def build_graphql_schema(self):
+        """Convert the Graphene types into the graphql-core schema (once)."""
+        with self._graphql_schema_lock:
+            if self._graphql_schema is None:
+                type_map = TypeMap(self.query, self.mutation, self.subscription, self.types, auto_camelcase=self.auto_camelcase)
+                self._graphql_schema = GraphQLSchema(type_map.query, type_map.mutation, type_map.subscription, type_map.types, self.directives)
+        return self._graphql_schema
+
+    def dump(self, path):
+        """Write a snapshot of the GraphQL schema to a file.
+        The snapshot keeps the fully built GraphQL types (fields, arguments and their defaults,
+        and the links to the Graphene types), so that `Schema.load` restores the schema without
+        converting the Graphene types again, for instance in each forked worker of a server.
+        The Graphene types, resolvers and other functions are stored by reference, so they must
+        be importable when the snapshot is loaded (the types nested in a module level type, like
+        the edges of connections, are found through `resolvers_module`).
+        Args:
+            path (str or PathLike): Path of the snapshot file.
+        """
+        from .snapshot import dump_schema
+        with open(path, 'wb') as file:
+            dump_schema(self, file)
+
+    @classmethod
+    def load(cls, path, resolvers_module=None):
+        """Load a schema from a snapshot written by `Schema.dump`.
+        Args:
+            path (str or PathLike): Path of the snapshot file.
+            resolvers_module (module or str, optional): Module (or import path of the module)
+                defining the Graphene types and resolvers of the schema. It is imported before
+                the snapshot is read, and the Graphene types which cannot be imported by their
+                qualified name are looked up in it.
+        Raises:
+            pickle.UnpicklingError: If the snapshot was written with another format or version of
+                Graphene, does not match the current Graphene types, or refers to globals which
+                are not allowed in snapshots.
+        Returns:
+            :obj:`Schema` using the GraphQL schema of the snapshot.
+        """
+        from .snapshot import load_schema
+        with open(path, 'rb') as file:
+            options, graphql_schema = load_schema(file, resolvers_module)
+        schema = cls(lazy=True, **options)
+        schema._graphql_schema = graphql_schema
+        return schema
 
     def __str__(self):
         return print_schema(self.graphql_schema)
@@ -85,6 +190,8 @@ class Schema:
         by accessing its attrs.
         Example: using schema.Query for accessing the "Query" type in the Schema
         """
+        if type_name in ('graphql_schema', '_graphql_schema'):
+            raise AttributeError(type_name)
         _type = self.graphql_schema.get_type(type_name)
         if _type is None:
             raise AttributeError(f'Type "{type_name}" not found in the Schema')
@@ -112,23 +219,150 @@ class Schema:
             middleware (List[SupportsGraphQLMiddleware]): Supply request level middleware as
                 defined in `graphql-core`.
             execution_context_class (ExecutionContext, optional): The execution context class
-                to use when resolving queries and mutations.
+                to use when resolving queries and mutations. Defaults to
+                `graphene.execution.LeafListExecutionContext`, which completes the lists of
+                built-in scalars in bulk.
+            deduplicate (bool, optional): Replace the objects (selecting `__typename` and `id`)
+                already present at the same path of the result with `{__typename, id}`, like
+                `graphene.utils.deduplicator.deflate`, while completing the result. Default False.
         Returns:
             :obj:`ExecutionResult` containing any data and errors for the operation.
         """
-        return graphql_sync(self.graphql_schema, *args, **kwargs)
+        kwargs = get_execute_kwargs(kwargs)
+        with execution_mode(is_async=False):
+            if self.document_cache is None:
+                return graphql_sync(self.graphql_schema, *args, **kwargs)
+            return self._execute_cached(self.document_cache, args, kwargs)
 
     async def execute_async(self, *args, **kwargs):
         """Execute a GraphQL query on the schema asynchronously.
         Same as `execute`, but uses `graphql` instead of `graphql_sync`.
         """
-        return await graphql(self.graphql_schema, *args, **kwargs)
+        kwargs = get_execute_kwargs(kwargs)
+        with execution_mode(is_async=True):
+            if self.document_cache is None:
+                return await graphql(self.graphql_schema, *args, **kwargs)
+            return await self._execute_async_cached(self.document_cache, args, kwargs)
+
+    def execute_batch(self, requests, **kwargs):
+        """Execute a batch of GraphQL requests on the schema.
+        Each request is a mapping in the common HTTP batching format, with a `query` and
+        optional `variables` and `operationName` keys. All the requests share the same
+        execution arguments (and thus the same `context` and its dataloaders) and the same
+        document cache, so repeated queries are only parsed and validated once per batch.
+        Args:
+            requests (List[dict]): GraphQL requests to execute, in order.
+            **kwargs: Any other argument accepted by `execute` (except the request string,
+                `variables` and `operation_name`), used for every request.
+        Returns:
+            List of :obj:`ExecutionResult`, one per request.
+        """
+        kwargs = get_execute_kwargs(kwargs)
+        document_cache = DocumentCache() if self.document_cache is None else self.document_cache
+        results = []
+        with execution_mode(is_async=False):
+            for request in requests:
+                request_kwargs = get_batch_request_kwargs(request)
+                if isinstance(request_kwargs, ExecutionResult):
+                    results.append(request_kwargs)
+                else:
+                    results.append(self._execute_cached(document_cache, (), dict(kwargs, **request_kwargs)))
+        return results
+
+    async def execute_batch_async(self, requests, **kwargs):
+        """Execute a batch of GraphQL requests on the schema asynchronously.
+        Same as `execute_batch`, but the requests are executed concurrently on the event loop,
+        so dataloaders in the shared `context` can coalesce loads across requests.
+        """
+        kwargs = get_execute_kwargs(kwargs)
+        document_cache = DocumentCache() if self.document_cache is None else self.document_cache
+
+        async def execute_request(request):
+            request_kwargs = get_batch_request_kwargs(request)
+            if isinstance(request_kwargs, ExecutionResult):
+                return request_kwargs
+            return await self._execute_async_cached(document_cache, (), dict(kwargs, **request_kwargs))
+        with execution_mode(is_async=True):
+            return list(await gather(*(execute_request(request) for request in requests)))
+
+    def _execute_cached(self, document_cache, args, kwargs):
+        document, errors, execute_kwargs = self._get_cached_document(document_cache, graphql_sync, args, kwargs)
+        if errors:
+            return ExecutionResult(data=None, errors=errors)
+        return execute_sync(self.graphql_schema, document, **execute_kwargs)
+
+    async def _execute_async_cached(self, document_cache, args, kwargs):
+        document, errors, execute_kwargs = self._get_cached_document(document_cache, graphql, args, kwargs)
+        if errors:
+            return ExecutionResult(data=None, errors=errors)
+        result = execute(self.graphql_schema, document, **execute_kwargs)
+        if isawaitable(result):
+            return await result
+        return result
+
+    def _get_cached_document(self, document_cache, graphql_function, args, kwargs):
+        """
+        Binds the execution arguments like `graphql_function` would and looks up the
+        request string in the document cache.
+        """
+        execute_kwargs = graphql_signatures[graphql_function].bind(self.graphql_schema, *args, **kwargs).arguments
+        del execute_kwargs['schema']
+        document, errors = document_cache.get(self.graphql_schema, execute_kwargs.pop('source'))
+        return (document, errors, execute_kwargs)
+
+    def compile(self, query, operation_name=None):
+        """Compile a GraphQL query into a reusable execution plan.
+        The query is parsed and validated once (using the document cache if the schema has one).
+        Executing the returned plan skips field collection and the per-field lookups of
+        definitions, resolvers, constant arguments and leaf serializers done by `execute`.
+        Args:
+            query (str): GraphQL request (query or mutation) as string.
+            operation_name (str, optional): If multiple operations are provided in the
+                query, an operation name must be provided for the result to be provided.
+        Returns:
+            :obj:`CompiledQuery` with `execute` and `execute_async` methods accepting the
+            remaining arguments of `Schema.execute`.
+        """
+        from ..execution.compiled import CompiledQuery
+        if self.document_cache is None:
+            document, errors = parse_and_validate(self.graphql_schema, query)
+        else:
+            document, errors = self.document_cache.get(self.graphql_schema, query)
+        return CompiledQuery(self, document, errors, operation_name=operation_name)
+
+    @staticmethod
+    def crunch_result(execution_result):
+        """Crunch the data of an execution result.
+        The data is flattened into a list of unique values in which lists and objects refer to
+        their items by position, like graphql-crunch does, which makes responses repeating the
+        same values much smaller. Use `graphene.utils.crunch.uncrunch` to restore the data.
+        Args:
+            execution_result (ExecutionResult): Result of `execute` or `execute_async`.
+        Returns:
+            :obj:`ExecutionResult` with the crunched data and the same errors and extensions.
+        """
+        if execution_result.data is None:
+            return execution_result
+        return ExecutionResult(data=crunch(execution_result.data), errors=execution_result.errors, extensions=execution_result.extensions)
 
     async def subscribe(self, query, *args, **kwargs):
         """Execute a GraphQL subscription on the schema asynchronously."""
         document = parse(query)
         return await subscribe(self.graphql_schema, document, *args, **kwargs)
 
+def get_batch_request_kwargs(request):
+    """Get the execute keyword arguments of a request in the HTTP batching format"""
+    if not isinstance(request, Mapping) or not request.get('query'):
+        return ExecutionResult(data=None, errors=[GraphQLError('Must provide query string.')])
+    return {'source': request['query'], 'variable_values': request.get('variables'), 'operation_name': request.get('operationName')}
+
+def get_execute_kwargs(kwargs):
+    """Normalize the keyword arguments of an execution, completing leaf lists in bulk by default"""
+    if kwargs.get("execution_context_class") is None:
+        from ..execution.leaf_lists import LeafListExecutionContext
+        kwargs["execution_context_class"] = LeafListExecutionContext
+    return normalize_execute_kwargs(kwargs)
+
 def normalize_execute_kwargs(kwargs):
     """Replace alias names in keyword arguments for graphql()"""
     for old, new in [
@@ -138,4 +372,7 @@ def normalize_execute_kwargs(kwargs):
     ]:
         if old in kwargs:
             kwargs[new] = kwargs.pop(old)
+    if kwargs.pop("deduplicate", False):
+        from ..execution.deduplication import get_deduplicating_execution_context_class
+        kwargs["execution_context_class"] = get_deduplicating_execution_context_class(kwargs.get("execution_context_class"))
     return kwargs
@@ -0,0 +1,343 @@
+import gc
+import sys
+from enum import Enum as PyEnum
+from functools import partial
+from hashlib import sha256
+from importlib import import_module
+from io import BytesIO
+from pickle import HIGHEST_PROTOCOL, Pickler, Unpickler, UnpicklingError
+from types import FunctionType, MethodType
+from graphql import GraphQLDirective, GraphQLNamedType, specified_directives
+from .. import __version__
+from ..utils.subclass_with_meta import SubclassWithMeta_Meta
+from .base import BaseType
+from .definitions import GrapheneEnumType
+from .enum import Enum
+from .inputobjecttype import InputObjectTypeContainer
+from .resolver import attr_resolver, dict_or_attr_resolver, dict_resolver, inlined_dict_or_attr_resolver
+from .schema import TypeMap
+SNAPSHOT_MAGIC = b'graphene-schema-snapshot\n'
+SNAPSHOT_VERSION = 1
+type_functions = ('is_type_of', 'resolve_type', 'serialize', 'parse_value', 'parse_literal', 'out_type')
+field_functions = ('resolve', 'subscribe')
+default_resolvers = {resolver.__name__: resolver for resolver in (attr_resolver, dict_resolver, dict_or_attr_resolver, inlined_dict_or_attr_resolver)}
+value_classes = {('builtins', 'set'), ('builtins', 'frozenset'), ('builtins', 'bytearray'), ('builtins', 'complex'), ('collections', 'OrderedDict'), ('datetime', 'date'), ('datetime', 'datetime'), ('datetime', 'time'), ('datetime', 'timedelta'), ('datetime', 'timezone'), ('decimal', 'Decimal'), ('functools', 'partial'), ('uuid', 'UUID')}
+thunk_attributes = {'_fields': 'fields', '_interfaces': 'interfaces', '_types': 'types'}
+specified_directive_names = {id(directive): directive.name for directive in specified_directives}
+
+def dump_schema(schema, file):
+    """
+    Writes a snapshot of the GraphQL schema of a Graphene schema to a binary file.
+
+    The GraphQL types are stored as empty shells first and their attributes
+    (fields, arguments, interfaces...) afterwards, so that loading the snapshot
+    does not go through the constructors and validations of graphql-core, nor
+    recurses along the references between types.
+
+    Graphene types, resolvers and other functions are stored by reference, like
+    pickle does. The Graphene types which cannot be imported by their qualified
+    name (like the edges of connections) are stored by name. The functions that
+    cannot be pickled (like lambdas) are rebuilt from their Graphene type when
+    the snapshot is loaded.
+
+    The snapshot starts with its format version, the version of Graphene and
+    a fingerprint of the Graphene types, checked by :func:`load_schema`.
+    """
+    graphql_schema = schema.graphql_schema
+    named_types = [type_ for type_ in graphql_schema.type_map.values() if not is_reserved_type(type_)]
+    pickler = SchemaPickler(file, schema.auto_camelcase)
+    pickler.register_types(named_types)
+    options = {'query': schema.query, 'mutation': schema.mutation, 'subscription': schema.subscription, 'types': schema.types, 'directives': schema.directives, 'auto_camelcase': schema.auto_camelcase}
+    file.write(SNAPSHOT_MAGIC)
+    pickler.dump((SNAPSHOT_VERSION, __version__, get_types_fingerprint(named_types)))
+    pickler.dump((options, named_types, [get_type_state(type_) for type_ in named_types], graphql_schema))
+
+def load_schema(file, resolvers_module=None):
+    """
+    Reads a snapshot written by :func:`dump_schema`, returning the options of
+    the Graphene schema and its GraphQL schema.
+
+    `resolvers_module` (a module or its import path) is imported first. The
+    Graphene types stored by name are looked up in it, among its module level
+    types and their nested types.
+
+    Raises an `UnpicklingError` if the snapshot was written with another
+    format or version of Graphene, or if the Graphene types do not match the
+    ones it was written with (their fields, interfaces, members or enum values).
+    """
+    if isinstance(resolvers_module, str):
+        resolvers_module = import_module(resolvers_module)
+    if file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+        raise UnpicklingError('The file is not a Graphene schema snapshot.')
+    unpickler = SchemaUnpickler(file, resolvers_module)
+    version, graphene_version, fingerprint = unpickler.load()
+    if version != SNAPSHOT_VERSION:
+        raise UnpicklingError(f'The schema snapshot has the format version {version}, {SNAPSHOT_VERSION} was expected. The schema must be dumped again.')
+    if graphene_version != __version__:
+        raise UnpicklingError(f'The schema snapshot was written with Graphene {graphene_version}, not {__version__}. The schema must be dumped again.')
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        options, named_types, states, graphql_schema = unpickler.load()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    for type_, state in zip(named_types, states):
+        type_.__dict__.update(state)
+    if get_types_fingerprint(named_types) != fingerprint:
+        raise UnpicklingError('The schema snapshot does not match the Graphene types it was written with. The schema must be dumped again.')
+    return (options, graphql_schema)
+
+class SchemaPickler(Pickler):
+
+    def __init__(self, file, auto_camelcase=True):
+        super().__init__(file, HIGHEST_PROTOCOL)
+        self.auto_camelcase = auto_camelcase
+        self.enum_types = {}
+        self.function_ids = {}
+        self.graphene_type_ids = {}
+
+    def register_types(self, named_types):
+        """
+        Registers the enums of the schema and the functions of its types and
+        fields which cannot be pickled.
+        """
+        functions = {}
+        for type_ in named_types:
+            if isinstance(type_, GrapheneEnumType):
+                self.enum_types[type_.graphene_type._meta.enum] = type_.graphene_type
+        for type_ in named_types:
+            graphene_type = getattr(type_, 'graphene_type', None)
+            if graphene_type is None:
+                continue
+            for function_name in type_functions:
+                function = type_.__dict__.get(function_name)
+                if function is not None:
+                    functions.setdefault(id(function), (function, ('type', graphene_type, self.auto_camelcase, function_name)))
+            for field_name, field in getattr(type_, 'fields', {}).items():
+                for function_name in field_functions:
+                    function = getattr(field, function_name, None)
+                    if function is not None:
+                        functions.setdefault(id(function), (function, ('field', graphene_type, self.auto_camelcase, field_name, function_name)))
+        if self.is_picklable([function for function, _ in functions.values()]):
+            return
+        for function, persistent_id in functions.values():
+            if not self.is_picklable(function):
+                self.function_ids[id(function)] = persistent_id
+
+    def is_picklable(self, obj):
+        pickler = SchemaPickler(BytesIO(), self.auto_camelcase)
+        pickler.enum_types = self.enum_types
+        pickler.graphene_type_ids = self.graphene_type_ids
+        try:
+            pickler.dump(obj)
+        except Exception:
+            return False
+        return True
+
+    def persistent_id(self, obj):
+        if isinstance(obj, SubclassWithMeta_Meta):
+            persistent_id = self.graphene_type_ids.get(obj)
+            if persistent_id is None:
+                persistent_id = self.graphene_type_ids[obj] = get_graphene_type_id(obj)
+            return persistent_id or None
+        if self.function_ids:
+            return self.function_ids.get(id(obj))
+        return None
+
+    def reducer_override(self, obj):
+        if isinstance(obj, GraphQLNamedType):
+            if is_reserved_type(obj):
+                return (get_reserved_type, (obj.name,))
+            return (create_type_shell, (obj.__class__,))
+        if isinstance(obj, PyEnum):
+            graphene_enum = self.enum_types.get(obj.__class__)
+            if graphene_enum is not None:
+                return (get_enum_member, (graphene_enum, obj.name))
+        elif isinstance(obj, GraphQLDirective) and id(obj) in specified_directive_names:
+            return (get_specified_directive, (obj.name,))
+        elif isinstance(obj, MethodType) and (is_graphene_type(obj.__self__) or isinstance(obj.__self__, TypeMap)):
+            return (get_method, (obj.__self__, obj.__func__.__name__))
+        elif isinstance(obj, partial) and default_resolvers.get(getattr(obj.func, '__name__', None)) is obj.func and (not obj.keywords) and (len(obj.args) == 2):
+            return (get_default_resolver, (obj.func.__name__, *obj.args))
+        return NotImplemented
+
+class SchemaUnpickler(Unpickler):
+    """
+    Unpickler of schema snapshots, only loading the classes of graphql-core
+    and Graphene, the Graphene types and their functions, the functions and
+    classes of the (already imported) modules defining Graphene types and a
+    few value classes (like `datetime` and `Decimal`) used as default values.
+    """
+
+    def __init__(self, file, resolvers_module=None):
+        super().__init__(file)
+        self.resolvers_module = resolvers_module
+        self.graphene_types = None
+        self.type_maps = {}
+        self.fields = {}
+
+    def find_class(self, module, name):
+        if module in sys.modules or module.partition('.')[0] in ('graphene', 'graphql'):
+            obj = super().find_class(module, name)
+            if is_allowed_global(obj, module, name):
+                return obj
+        raise UnpicklingError(f'Global "{module}.{name}" is not allowed in schema snapshots.')
+
+    def persistent_load(self, persistent_id):
+        kind = persistent_id[0]
+        if kind == 'graphene_type':
+            return self.get_graphene_type(persistent_id[1])
+        if kind == 'container' and is_graphene_type(persistent_id[1]):
+            return persistent_id[1]._meta.container
+        if kind == 'type' and persistent_id[3] in type_functions:
+            _, graphene_type, auto_camelcase, function_name = persistent_id
+            return getattr(self.get_type_map(auto_camelcase).add_type(graphene_type), function_name)
+        if kind == 'field' and persistent_id[4] in field_functions:
+            _, graphene_type, auto_camelcase, field_name, function_name = persistent_id
+            return getattr(self.get_fields(graphene_type, auto_camelcase)[field_name], function_name)
+        raise UnpicklingError(f'Unsupported persistent id {persistent_id!r} in schema snapshot.')
+
+    def get_graphene_type(self, name):
+        if self.graphene_types is None:
+            if self.resolvers_module is None:
+                raise UnpicklingError(f'Type "{name}" of the schema snapshot cannot be imported, a resolvers_module defining it must be given.')
+            self.graphene_types = get_graphene_types(self.resolvers_module)
+        graphene_type = self.graphene_types.get(name)
+        if graphene_type is None:
+            raise UnpicklingError(f'Type "{name}" of the schema snapshot was not found in {self.resolvers_module.__name__}.')
+        return graphene_type
+
+    def get_type_map(self, auto_camelcase):
+        type_map = self.type_maps.get(auto_camelcase)
+        if type_map is None:
+            type_map = self.type_maps[auto_camelcase] = TypeMap(auto_camelcase=auto_camelcase)
+        return type_map
+
+    def get_fields(self, graphene_type, auto_camelcase):
+        key = (graphene_type, auto_camelcase)
+        fields = self.fields.get(key)
+        if fields is None:
+            fields = self.fields[key] = self.get_type_map(auto_camelcase).create_fields_for_type(graphene_type)
+        return fields
+
+def get_graphene_types(module):
+    """
+    Gets the Graphene types defined at the module level and nested in them
+    (like `Connection.Edge`), by name.
+    """
+    graphene_types = {}
+    stack = [value for value in vars(module).values() if is_graphene_type(value)]
+    while stack:
+        graphene_type = stack.pop()
+        graphene_types.setdefault(graphene_type._meta.name, graphene_type)
+        stack.extend((value for value in vars(graphene_type).values() if is_graphene_type(value) and value._meta.name not in graphene_types))
+    return graphene_types
+
+def get_graphene_type_id(cls):
+    """
+    Gets the persistent id of a Graphene type (or of the container of an input
+    object type) which cannot be imported, False otherwise.
+    """
+    if is_importable(cls):
+        return False
+    if is_graphene_type(cls):
+        return ('graphene_type', cls._meta.name)
+    if issubclass(cls, InputObjectTypeContainer):
+        return ('container', next((base for base in cls.__mro__ if is_graphene_type(base))))
+    return False
+
+def is_allowed_global(obj, module, name):
+    """
+    Returns whether a global can be loaded from a schema snapshot (see
+    :class:`SchemaUnpickler`).
+    """
+    if obj in snapshot_functions or is_graphene_type(obj) or (module, name) in value_classes:
+        return True
+    if isinstance(obj, FunctionType):
+        owner_name, _, function_name = name.rpartition('.')
+        if owner_name:
+            return not function_name.startswith('_') and is_graphene_type(find_global(module, owner_name))
+        return obj.__module__ == module and defines_graphene_types(module)
+    if not isinstance(obj, type):
+        return module.partition('.')[0] == 'graphql' and (not callable(obj))
+    if module.partition('.')[0] in ('graphene', 'graphql'):
+        return True
+    return obj.__module__ == module and defines_graphene_types(module)
+
+def find_global(module, name):
+    found = sys.modules[module]
+    for part in name.split('.'):
+        found = getattr(found, part, None)
+    return found
+
+def defines_graphene_types(module):
+    return any((is_graphene_type(value) for value in vars(sys.modules[module]).values()))
+
+def is_graphene_type(value):
+    return isinstance(value, type) and issubclass(value, BaseType) and ('_meta' in vars(value))
+
+def is_importable(obj):
+    try:
+        found = import_module(obj.__module__)
+        for name in obj.__qualname__.split('.'):
+            found = getattr(found, name)
+    except (AttributeError, ImportError, TypeError):
+        return False
+    return found is obj
+
+def is_reserved_type(type_):
+    return GraphQLNamedType.reserved_types.get(type_.name) is type_
+
+def get_reserved_type(name):
+    return GraphQLNamedType.reserved_types[name]
+
+def get_specified_directive(name):
+    for directive in specified_directives:
+        if directive.name == name:
+            return directive
+
+def create_type_shell(cls):
+    if not (isinstance(cls, type) and issubclass(cls, GraphQLNamedType)):
+        raise UnpicklingError(f'{cls!r} is not a GraphQL type.')
+    return object.__new__(cls)
+
+def get_enum_member(graphene_enum, name):
+    if not (is_graphene_type(graphene_enum) and issubclass(graphene_enum, Enum)):
+        raise UnpicklingError(f'{graphene_enum!r} is not a Graphene enum.')
+    return graphene_enum[name]
+
+def get_method(owner, name):
+    if not (is_graphene_type(owner) or isinstance(owner, TypeMap)) or name.startswith('_'):
+        raise UnpicklingError(f'Method "{name}" of {owner!r} is not allowed in schema snapshots.')
+    return getattr(owner, name)
+
+def get_default_resolver(resolver_name, attname, default_value):
+    if not isinstance(attname, str) or attname.startswith('__'):
+        raise UnpicklingError(f'Invalid field name {attname!r} in schema snapshot.')
+    return partial(default_resolvers[resolver_name], attname, default_value)
+
+def get_types_fingerprint(named_types):
+    """
+    Gets a fingerprint of the Graphene types of GraphQL types: their names,
+    fields, interfaces, members and enum values.
+    """
+    descriptions = []
+    for type_ in named_types:
+        graphene_type = getattr(type_, 'graphene_type', None)
+        meta = getattr(graphene_type, '_meta', None)
+        if meta is None:
+            descriptions.append((type_.name,))
+            continue
+        enum = getattr(meta, 'enum', None)
+        descriptions.append((type_.name, meta.name, tuple(getattr(meta, 'fields', None) or ()), tuple((interface._meta.name for interface in getattr(meta, 'interfaces', None) or ())), tuple((member._meta.name for member in getattr(meta, 'types', None) or ())), tuple(enum.__members__) if enum is not None else ()))
+    return sha256(repr(descriptions).encode('utf-8')).hexdigest()
+
+snapshot_functions = (create_type_shell, get_reserved_type, get_specified_directive, get_enum_member, get_method, get_default_resolver)
+
+def get_type_state(type_):
+    state = dict(type_.__dict__)
+    for attribute, name in thunk_attributes.items():
+        if attribute in state:
+            state[attribute] = state[name] = getattr(type_, name)
+    return state
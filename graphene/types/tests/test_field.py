@@ -145,3 +145,45 @@ def test_field_source_argument_as_kw():
     assert isinstance(field.args["a"], Argument)
     assert isinstance(field.args["a"].type, NonNull)
     assert field.args["a"].type.of_type is False
+
+
+def test_field_wrap_resolve_returns_resolver():
+    def resolver(root, info):
+        return root
+
+    def parent_resolver(root, info):
+        return None
+
+    assert Field(String, resolver=resolver).wrap_resolve(parent_resolver) is resolver
+    assert Field(String).wrap_resolve(parent_resolver) is parent_resolver
+    assert Field(String).wrap_resolve(None) is None
+
+
+def test_field_wrap_resolve_source():
+    field = Field(String, source="value")
+    resolver = field.wrap_resolve(None)
+
+    assert resolver is field.resolver
+    assert resolver({"value": "test"}, None) == "test"
+
+
+def test_field_wrap_subscribe_returns_subscribe():
+    def subscribe(root, info):
+        return root
+
+    assert Field(String).wrap_subscribe(subscribe) is subscribe
+    assert Field(String).wrap_subscribe(None) is None
+
+
+def test_field_wrap_resolve_benchmark(benchmark):
+    def resolver(root, info):
+        return root
+
+    wrapped_resolver = Field(String, resolver=resolver).wrap_resolve(None)
+    roots = list(range(1000))
+
+    @benchmark
+    def resolve():
+        return [wrapped_resolver(root, None) for root in roots]
+
+    assert resolve == roots
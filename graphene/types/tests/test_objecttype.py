@@ -1,3 +1,5 @@
+from pickle import dumps, loads
+
 from pytest import raises
 
 from ..field import Field
@@ -5,7 +7,7 @@ from ..interface import Interface
 from ..objecttype import ObjectType
 from ..scalars import String
 from ..schema import Schema
-from ..structures import NonNull
+from ..structures import List, NonNull
 from ..unmountedtype import UnmountedType
 
 
@@ -208,6 +210,173 @@ def test_objecttype_container_benchmark(benchmark):
         Container(field1="field1", field2="field2")
 
 
+def test_objecttype_as_container_field_defaults():
+    class MyObjectType(ObjectType):
+        field1 = String(default_value="default")
+        field2 = String()
+
+    container = MyObjectType()
+    assert container.field1 == "default"
+    assert container.field2 is None
+
+
+def test_objecttype_as_container_mutable_field_default():
+    with raises(ValueError) as exc_info:
+
+        class MyObjectType(ObjectType):
+            field = List(String, default_value=[])
+
+    assert str(exc_info.value) == (
+        "mutable default <class 'list'> for field field is not allowed: use default_factory"
+    )
+
+
+def test_objecttype_as_container_field_named_self():
+    class MyObjectType(ObjectType):
+        self = String()
+
+    assert MyObjectType(self="1").self == "1"
+    assert repr(MyObjectType("1")).endswith("MyObjectType(self='1')")
+
+
+def test_objecttype_recursive_repr():
+    container = Container("1")
+    container.field2 = container
+    assert repr(container) == "Container(field1='1', field2=...)"
+
+
+def test_objecttype_eq_different_types():
+    class OtherContainer(ObjectType):
+        field1 = Field(MyType)
+        field2 = Field(MyType)
+
+    assert Container("1", "2") != OtherContainer("1", "2")
+
+
+def test_objecttypes_with_same_fields_share_init_code():
+    class OtherContainer(ObjectType):
+        field1 = Field(MyType)
+        field2 = Field(MyType)
+
+    assert OtherContainer.__init__.__code__ is Container.__init__.__code__
+    assert OtherContainer.__init__ is not Container.__init__
+
+
+class SlottedContainer(ObjectType):
+    class Meta:
+        slots = True
+
+    field1 = String()
+    field2 = String(default_value="default")
+
+
+def test_slotted_objecttype():
+    container = SlottedContainer("1")
+
+    assert isinstance(container, SlottedContainer)
+    assert SlottedContainer._meta.slots
+    assert not Container._meta.slots
+    assert not hasattr(container, "__dict__")
+    assert container.field1 == "1"
+    assert container.field2 == "default"
+    assert repr(container) == "SlottedContainer(field1='1', field2='default')"
+    assert container == SlottedContainer(field1="1")
+    assert container != SlottedContainer("2")
+    assert list(SlottedContainer._meta.fields) == ["field1", "field2"]
+    assert isinstance(SlottedContainer.field1, String)
+
+
+def test_slotted_objecttype_is_a_subclass():
+    container = SlottedContainer("1")
+
+    assert type(container) is not SlottedContainer
+    assert type(container).__qualname__ == "SlottedContainer"
+    assert issubclass(type(container), SlottedContainer)
+
+
+def test_slotted_objecttype_pickle():
+    container = SlottedContainer("1", ["2"])
+
+    unpickled = loads(dumps(container))
+    assert unpickled == container
+    assert type(unpickled) is type(container)
+    assert not hasattr(unpickled, "__dict__")
+
+
+def test_slotted_objecttype_rejects_other_attributes():
+    container = SlottedContainer()
+
+    with raises(AttributeError):
+        container.other = "other"
+
+
+def test_slotted_objecttype_class_option():
+    class MyObjectType(ObjectType, slots=True):
+        field = String()
+
+    assert MyObjectType._meta.slots
+    assert not hasattr(MyObjectType(field="1"), "__dict__")
+
+
+def test_slotted_objecttype_subclass():
+    class SubContainer(SlottedContainer):
+        class Meta:
+            slots = True
+
+        field3 = String()
+
+    class UnslottedSubContainer(SlottedContainer):
+        field3 = String()
+
+    container = SubContainer("1", "2", "3")
+    assert isinstance(container, SlottedContainer)
+    assert not hasattr(container, "__dict__")
+    assert (container.field1, container.field2, container.field3) == ("1", "2", "3")
+    unslotted_container = UnslottedSubContainer("1", "2", "3")
+    assert type(unslotted_container) is UnslottedSubContainer
+    assert unslotted_container.field3 == "3"
+
+
+def test_slotted_objecttype_query():
+    class Named(Interface):
+        name = String()
+
+    class Person(ObjectType):
+        class Meta:
+            interfaces = (Named,)
+            slots = True
+
+    class Query(ObjectType):
+        containers = List(SlottedContainer)
+        named = List(Named)
+
+        def resolve_containers(root, info):
+            return [SlottedContainer(str(i)) for i in range(3)]
+
+        def resolve_named(root, info):
+            return [Person(name="Luke")]
+
+    schema = Schema(query=Query, types=[Person])
+    result = schema.execute("{ containers { field2 } named { __typename name } }")
+
+    assert not result.errors
+    assert result.data == {
+        "containers": [{"field2": "default"}] * 3,
+        "named": [{"__typename": "Person", "name": "Luke"}],
+    }
+
+
+def test_objecttype_class_creation_benchmark(benchmark):
+    @benchmark
+    def create_objecttypes():
+        for i in range(5000):
+            type(
+                f"MyObjectType{i}",
+                (ObjectType,),
+                {"field1": String(), "field2": Field(MyType), "field3": String()},
+            )
+
+
 def test_generate_objecttype_description():
     class MyObjectType(ObjectType):
         """
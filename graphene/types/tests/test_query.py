@@ -357,6 +357,23 @@ def test_big_list_query_compiled_query_benchmark(benchmark):
     assert result.data == {"allInts": list(big_list)}
 
 
+def test_big_list_query_compiled_plan_benchmark(benchmark):
+    big_list = range(100000)
+
+    class Query(ObjectType):
+        all_ints = List(Int)
+
+        def resolve_all_ints(self, info):
+            return big_list
+
+    hello_schema = Schema(Query)
+    compiled_query = hello_schema.compile("{ allInts }")
+
+    result = benchmark(compiled_query.execute)
+    assert not result.errors
+    assert result.data == {"allInts": list(big_list)}
+
+
 def test_big_list_of_containers_query_benchmark(benchmark):
     class Container(ObjectType):
         x = Int()
@@ -377,6 +394,36 @@ def test_big_list_of_containers_query_benchmark(benchmark):
     assert result.data == {"allContainers": [{"x": c.x} for c in big_container_list]}
 
 
+def test_big_list_of_slotted_containers_multiple_fields_query_benchmark(benchmark):
+    class Container(ObjectType):
+        class Meta:
+            slots = True
+
+        x = Int()
+        y = Int()
+        z = Int()
+        o = Int()
+
+    big_container_list = [Container(x=x, y=x, z=x, o=x) for x in range(1000)]
+
+    class Query(ObjectType):
+        all_containers = List(Container)
+
+        def resolve_all_containers(self, info):
+            return big_container_list
+
+    hello_schema = Schema(Query)
+
+    big_list_query = partial(hello_schema.execute, "{ allContainers { x, y, z, o } }")
+    result = benchmark(big_list_query)
+    assert not result.errors
+    assert result.data == {
+        "allContainers": [
+            {"x": c.x, "y": c.y, "z": c.z, "o": c.o} for c in big_container_list
+        ]
+    }
+
+
 def test_big_list_of_containers_multiple_fields_query_benchmark(benchmark):
     class Container(ObjectType):
         x = Int()
@@ -404,6 +451,32 @@ def test_big_list_of_containers_multiple_fields_query_benchmark(benchmark):
     }
 
 
+def test_big_list_of_dict_containers_multiple_fields_query_benchmark(benchmark):
+    class Container(ObjectType):
+        class Meta:
+            possible_types = (dict,)
+
+        x = Int()
+        y = Int()
+        z = Int()
+        o = Int()
+
+    big_container_list = [{"x": x, "y": x, "z": x, "o": x} for x in range(1000)]
+
+    class Query(ObjectType):
+        all_containers = List(Container)
+
+        def resolve_all_containers(self, info):
+            return big_container_list
+
+    hello_schema = Schema(Query)
+
+    big_list_query = partial(hello_schema.execute, "{ allContainers { x, y, z, o } }")
+    result = benchmark(big_list_query)
+    assert not result.errors
+    assert result.data == {"allContainers": big_container_list}
+
+
 def test_big_list_of_containers_multiple_fields_custom_resolvers_query_benchmark(
     benchmark,
 ):
@@ -445,6 +518,33 @@ def test_big_list_of_containers_multiple_fields_custom_resolvers_query_benchmark
     }
 
 
+def test_big_list_of_containers_multiple_fields_compiled_plan_benchmark(benchmark):
+    class Container(ObjectType):
+        x = Int()
+        y = Int()
+        z = Int()
+        o = Int()
+
+    big_container_list = [Container(x=x, y=x, z=x, o=x) for x in range(1000)]
+
+    class Query(ObjectType):
+        all_containers = List(Container)
+
+        def resolve_all_containers(self, info):
+            return big_container_list
+
+    hello_schema = Schema(Query)
+    compiled_query = hello_schema.compile("{ allContainers { x, y, z, o } }")
+
+    result = benchmark(compiled_query.execute)
+    assert not result.errors
+    assert result.data == {
+        "allContainers": [
+            {"x": c.x, "y": c.y, "z": c.z, "o": c.o} for c in big_container_list
+        ]
+    }
+
+
 def test_query_annotated_resolvers():
     context = Context(key="context")
 
@@ -1,10 +1,16 @@
+from ..field import Field
+from ..objecttype import ObjectType
 from ..resolver import (
     attr_resolver,
     dict_resolver,
     dict_or_attr_resolver,
     get_default_resolver,
+    get_default_resolver_for_type,
+    inlined_dict_or_attr_resolver,
     set_default_resolver,
 )
+from ..scalars import String
+from ..schema import Schema
 
 args = {}
 context = None
@@ -56,3 +62,110 @@ def test_set_default_resolver_workd():
     assert get_default_resolver() == dict_resolver
 
     set_default_resolver(default_resolver)
+
+
+def test_inlined_dict_or_attr_resolver():
+    resolved = inlined_dict_or_attr_resolver("attr", None, demo_dict, info, **args)
+    assert resolved == "value"
+
+    resolved = inlined_dict_or_attr_resolver("attr", None, demo_obj, info, **args)
+    assert resolved == "value"
+
+    resolved = inlined_dict_or_attr_resolver("attr2", "default", demo_obj, info)
+    assert resolved == "default"
+
+
+class DictSubclass(dict):
+    pass
+
+
+def get_type_default_resolver(**meta):
+    object_type = type("MyObjectType", (ObjectType,), {"Meta": meta, "attr": String()})
+    return get_default_resolver_for_type(object_type, "attr", "default")
+
+
+def test_default_resolver_for_type():
+    resolver = get_type_default_resolver()
+    assert resolver.func is inlined_dict_or_attr_resolver
+    assert resolver.args == ("attr", "default")
+    assert resolver(demo_dict, info) == "value"
+    assert resolver(demo_obj, info) == "value"
+
+
+def test_default_resolver_for_type_with_object_possible_types():
+    resolver = get_type_default_resolver(possible_types=(demo_obj,))
+    assert resolver.func is attr_resolver
+    assert resolver(demo_obj, info) == "value"
+
+
+def test_default_resolver_for_type_with_dict_possible_types():
+    resolver = get_type_default_resolver(possible_types=(dict, DictSubclass))
+    assert resolver.func is dict_resolver
+    assert resolver(demo_dict, info) == "value"
+
+
+def test_default_resolver_for_type_with_mixed_possible_types():
+    resolver = get_type_default_resolver(possible_types=(demo_obj, dict))
+    assert resolver.func is inlined_dict_or_attr_resolver
+
+
+def test_default_resolver_for_type_with_type_default_resolver():
+    def my_resolver(attname, default_value, root, info, **args):
+        return attname
+
+    resolver = get_type_default_resolver(
+        possible_types=(demo_obj,), default_resolver=my_resolver
+    )
+    assert resolver.func is my_resolver
+    assert resolver(demo_obj, info) == "attr"
+
+
+def test_default_resolver_for_type_with_global_default_resolver():
+    default_resolver = get_default_resolver()
+    set_default_resolver(attr_resolver)
+    try:
+        resolver = get_type_default_resolver(possible_types=(dict,))
+    finally:
+        set_default_resolver(default_resolver)
+    assert resolver.func is attr_resolver
+
+
+def test_schema_uses_default_resolver_for_type():
+    class DictType(ObjectType):
+        class Meta:
+            possible_types = (dict,)
+
+        attr = String(default_value="default")
+
+    class Query(ObjectType):
+        dict_type = String()
+        object_type = Field(DictType)
+
+    schema = Schema(Query)
+    graphql_schema = schema.graphql_schema
+
+    resolver = graphql_schema.get_type("DictType").fields["attr"].resolve
+    assert resolver.func is dict_resolver
+    assert resolver.args == ("attr", "default")
+    resolver = graphql_schema.query_type.fields["dictType"].resolve
+    assert resolver.func is inlined_dict_or_attr_resolver
+    result = schema.execute("{ objectType { attr } }", root={"object_type": {}})
+    assert result.data == {"objectType": {"attr": "default"}}
+
+
+def test_schema_root_type_with_possible_types():
+    class Query(ObjectType):
+        class Meta:
+            possible_types = (dict,)
+
+        a = String(default_value="default")
+
+    schema = Schema(query=Query)
+
+    resolver = schema.graphql_schema.query_type.fields["a"].resolve
+    assert resolver.func is inlined_dict_or_attr_resolver
+    result = schema.execute("{ a }")
+    assert not result.errors
+    assert result.data == {"a": "default"}
+    result = schema.execute("{ a }", root={"a": "value"})
+    assert result.data == {"a": "value"}
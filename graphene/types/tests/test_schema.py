@@ -1,13 +1,25 @@
+from os import getcwd
+from pickle import UnpicklingError, dumps
 from textwrap import dedent
+from types import ModuleType
 
-from pytest import raises
+from pytest import fixture, mark, raises
 
 from graphql.type import GraphQLObjectType, GraphQLSchema
 
+from ... import __version__
+from ...test import Client
+from ...utils.crunch import uncrunch
+from ..enum import Enum
 from ..field import Field
+from ..inputobjecttype import InputObjectType
+from ..interface import Interface
 from ..objecttype import ObjectType
-from ..scalars import String
+from ..resolver import attr_resolver
+from ..scalars import Int, String
 from ..schema import Schema
+from ..snapshot import SNAPSHOT_MAGIC, SNAPSHOT_VERSION
+from ..structures import List
 
 
 class MyOtherType(ObjectType):
@@ -72,3 +84,344 @@ def test_schema_requires_query_type():
     assert len(result.errors) == 1
     error = result.errors[0]
     assert error.message == "Query root type must be provided."
+
+
+class BatchQuery(ObjectType):
+    hello = String(name=String(default_value="World"))
+
+    def resolve_hello(root, info, name):
+        if info.context is not None:
+            info.context.append(name)
+        return f"Hello {name}"
+
+
+def test_schema_execute_batch():
+    schema = Schema(BatchQuery)
+    context = []
+    results = schema.execute_batch(
+        [
+            {"query": "{ hello }"},
+            {
+                "query": "query sayHello($name: String) { hello(name: $name) }",
+                "variables": {"name": "Peter"},
+            },
+            {
+                "query": "query A { a: hello } query B { b: hello }",
+                "operationName": "B",
+            },
+            {"query": "{ hello }"},
+        ],
+        context=context,
+    )
+
+    assert [result.errors for result in results] == [None] * 4
+    assert [result.data for result in results] == [
+        {"hello": "Hello World"},
+        {"hello": "Hello Peter"},
+        {"b": "Hello World"},
+        {"hello": "Hello World"},
+    ]
+    assert context == ["World", "Peter", "World", "World"]
+
+
+def test_schema_execute_batch_errors():
+    schema = Schema(BatchQuery)
+    results = schema.execute_batch(
+        [{"query": "{ goodbye }"}, {"variables": {}}, {"query": "{ hello }"}]
+    )
+
+    assert results[0].errors[0].message == "Cannot query field 'goodbye' on type 'BatchQuery'."
+    assert results[1].errors[0].message == "Must provide query string."
+    assert results[2].data == {"hello": "Hello World"}
+
+
+def test_schema_execute_batch_shares_document_cache():
+    from ...utils.document_cache import DocumentCache
+
+    cache = DocumentCache()
+    schema = Schema(BatchQuery, document_cache=cache)
+    schema.execute_batch([{"query": "{ hello }"}] * 3)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+@mark.asyncio
+async def test_schema_execute_batch_async_shares_dataloader():
+    from ...utils.dataloader import DataLoader
+
+    batches = []
+
+    async def load_names(keys):
+        batches.append(keys)
+        return [key.upper() for key in keys]
+
+    class Query(ObjectType):
+        shout = String(name=String(required=True))
+
+        async def resolve_shout(root, info, name):
+            return await info.context.load(name)
+
+    schema = Schema(Query)
+    results = await schema.execute_batch_async(
+        [
+            {"query": '{ shout(name: "a") }'},
+            {
+                "query": "query ($name: String!) { shout(name: $name) }",
+                "variables": {"name": "b"},
+            },
+            {"query": '{ shout(name: "a") }'},
+        ],
+        context=DataLoader(load_names),
+    )
+
+    assert [result.data for result in results] == [
+        {"shout": "A"},
+        {"shout": "B"},
+        {"shout": "A"},
+    ]
+    assert batches == [["a", "b"]]
+
+
+class CrunchQuery(ObjectType):
+    values = Field(List(String))
+
+    def resolve_values(root, info):
+        return ["a", "b", "a"]
+
+
+def test_schema_crunch_result():
+    schema = Schema(CrunchQuery)
+
+    result = Schema.crunch_result(schema.execute("{ values }"))
+
+    assert not result.errors
+    assert result.data == ["a", "b", [0, 1, 0], {"values": 2}]
+    assert uncrunch(result.data) == {"values": ["a", "b", "a"]}
+
+
+def test_schema_crunch_result_without_data():
+    schema = Schema(CrunchQuery)
+    result = schema.execute("{ unknown }")
+
+    assert Schema.crunch_result(result) is result
+
+
+def test_client_crunch():
+    client = Client(Schema(CrunchQuery), crunch=True)
+
+    assert client.execute("{ values }") == {
+        "data": ["a", "b", [0, 1, 0], {"values": 2}]
+    }
+
+
+def test_lazy_schema():
+    schema = Schema(Query, lazy=True)
+
+    assert schema._graphql_schema is None
+    assert schema.execute("{ inner { field } }").data == {"inner": None}
+    graphql_schema = schema._graphql_schema
+    assert isinstance(graphql_schema, GraphQLSchema)
+    assert schema.graphql_schema is graphql_schema
+    assert schema.MyOtherType is MyOtherType
+    assert str(schema) == str(Schema(Query))
+
+
+def test_lazy_schema_raises_type_errors_on_first_use():
+    class BrokenQuery(ObjectType):
+        field = Field("graphene.types.tests.test_schema.Unknown")
+
+    schema = Schema(BrokenQuery, lazy=True)
+
+    with raises(Exception):
+        schema.graphql_schema
+
+
+def make_big_query(size=2500):
+    types = []
+    for i in range(size):
+        fields = {f"field_{j}": String() for j in range(5)}
+        if types:
+            parent = types[(i - 1) // 2]
+            fields["parent"] = Field(parent)
+            fields["siblings"] = List(parent)
+        types.append(type(f"BigType{i}", (ObjectType,), fields))
+    fields = {f"big_type_{i}": Field(big_type) for i, big_type in enumerate(types)}
+    return type("BigQuery", (ObjectType,), fields)
+
+
+@fixture(scope="module")
+def big_query():
+    return make_big_query()
+
+
+def test_big_schema_construction_benchmark(benchmark, big_query):
+    schema = benchmark(Schema, big_query)
+
+    assert len(schema.graphql_schema.type_map) > 2500
+
+
+def test_big_lazy_schema_construction_benchmark(benchmark, big_query):
+    schema = benchmark(Schema, big_query, lazy=True)
+
+    assert len(schema.graphql_schema.type_map) > 2500
+
+
+class SnapshotEpisode(Enum):
+    NEWHOPE = 4
+    EMPIRE = 5
+
+
+class SnapshotCharacter(Interface):
+    name = String()
+
+
+class SnapshotHuman(ObjectType):
+    class Meta:
+        interfaces = (SnapshotCharacter,)
+
+    episode = SnapshotEpisode()
+
+
+class SnapshotFilter(InputObjectType):
+    episode = SnapshotEpisode(default_value=SnapshotEpisode.EMPIRE)
+
+
+class SnapshotQuery(ObjectType):
+    hero = Field(SnapshotCharacter, episode=SnapshotEpisode())
+    humans = List(
+        SnapshotHuman,
+        filter=SnapshotFilter(default_value={}),
+        first=Int(default_value=2),
+    )
+    greeting = String(resolver=lambda root, info: "Hello!")
+
+    def resolve_hero(root, info, episode=None):
+        return SnapshotHuman(name="Luke", episode=episode)
+
+    def resolve_humans(root, info, filter, first):
+        return [
+            SnapshotHuman(name=f"Human {i}", episode=filter.episode)
+            for i in range(first)
+        ]
+
+
+def test_schema_dump_load(tmp_path):
+    path = tmp_path / "schema.snapshot"
+    schema = Schema(SnapshotQuery, types=[SnapshotHuman])
+    schema.dump(path)
+
+    loaded_schema = Schema.load(path)
+
+    assert str(loaded_schema) == str(schema)
+    assert loaded_schema.query is SnapshotQuery
+    assert loaded_schema.types == [SnapshotHuman]
+    assert loaded_schema.SnapshotHuman is SnapshotHuman
+    assert loaded_schema.SnapshotFilter is SnapshotFilter
+    graphql_schema = loaded_schema.graphql_schema
+    assert graphql_schema.query_type.graphene_type is SnapshotQuery
+    episode_values = graphql_schema.get_type("SnapshotEpisode").values
+    assert episode_values["EMPIRE"].value is SnapshotEpisode.EMPIRE
+    humans_args = graphql_schema.query_type.fields["humans"].args
+    assert humans_args["first"].default_value == 2
+    result = loaded_schema.execute(
+        """
+        {
+            hero(episode: NEWHOPE) { __typename name ... on SnapshotHuman { episode } }
+            humans(first: 3) { name episode }
+            greeting
+        }
+        """
+    )
+    assert not result.errors
+    assert result.data == {
+        "hero": {"__typename": "SnapshotHuman", "name": "Luke", "episode": "NEWHOPE"},
+        "humans": [
+            {"name": "Human 0", "episode": "EMPIRE"},
+            {"name": "Human 1", "episode": "EMPIRE"},
+            {"name": "Human 2", "episode": "EMPIRE"},
+        ],
+        "greeting": "Hello!",
+    }
+
+
+def test_schema_load_types_from_resolvers_module(tmp_path):
+    big_query = make_big_query(size=10)
+    path = tmp_path / "schema.snapshot"
+    Schema(big_query).dump(path)
+
+    with raises(Exception, match="resolvers_module"):
+        Schema.load(path)
+
+    resolvers_module = ModuleType("big_schema")
+    resolvers_module.BigQuery = big_query
+    for field in big_query._meta.fields.values():
+        setattr(resolvers_module, field.type._meta.name, field.type)
+    schema = Schema.load(path, resolvers_module)
+
+    assert schema.query is big_query
+    assert schema.BigType3 is big_query._meta.fields["big_type_3"].type
+    result = schema.execute(
+        "{ bigType3 { field0 parent { field1 } } }",
+        root={"big_type_3": {"field_0": "a", "parent": {"field_1": "b"}}},
+    )
+    assert result.data == {"bigType3": {"field0": "a", "parent": {"field1": "b"}}}
+
+
+def test_schema_load_checks_the_format(tmp_path):
+    path = tmp_path / "schema.snapshot"
+    path.write_bytes(dumps({}))
+
+    with raises(UnpicklingError, match="not a Graphene schema snapshot"):
+        Schema.load(path)
+
+
+def test_schema_load_checks_the_versions(tmp_path, monkeypatch):
+    from .. import snapshot
+
+    path = tmp_path / "schema.snapshot"
+    Schema(SnapshotQuery).dump(path)
+
+    monkeypatch.setattr(snapshot, "SNAPSHOT_VERSION", 0)
+    with raises(UnpicklingError, match="format version 1, 0 was expected"):
+        Schema.load(path)
+    monkeypatch.undo()
+
+    monkeypatch.setattr(snapshot, "__version__", "0.0.0")
+    with raises(UnpicklingError, match="written with Graphene 3.*, not 0.0.0"):
+        Schema.load(path)
+
+
+def test_schema_load_checks_the_graphene_types(tmp_path, monkeypatch):
+    path = tmp_path / "schema.snapshot"
+    Schema(SnapshotQuery).dump(path)
+
+    monkeypatch.setitem(SnapshotHuman._meta.fields, "age", Field(Int))
+    with raises(UnpicklingError, match="does not match the Graphene types"):
+        Schema.load(path)
+
+
+class Exploit:
+    def __reduce__(self):
+        return (getcwd, ())
+
+
+def test_schema_load_only_loads_allowed_globals(tmp_path):
+    path = tmp_path / "schema.snapshot"
+    header = dumps((SNAPSHOT_VERSION, __version__, ""))
+
+    for payload in [Exploit(), getattr, attr_resolver]:
+        path.write_bytes(SNAPSHOT_MAGIC + header + dumps(payload))
+        with raises(UnpicklingError, match="is not allowed in schema snapshots"):
+            Schema.load(path)
+
+
+def test_big_schema_load_benchmark(benchmark, big_query, tmp_path):
+    path = tmp_path / "schema.snapshot"
+    Schema(big_query).dump(path)
+    resolvers_module = ModuleType("big_schema")
+    resolvers_module.BigQuery = big_query
+    for field in big_query._meta.fields.values():
+        setattr(resolvers_module, field.type._meta.name, field.type)
+
+    schema = benchmark(Schema.load, path, resolvers_module)
+
+    assert len(schema.graphql_schema.type_map) > 2500
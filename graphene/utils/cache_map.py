@@ -0,0 +1,222 @@
+from asyncio import get_running_loop
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from functools import partial
+from threading import Lock
+from time import monotonic
+
+class LRUCacheMap(MutableMapping):
+    """
+    Mapping keeping at most `max_size` entries, evicting the least recently used
+    one when full. Usable as the `cache_map` of a DataLoader reused across requests.
+
+    .. code:: python
+
+        user_loader = UserLoader(cache_map=LRUCacheMap(max_size=10000))
+
+    Lookups and evictions are counted in the `hits`, `misses` and `evictions`
+    attributes.
+    """
+
+    def __init__(self, max_size=1024):
+        assert max_size > 0, f'The max_size of a cache map must be positive, received "{max_size}".'
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+class TTLCacheMap(LRUCacheMap):
+    """
+    LRU cache map whose entries expire `ttl` seconds after being set.
+
+    .. code:: python
+
+        user_loader = UserLoader(cache_map=TTLCacheMap(ttl=60, max_size=10000))
+
+    The expiry of a single entry can be chosen with ``set(key, value, ttl=...)``.
+    Expired entries are dropped when looked up, iterated over or counted (by
+    `len`), and counted in `expirations`.
+    """
+
+    def __init__(self, ttl, max_size=1024, timer=monotonic):
+        super(TTLCacheMap, self).__init__(max_size=max_size)
+        self.ttl = ttl
+        self.timer = timer
+        self.expirations = 0
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                value, expires_at = self._data[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            if expires_at <= self.timer():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def set(self, key, value, ttl=None):
+        """
+        Sets the value of `key`, expiring after `ttl` seconds (defaults to the
+        `ttl` of the cache map).
+        """
+        expires_at = self.timer() + (self.ttl if ttl is None else ttl)
+        super(TTLCacheMap, self).__setitem__(key, (value, expires_at))
+
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and entry[1] > self.timer()
+
+    def __iter__(self):
+        self.purge()
+        return super(TTLCacheMap, self).__iter__()
+
+    def __len__(self):
+        self.purge()
+        return super(TTLCacheMap, self).__len__()
+
+    def purge(self):
+        """
+        Drops the expired entries.
+        """
+        with self._lock:
+            now = self.timer()
+            expired_keys = [key for key, (_, expires_at) in self._data.items() if expires_at <= now]
+            for key in expired_keys:
+                del self._data[key]
+            self.expirations += len(expired_keys)
+
+class SharedCacheMap(MutableMapping):
+    """
+    DataLoader `cache_map` backed by a store of resolved values shared across
+    requests.
+
+    Futures are bound to an event loop, so they are only kept for the lifetime of
+    the loader (usually a request). Once a load succeeds its value is saved in
+    `store`, any mapping (like a :class:`TTLCacheMap`) shared by the loaders of
+    every request, and later loaders get it back without calling their
+    `batch_load_fn`.
+
+    .. code:: python
+
+        user_store = TTLCacheMap(ttl=60, max_size=10000)
+
+        def get_context():
+            return {'user_loader': UserLoader(cache_map=SharedCacheMap(user_store))}
+
+    Failed loads are not shared. Clearing a key of the loader also removes it
+    from `store`, while clearing the whole loader only drops the futures of the
+    loader: the values shared by every request are invalidated explicitly with
+    `invalidate_all` (or `invalidate` for a single key).
+
+    The futures of the values found in `store` are created on `loop`, or on the
+    running event loop.
+    """
+
+    def __init__(self, store, loop=None):
+        self.store = store
+        self.loop = loop
+        self._futures = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._futures[key]
+        except KeyError:
+            pass
+        value = self.store[key]
+        future = (self.loop or get_running_loop()).create_future()
+        future.set_result(value)
+        self._futures[key] = future
+        return future
+
+    def __setitem__(self, key, future):
+        self._futures[key] = future
+        if future.done():
+            self._store_result(key, future)
+        else:
+            future.add_done_callback(partial(self._store_result, key))
+
+    def _store_result(self, key, future):
+        if self._futures.get(key) is not future or future.cancelled() or future.exception() is not None:
+            return
+        self.store[key] = future.result()
+
+    def __delitem__(self, key):
+        found = self._futures.pop(key, None) is not None
+        if not self.invalidate(key) and (not found):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._futures or key in self.store
+
+    def __iter__(self):
+        return iter(self._futures)
+
+    def __len__(self):
+        return len(self._futures)
+
+    def clear(self):
+        self._futures.clear()
+
+    def invalidate(self, key):
+        """
+        Removes the value of `key` from the shared `store`, returning whether
+        it was found.
+        """
+        try:
+            del self.store[key]
+        except KeyError:
+            return False
+        return True
+
+    def invalidate_all(self):
+        """
+        Removes every value from the shared `store`.
+        """
+        self.store.clear()
@@ -1,2 +1,58 @@
-import json
-from collections.abc import Mapping
\ No newline at end of file
+from collections.abc import Mapping
+
+def crunch(data):
+    """
+    Crunches a JSON-like value (like the data of an execution result) into a
+    flat list of unique values, in which lists and objects refer to their
+    items by their position in the list, like graphql-crunch does.
+
+    The values are indexed by hash (scalars by type and value, so that `1`,
+    `1.0` and `True` stay distinct as in JSON, containers by the positions of
+    their items), so crunching stays linear in the size of the data.
+
+    >>> crunch({'a': [1, 2], 'b': [1, 2]})
+    [1, 2, [0, 1], {'a': 2, 'b': 2}]
+    """
+    values = []
+    append = values.append
+    index = {}
+    get_position = index.get
+
+    def insert(value, key):
+        position = get_position(key)
+        if position is None:
+            position = index[key] = len(values)
+            append(value)
+        return position
+
+    def flatten(data):
+        cls = data.__class__
+        if cls is str:
+            return insert(data, data)
+        if cls is list or cls is tuple or (cls is not dict and isinstance(data, (list, tuple))):
+            flattened = [flatten(child) for child in data]
+            return insert(flattened, (list, tuple(flattened)))
+        if cls is dict or isinstance(data, Mapping):
+            flattened = {key: flatten(child) for key, child in data.items()}
+            return insert(flattened, (dict, tuple(flattened), tuple(flattened.values())))
+        return insert(data, (cls, data))
+    flatten(data)
+    return values
+
+def uncrunch(values):
+    """
+    Rebuilds the value crunched by :func:`crunch`.
+
+    >>> uncrunch([1, 2, [0, 1], {'a': 2, 'b': 2}])
+    {'a': [1, 2], 'b': [1, 2]}
+    """
+    expanded = []
+    append = expanded.append
+    for value in values:
+        if isinstance(value, list):
+            append([expanded[position] for position in value])
+        elif isinstance(value, Mapping):
+            append({key: expanded[position] for key, position in value.items()})
+        else:
+            append(value)
+    return expanded[-1] if expanded else None
@@ -1,4 +1,4 @@
-from asyncio import gather, ensure_future, get_event_loop, iscoroutine, iscoroutinefunction
+from asyncio import Semaphore, gather, ensure_future, get_event_loop, iscoroutine, iscoroutinefunction, wait
 from collections import namedtuple
 from collections.abc import Iterable
 from functools import partial
@@ -8,12 +8,15 @@ Loader = namedtuple('Loader', 'key,future')
 class DataLoader(object):
     batch = True
     max_batch_size = None
+    max_concurrent_batches = None
     cache = True
 
-    def __init__(self, batch_load_fn=None, batch=None, max_batch_size=None, cache=None, get_cache_key=None, cache_map=None, loop=None):
+    def __init__(self, batch_load_fn=None, batch=None, max_batch_size=None, cache=None, get_cache_key=None, cache_map=None, loop=None, batch_schedule_fn=None, max_concurrent_batches=None):
         self._loop = loop
         if batch_load_fn is not None:
             self.batch_load_fn = batch_load_fn
+        if batch_schedule_fn is not None:
+            self.batch_schedule_fn = batch_schedule_fn
         assert iscoroutinefunctionorpartial(self.batch_load_fn), 'batch_load_fn must be coroutine. Received: {}'.format(self.batch_load_fn)
         if not callable(self.batch_load_fn):
             raise TypeError('DataLoader must be have a batch_load_fn which accepts Iterable<key> and returns Future<Iterable<value>>, but got: {}.'.format(batch_load_fn))
@@ -21,11 +24,53 @@ class DataLoader(object):
             self.batch = batch
         if max_batch_size is not None:
             self.max_batch_size = max_batch_size
+        if max_concurrent_batches is not None:
+            self.max_concurrent_batches = max_concurrent_batches
         if cache is not None:
             self.cache = cache
         self.get_cache_key = get_cache_key or (lambda x: x)
         self._cache = cache_map if cache_map is not None else {}
         self._queue = []
+        self._dispatch_scheduled = False
+        self._batch_semaphore = None
+
+    @property
+    def loop(self):
+        if not self._loop:
+            self._loop = get_event_loop()
+        return self._loop
+
+    @property
+    def batch_semaphore(self):
+        if not self._batch_semaphore:
+            self._batch_semaphore = Semaphore(self.max_concurrent_batches)
+        return self._batch_semaphore
+
+    def batch_schedule_fn(self, callback):
+        """
+        Schedules `callback`, which dispatches the queued loads as one batch.
+
+        By default the dispatch runs once the event loop went through the tasks
+        already scheduled, so the loads issued by sibling resolvers are coalesced.
+        Pass a different `batch_schedule_fn` to the loader to collect loads over
+        a time window instead:
+
+        >>> DataLoader(batch_load_fn, batch_schedule_fn=lambda callback: get_event_loop().call_later(0.002, callback))
+        """
+        self.loop.call_soon(self.loop.call_soon, callback)
+
+    def schedule_dispatch(self):
+        """
+        Schedules a dispatch of the queue, unless one is already pending.
+        """
+        if self._dispatch_scheduled:
+            return
+        self._dispatch_scheduled = True
+
+        def dispatch():
+            self._dispatch_scheduled = False
+            dispatch_queue(self)
+        self.batch_schedule_fn(dispatch)
 
     def load(self, key=None):
         """
@@ -36,19 +81,21 @@ class DataLoader(object):
 
         cache_key = self.get_cache_key(key)
 
-        if self.cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        if self.cache:
+            cached_result = self._cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
 
-        future = self._loop.create_future() if self._loop else get_event_loop().create_future()
+        future = self.loop.create_future()
         self._queue.append(Loader(key=key, future=future))
 
         if self.cache:
             self._cache[cache_key] = future
 
         if not self.batch:
-            ensure_future(dispatch_queue(self))
-        elif len(self._queue) >= (self.max_batch_size or float('inf')):
-            ensure_future(dispatch_queue(self))
+            dispatch_queue(self)
+        else:
+            self.schedule_dispatch()
 
         return future
 
@@ -96,15 +143,26 @@ class DataLoader(object):
         """
         cache_key = self.get_cache_key(key)
         if cache_key not in self._cache:
-            future = self._loop.create_future() if self._loop else get_event_loop().create_future()
-            future.set_result(value)
+            future = self.loop.create_future()
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
             self._cache[cache_key] = future
         return self
 
+def get_chunks(iterable_obj, chunk_size=1):
+    chunk_size = max(1, chunk_size)
+    return (iterable_obj[i:i + chunk_size] for i in range(0, len(iterable_obj), chunk_size))
+
 def dispatch_queue(loader):
     """
     Given the current state of a Loader instance, perform a batch load
     from its current queue.
+
+    If the queue is longer than the `max_batch_size` of the loader, it is split
+    into several batches dispatched concurrently, with at most
+    `max_concurrent_batches` of them loading at the same time.
     """
     queue = loader._queue
     loader._queue = []
@@ -112,6 +170,33 @@ def dispatch_queue(loader):
     if not queue:
         return
 
+    max_batch_size = loader.max_batch_size
+    if max_batch_size and max_batch_size < len(queue):
+        chunks = get_chunks(queue, max_batch_size)
+    else:
+        chunks = [queue]
+
+    if loader.max_concurrent_batches:
+        for chunk in chunks:
+            ensure_future(dispatch_queue_batch_limited(loader, chunk))
+    else:
+        for chunk in chunks:
+            dispatch_queue_batch(loader, chunk)
+
+async def dispatch_queue_batch_limited(loader, queue):
+    """
+    Dispatch a batch once fewer than `max_concurrent_batches` batches of the
+    loader are loading.
+    """
+    async with loader.batch_semaphore:
+        batch_task = dispatch_queue_batch(loader, queue)
+        if batch_task is not None:
+            await wait([batch_task])
+
+def dispatch_queue_batch(loader, queue):
+    """
+    Perform a batch load of the given queue.
+    """
     keys = [l.key for l in queue]
     try:
         batch_future = loader.batch_load_fn(keys)
@@ -120,7 +205,11 @@ def dispatch_queue(loader):
     except Exception as e:
         return failed_dispatch(loader, queue, e)
 
-    def batch_callback(results):
+    def batch_callback(future):
+        try:
+            results = list(future.result())
+        except Exception as e:
+            return failed_dispatch(loader, queue, e)
         if len(results) != len(keys):
             return failed_dispatch(
                 loader,
@@ -139,9 +228,9 @@ def dispatch_queue(loader):
 
         return results
 
-    return ensure_future(batch_future).add_done_callback(
-        lambda future: batch_callback(future.result())
-    )
+    batch_task = ensure_future(batch_future)
+    batch_task.add_done_callback(batch_callback)
+    return batch_task
 
 def failed_dispatch(loader, queue, error):
     """
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from threading import Lock
+from graphql import GraphQLError, Source, parse, validate, validate_schema
+
+class DocumentCache:
+    """
+    Bounded LRU cache of parsed GraphQL documents and their validation errors.
+
+    Entries are keyed by the schema and the query text, so a single cache can
+    be shared between several schemas. Parsing and validating the same
+    persisted operations over and over is avoided for every cached query.
+
+    .. code:: python
+
+        from graphene import Schema
+        from graphene.utils.document_cache import DocumentCache
+
+        schema = Schema(query=Query, document_cache=DocumentCache(max_size=500))
+
+    Args:
+        max_size (int): Maximum number of documents kept in the cache. The least
+            recently used document is evicted once the limit is reached.
+    """
+
+    def __init__(self, max_size=1024):
+        assert max_size > 0, f'The max_size of a DocumentCache must be positive, received "{max_size}".'
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._documents = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def get(self, schema, source):
+        """
+        Returns a ``(document, errors)`` tuple for the given query.
+
+        ``document`` is ``None`` if the query could not be parsed, ``errors``
+        is the (possibly empty) list of schema, syntax or validation errors.
+        """
+        schema_validation_errors = validate_schema(schema)
+        if schema_validation_errors:
+            return (None, schema_validation_errors)
+        key = (schema, source.body if isinstance(source, Source) else source)
+        with self._lock:
+            entry = self._documents.get(key)
+            if entry is not None:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        entry = parse_and_validate(schema, source)
+        with self._lock:
+            self._documents[key] = entry
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def clear(self):
+        """
+        Removes every document from the cache and resets the counters.
+        """
+        with self._lock:
+            self._documents.clear()
+            self.hits = self.misses = self.evictions = 0
+
+def parse_and_validate(schema, source):
+    """
+    Parses and validates a query against a schema, returning a
+    ``(document, errors)`` tuple like :meth:`DocumentCache.get`.
+    """
+    schema_validation_errors = validate_schema(schema)
+    if schema_validation_errors:
+        return (None, schema_validation_errors)
+    try:
+        document = parse(source)
+    except GraphQLError as error:
+        return (None, [error])
+    return (document, validate(schema, document))
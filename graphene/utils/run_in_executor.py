@@ -0,0 +1,72 @@
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import partial, wraps
+from threading import Lock
+DEFAULT_MAX_WORKERS = 16
+_default_executor = None
+_default_executor_lock = Lock()
+is_async_execution = ContextVar('is_async_execution', default=False)
+
+@contextmanager
+def execution_mode(is_async):
+    """
+    Marks the execution run in the block as asynchronous (`Schema.execute_async`) or
+    synchronous (`Schema.execute`), for the resolvers run in an executor.
+    """
+    token = is_async_execution.set(is_async)
+    try:
+        yield
+    finally:
+        is_async_execution.reset(token)
+
+def get_default_executor():
+    """
+    Returns the thread pool shared by the resolvers run in an executor, created
+    with `DEFAULT_MAX_WORKERS` threads on first use.
+    """
+    global _default_executor
+    if _default_executor is None:
+        with _default_executor_lock:
+            if _default_executor is None:
+                _default_executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix='graphene-resolver')
+    return _default_executor
+
+def set_default_executor(executor):
+    """
+    Replaces the thread pool shared by the resolvers run in an executor.
+    """
+    global _default_executor
+    with _default_executor_lock:
+        _default_executor = executor
+
+def run_in_executor(func=None, executor=None):
+    """
+    Decorator running a blocking resolver in a thread pool when the query is
+    executed asynchronously, so it does not block the event loop.
+
+    The resolver runs in `executor` (the shared default thread pool if not
+    given) with a copy of the current context variables. In a synchronous
+    execution (with `Schema.execute`, even when called from a coroutine), or
+    when the schema is executed directly with `graphql-core`, the resolver is
+    called directly.
+
+    .. code:: python
+
+        class Query(ObjectType):
+            user = Field(User, id=ID())
+
+            @run_in_executor
+            def resolve_user(root, info, id):
+                return User.objects.get(id=id)
+    """
+    if func is None:
+        return partial(run_in_executor, executor=executor)
+
+    @wraps(func)
+    def wrapper(root, info, **args):
+        if not is_async_execution.get():
+            return func(root, info, **args)
+        return get_running_loop().run_in_executor(executor or get_default_executor(), partial(copy_context().run, func, root, info, **args))
+    return wrapper
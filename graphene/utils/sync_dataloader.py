@@ -0,0 +1,334 @@
+from collections.abc import Iterable
+from threading import local
+from .dataloader import Loader, get_chunks, iscoroutinefunctionorpartial
+_pending = local()
+
+class SyncFuture:
+    """
+    Value of a :class:`SyncDataLoader` load, available once the batch holding
+    its key was dispatched.
+
+    Callbacks added to the future run as soon as it is resolved, so values can
+    be chained without an event loop:
+
+    >>> name = user_loader.load(1).then(lambda user: user.name)
+    >>> name.result()
+    """
+
+    def __init__(self):
+        self._done = False
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    @classmethod
+    def resolved(cls, value):
+        future = cls()
+        future.set_result(value)
+        return future
+
+    @classmethod
+    def all(cls, values):
+        """
+        Returns a future for the list of the given values, in which the futures
+        are replaced by their results once they are all resolved.
+        """
+        values = list(values)
+        future = cls()
+        pending = [index for index, value in enumerate(values) if isinstance(value, SyncFuture)]
+        remaining = len(pending)
+        if not remaining:
+            future.set_result(values)
+            return future
+
+        def set_value(index, value_future):
+            nonlocal remaining
+            if future.done():
+                return
+            if value_future._exception is not None:
+                future.set_exception(value_future._exception)
+                return
+            values[index] = value_future._result
+            remaining -= 1
+            if not remaining:
+                future.set_result(values)
+        for index in pending:
+            values[index].add_done_callback(lambda value_future, index=index: set_value(index, value_future))
+        return future
+
+    def done(self):
+        return self._done
+
+    def set_result(self, result):
+        assert not self._done, 'The future is already resolved.'
+        self._done = True
+        self._result = result
+        self._run_callbacks()
+
+    def set_exception(self, exception):
+        assert not self._done, 'The future is already resolved.'
+        self._done = True
+        self._exception = exception
+        self._run_callbacks()
+
+    def add_done_callback(self, fn):
+        if self._done:
+            fn(self)
+        else:
+            self._callbacks.append(fn)
+
+    def _run_callbacks(self):
+        callbacks = self._callbacks
+        self._callbacks = []
+        for callback in callbacks:
+            callback(self)
+
+    def exception(self):
+        self.wait()
+        return self._exception
+
+    def result(self):
+        """
+        Returns the value of the future, dispatching the pending loads until it
+        is resolved. Raises the exception of the future if it failed.
+        """
+        self.wait()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def wait(self):
+        while not self._done:
+            if not dispatch_pending_loaders():
+                raise RuntimeError('The future cannot be resolved, no load is pending.')
+
+    def then(self, on_result=None, on_exception=None):
+        """
+        Returns a future for the value returned by `on_result` (or `on_exception`
+        if the future failed). Returned futures are followed.
+        """
+        future = SyncFuture()
+
+        def callback(resolved):
+            handler = on_result if resolved._exception is None else on_exception
+            if handler is None:
+                if resolved._exception is None:
+                    future.set_result(resolved._result)
+                else:
+                    future.set_exception(resolved._exception)
+                return
+            try:
+                value = handler(resolved._result if resolved._exception is None else resolved._exception)
+            except Exception as e:
+                future.set_exception(e)
+                return
+            if isinstance(value, SyncFuture):
+                value.add_done_callback(lambda value_future: future.set_exception(value_future._exception) if value_future._exception is not None else future.set_result(value_future._result))
+            else:
+                future.set_result(value)
+        self.add_done_callback(callback)
+        return future
+
+    def catch(self, on_exception):
+        return self.then(on_exception=on_exception)
+
+class SyncDataLoader(object):
+    """
+    DataLoader for synchronous execution.
+
+    The `batch_load_fn` is a regular function, receiving a list of keys and
+    returning the list of their values. Loads return a :class:`SyncFuture`;
+    the queued keys are dispatched once the current level of the query has
+    been executed by the :class:`graphene.execution.DeferredExecutionContext`,
+    or when the result of a future is requested.
+
+    >>> def load_users(keys):
+    >>>     return [get_user(key) for key in keys]
+    >>>
+    >>> user_loader = SyncDataLoader(load_users)
+    >>> schema.execute(query, execution_context_class=DeferredExecutionContext)
+    """
+    batch = True
+    max_batch_size = None
+    cache = True
+
+    def __init__(self, batch_load_fn=None, batch=None, max_batch_size=None, cache=None, get_cache_key=None, cache_map=None):
+        if batch_load_fn is not None:
+            self.batch_load_fn = batch_load_fn
+        if not callable(getattr(self, 'batch_load_fn', None)):
+            raise TypeError('SyncDataLoader must be have a batch_load_fn which accepts Iterable<key> and returns Iterable<value>, but got: {}.'.format(batch_load_fn))
+        assert not iscoroutinefunctionorpartial(self.batch_load_fn), 'batch_load_fn must not be a coroutine, use DataLoader instead. Received: {}'.format(self.batch_load_fn)
+        if batch is not None:
+            self.batch = batch
+        if max_batch_size is not None:
+            self.max_batch_size = max_batch_size
+        if cache is not None:
+            self.cache = cache
+        self.get_cache_key = get_cache_key or (lambda x: x)
+        self._cache = cache_map if cache_map is not None else {}
+        self._queue = []
+
+    def load(self, key=None):
+        """
+        Loads a key, returning a `SyncFuture` for the value represented by that key.
+        """
+        if key is None:
+            raise ValueError("The load method requires a key")
+
+        cache_key = self.get_cache_key(key)
+
+        if self.cache:
+            cached_result = self._cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+
+        future = SyncFuture()
+        if self.batch and not self._queue:
+            get_pending_loaders().append(self)
+        self._queue.append(Loader(key=key, future=future))
+
+        if self.cache:
+            self._cache[cache_key] = future
+
+        if not self.batch:
+            self.dispatch()
+
+        return future
+
+    def load_many(self, keys):
+        """
+        Loads multiple keys, returning a `SyncFuture` for the list of values.
+        """
+        if not isinstance(keys, Iterable):
+            raise TypeError("The loader.load_many() method must be called with Iterable<key> but got: {}".format(keys))
+
+        return SyncFuture.all([self.load(key) for key in keys])
+
+    def dispatch(self):
+        """
+        Loads the queued keys, in batches of at most `max_batch_size` keys.
+        """
+        queue = self._queue
+        self._queue = []
+        if not queue:
+            return
+        max_batch_size = self.max_batch_size
+        if max_batch_size and max_batch_size < len(queue):
+            chunks = get_chunks(queue, max_batch_size)
+        else:
+            chunks = [queue]
+        for chunk in chunks:
+            dispatch_sync_queue_batch(self, chunk)
+
+    def clear(self, key):
+        """
+        Clears the value at `key` from the cache, if it exists. Returns itself for
+        method chaining.
+        """
+        cache_key = self.get_cache_key(key)
+        if cache_key in self._cache:
+            del self._cache[cache_key]
+        return self
+
+    def clear_all(self):
+        """
+        Clears the entire cache. Returns itself for method chaining.
+        """
+        self._cache.clear()
+        return self
+
+    def prime(self, key, value):
+        """
+        Adds the provided key and value to the cache. If the key already exists, no
+        change is made. Returns itself for method chaining.
+        """
+        cache_key = self.get_cache_key(key)
+        if cache_key not in self._cache:
+            future = SyncFuture()
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+            self._cache[cache_key] = future
+        return self
+
+def get_pending_loaders():
+    """
+    Returns the loaders of the current thread with queued keys.
+    """
+    loaders = getattr(_pending, 'loaders', None)
+    if loaders is None:
+        loaders = _pending.loaders = []
+    return loaders
+
+def swap_pending_loaders(loaders):
+    """
+    Replaces the pending loaders of the current thread by `loaders`, returning
+    the previous ones.
+    """
+    previous_loaders = get_pending_loaders()
+    _pending.loaders = loaders
+    return previous_loaders
+
+def discard_pending_loads(loaders):
+    """
+    Drops the queued keys of the given loaders without loading them, removing
+    their (never resolved) futures from the caches of the loaders.
+    """
+    for loader in loaders:
+        queue = loader._queue
+        loader._queue = []
+        if loader.cache:
+            for l in queue:
+                loader.clear(l.key)
+
+def dispatch_pending_loaders():
+    """
+    Dispatches the queues of every pending loader of the current thread.
+    Loads queued while dispatching are left for the next call.
+    Returns whether any loader was dispatched.
+    """
+    loaders = get_pending_loaders()
+    if not loaders:
+        return False
+    _pending.loaders = []
+    for loader in loaders:
+        loader.dispatch()
+    return True
+
+def dispatch_sync_queue_batch(loader, queue):
+    """
+    Perform a batch load of the given queue.
+    """
+    keys = [l.key for l in queue]
+    try:
+        results = list(loader.batch_load_fn(keys))
+    except Exception as e:
+        return failed_sync_dispatch(loader, queue, e)
+    if len(results) != len(keys):
+        return failed_sync_dispatch(
+            loader,
+            queue,
+            ValueError(
+                "SyncDataLoader must return a list of the same length as the list of keys."
+                "\nExpected {} values, received {}.".format(len(keys), len(results))
+            ),
+        )
+
+    for l, value in zip(queue, results):
+        if isinstance(value, Exception):
+            l.future.set_exception(value)
+        else:
+            l.future.set_result(value)
+
+    return results
+
+def failed_sync_dispatch(loader, queue, error):
+    """
+    Do not cache individual loads if the entire batch dispatch fails,
+    but still reject each request.
+    """
+    for l in queue:
+        if loader.cache:
+            loader.clear(l.key)
+        l.future.set_exception(error)
@@ -0,0 +1,213 @@
+from asyncio import gather, new_event_loop
+
+from pytest import mark, raises
+
+from ..cache_map import LRUCacheMap, SharedCacheMap, TTLCacheMap
+from ..dataloader import DataLoader
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def id_loader(**options):
+    load_calls = []
+
+    async def fn(keys):
+        load_calls.append(keys)
+        return [Exception(key) if key == "error" else key for key in keys]
+
+    return DataLoader(fn, **options), load_calls
+
+
+def test_lru_cache_map_evicts_least_recently_used():
+    cache_map = LRUCacheMap(max_size=2)
+    cache_map["a"] = 1
+    cache_map["b"] = 2
+    assert cache_map["a"] == 1
+    cache_map["c"] = 3
+
+    assert "b" not in cache_map
+    assert dict(cache_map) == {"a": 1, "c": 3}
+    assert len(cache_map) == 2
+    assert cache_map.evictions == 1
+
+
+def test_lru_cache_map_stats():
+    cache_map = LRUCacheMap()
+    cache_map["a"] = 1
+    assert cache_map.get("a") == 1
+    assert cache_map.get("b") is None
+    assert "a" in cache_map
+    with raises(KeyError):
+        cache_map["c"]
+
+    assert (cache_map.hits, cache_map.misses, cache_map.evictions) == (1, 2, 0)
+
+    del cache_map["a"]
+    assert len(cache_map) == 0
+    cache_map["a"] = 1
+    cache_map.clear()
+    assert len(cache_map) == 0
+
+
+def test_lru_cache_map_requires_positive_size():
+    with raises(AssertionError):
+        LRUCacheMap(max_size=0)
+
+
+def test_ttl_cache_map_expires_entries():
+    timer = FakeTimer()
+    cache_map = TTLCacheMap(ttl=10, timer=timer)
+    cache_map["a"] = 1
+    cache_map.set("b", 2, ttl=20)
+
+    timer.now = 9
+    assert cache_map["a"] == 1
+    assert "a" in cache_map
+
+    timer.now = 10
+    assert "a" not in cache_map
+    assert cache_map.get("a") is None
+    assert cache_map["b"] == 2
+
+    timer.now = 20
+    with raises(KeyError):
+        cache_map["b"]
+
+    assert len(cache_map) == 0
+    assert cache_map.expirations == 2
+    assert (cache_map.hits, cache_map.misses) == (2, 2)
+
+
+def test_ttl_cache_map_purges_expired_entries():
+    timer = FakeTimer()
+    cache_map = TTLCacheMap(ttl=10, timer=timer)
+    cache_map["a"] = 1
+    cache_map.set("b", 2, ttl=20)
+
+    timer.now = 10
+    assert len(cache_map) == 1
+    assert list(cache_map) == ["b"]
+    assert cache_map.expirations == 1
+
+    timer.now = 20
+    assert dict(cache_map) == {}
+    assert cache_map.expirations == 2
+
+
+def test_ttl_cache_map_is_bounded():
+    cache_map = TTLCacheMap(ttl=10, max_size=1)
+    cache_map["a"] = 1
+    cache_map["b"] = 2
+    assert dict(cache_map) == {"b": 2}
+    assert cache_map.evictions == 1
+
+
+@mark.asyncio
+async def test_dataloader_with_lru_cache_map():
+    cache_map = LRUCacheMap(max_size=2)
+    loader, load_calls = id_loader(cache_map=cache_map)
+
+    assert await loader.load_many([1, 2, 3]) == [1, 2, 3]
+    assert len(cache_map) == 2
+    assert await loader.load_many([2, 3]) == [2, 3]
+    assert await loader.load(1) == 1
+
+    assert load_calls == [[1, 2, 3], [1]]
+    assert cache_map.hits == 2
+
+
+@mark.asyncio
+async def test_dataloader_with_ttl_cache_map():
+    timer = FakeTimer()
+    loader, load_calls = id_loader(cache_map=TTLCacheMap(ttl=5, timer=timer))
+
+    assert await loader.load(1) == 1
+    assert await loader.load(1) == 1
+    timer.now = 5
+    assert await loader.load(1) == 1
+
+    assert load_calls == [[1], [1]]
+
+
+@mark.asyncio
+async def test_shared_cache_map_shares_values_across_loaders():
+    store = LRUCacheMap()
+    loader, load_calls = id_loader(cache_map=SharedCacheMap(store))
+    assert await gather(loader.load(1), loader.load(2)) == [1, 2]
+    assert dict(store) == {1: 1, 2: 2}
+
+    other_loader, other_load_calls = id_loader(cache_map=SharedCacheMap(store))
+    assert await gather(other_loader.load(1), other_loader.load(3)) == [1, 3]
+
+    assert load_calls == [[1, 2]]
+    assert other_load_calls == [[3]]
+    assert dict(store) == {1: 1, 2: 2, 3: 3}
+
+
+@mark.asyncio
+async def test_shared_cache_map_does_not_share_errors():
+    store = LRUCacheMap()
+    loader, _ = id_loader(cache_map=SharedCacheMap(store))
+
+    with raises(Exception) as exc_info:
+        await loader.load("error")
+
+    assert str(exc_info.value) == "error"
+    assert "error" not in store
+
+
+@mark.asyncio
+async def test_shared_cache_map_prime_and_clear():
+    store = LRUCacheMap()
+    loader, load_calls = id_loader(cache_map=SharedCacheMap(store))
+    loader.prime(1, "one")
+    assert store[1] == "one"
+    assert await loader.load(1) == "one"
+
+    loader.clear(1)
+    assert 1 not in store
+    assert await loader.load(1) == 1
+
+    loader.clear_all()
+    assert dict(store) == {1: 1}
+    assert await loader.load(1) == 1
+    assert load_calls == [[1]]
+
+
+@mark.asyncio
+async def test_shared_cache_map_invalidate():
+    store = LRUCacheMap()
+    cache_map = SharedCacheMap(store)
+    other_cache_map = SharedCacheMap(store)
+    loader, load_calls = id_loader(cache_map=cache_map)
+    assert await loader.load_many([1, 2]) == [1, 2]
+
+    assert cache_map.invalidate(1)
+    assert not other_cache_map.invalidate(1)
+    assert dict(store) == {2: 2}
+
+    other_cache_map.invalidate_all()
+    assert len(store) == 0
+    loader.clear_all()
+    assert await loader.load(2) == 2
+    assert load_calls == [[1, 2], [2]]
+
+
+def test_shared_cache_map_loop():
+    loop = new_event_loop()
+    try:
+        cache_map = SharedCacheMap({1: "one"}, loop=loop)
+        future = cache_map[1]
+        assert future.get_loop() is loop
+        assert future.result() == "one"
+    finally:
+        loop.close()
+
+    with raises(RuntimeError):
+        SharedCacheMap({1: "one"})[1]
@@ -1,6 +1,8 @@
+import json
+
 from pytest import mark
 
-from ..crunch import crunch
+from ..crunch import crunch, uncrunch
 
 
 @mark.parametrize(
@@ -49,3 +51,73 @@ from ..crunch import crunch
 )
 def test_crunch(description, uncrunched, crunched):
     assert crunch(uncrunched) == crunched
+
+
+@mark.parametrize(
+    "uncrunched",
+    [
+        0,
+        "string",
+        [],
+        {},
+        [[[1, 2, 3]]],
+        [{"a": True, "b": [1, 2, 3]}, [1, 2, 3]],
+        {"a": True, "b": [1, 2, 3], "c": {"a": True, "b": [1, 2, 3]}},
+    ],
+)
+def test_uncrunch(uncrunched):
+    assert uncrunch(crunch(uncrunched)) == uncrunched
+
+
+def test_crunch_keeps_distinct_json_values():
+    assert crunch([1, 1.0, True, "1", None]) == [1, 1.0, True, "1", None, [0, 1, 2, 3, 4]]
+
+
+def test_crunch_tuples_as_lists():
+    assert crunch(((1, 2), [1, 2])) == [1, 2, [0, 1], [2, 2]]
+
+
+def test_crunch_repeated_containers():
+    shared = {"a": [1, 2]}
+
+    assert crunch([shared, shared, {"a": [1, 2]}]) == [
+        1,
+        2,
+        [0, 1],
+        {"a": 2},
+        [3, 3, 3],
+    ]
+
+
+def test_crunch_objects_with_different_keys():
+    assert crunch([{"a": 1}, {"b": 1}]) == [1, {"a": 0}, {"b": 0}, [1, 2]]
+
+
+def get_big_response(size):
+    users = [{"id": str(i % 1000), "name": f"User {i % 1000}"} for i in range(size)]
+    return {"posts": [{"id": str(i), "author": user} for i, user in enumerate(users)]}
+
+
+def test_crunch_big_response_benchmark(benchmark):
+    # 250,000 posts with 1,000,000 values
+    response = get_big_response(250000)
+
+    crunched = benchmark.pedantic(crunch, (response,), rounds=1)
+
+    assert uncrunch(crunched) == response
+    crunched_size = len(json.dumps(crunched))
+    json_size = len(json.dumps(response))
+    benchmark.extra_info.update(crunched_size=crunched_size, json_size=json_size)
+    assert crunched_size < json_size
+
+
+def test_crunch_encode_benchmark(benchmark):
+    response = get_big_response(10000)
+
+    benchmark(lambda: json.dumps(crunch(response)))
+
+
+def test_json_encode_benchmark(benchmark):
+    response = get_big_response(10000)
+
+    benchmark(lambda: json.dumps(response))
@@ -1,4 +1,4 @@
-from asyncio import gather
+from asyncio import gather, get_event_loop, sleep
 from collections import namedtuple
 from functools import partial
 from unittest.mock import Mock
@@ -450,3 +450,165 @@ async def test_dataloader_clear_with_missing_key_works():
 
     a_loader, a_load_calls = id_loader(resolve=do_resolve)
     assert a_loader.clear("A1") == a_loader
+
+
+@mark.asyncio
+async def test_dispatches_without_awaiting_the_loads():
+    identity_loader, load_calls = id_loader()
+
+    future1 = identity_loader.load(1)
+    future2 = identity_loader.load(2)
+    await sleep(0)
+    await sleep(0)
+    await sleep(0)
+
+    assert load_calls == [[1, 2]]
+    assert await future1 == 1
+    assert await future2 == 2
+
+
+@mark.asyncio
+async def test_coalesces_loads_of_sibling_resolvers():
+    load_calls = []
+
+    async def load_names(keys):
+        load_calls.append(keys)
+        return [f"Name {key}" for key in keys]
+
+    class Item(ObjectType):
+        name = String()
+
+        async def resolve_name(item, info):
+            return await info.context.load(item)
+
+    class Query(ObjectType):
+        items = List(Item)
+        other = String()
+
+        def resolve_items(_, info):
+            return [1, 2, 3]
+
+        async def resolve_other(_, info):
+            return await info.context.load(4)
+
+    schema = Schema(query=Query)
+    result = await schema.execute_async(
+        "{ items { name } other }", context=DataLoader(load_names)
+    )
+
+    assert not result.errors
+    assert result.data == {
+        "items": [{"name": "Name 1"}, {"name": "Name 2"}, {"name": "Name 3"}],
+        "other": "Name 4",
+    }
+    assert load_calls == [[4, 1, 2, 3]]
+
+
+@mark.asyncio
+async def test_custom_batch_schedule_fn():
+    scheduled = []
+
+    def schedule_fn(callback):
+        scheduled.append(callback)
+        get_event_loop().call_later(0.05, callback)
+
+    identity_loader, load_calls = id_loader(batch_schedule_fn=schedule_fn)
+
+    async def delayed_load(key):
+        await sleep(0.001)
+        return await identity_loader.load(key)
+
+    values = await gather(identity_loader.load(1), delayed_load(2))
+
+    assert values == [1, 2]
+    assert load_calls == [[1, 2]]
+    assert len(scheduled) == 1
+
+
+@mark.asyncio
+async def test_batch_schedule_fn_in_subclass():
+    load_calls = []
+
+    class WindowLoader(DataLoader):
+        def batch_schedule_fn(self, callback):
+            self.loop.call_later(0.05, callback)
+
+        async def batch_load_fn(self, keys):
+            load_calls.append(keys)
+            return keys
+
+    loader = WindowLoader()
+
+    async def delayed_load(key):
+        await sleep(0.001)
+        return await loader.load(key)
+
+    assert await gather(loader.load(1), delayed_load(2)) == [1, 2]
+    assert load_calls == [[1, 2]]
+
+
+@mark.asyncio
+async def test_splits_large_queues_into_batches_of_max_batch_size():
+    identity_loader, load_calls = id_loader(max_batch_size=1000)
+
+    values = await identity_loader.load_many(range(2500))
+
+    assert values == list(range(2500))
+    assert [len(keys) for keys in load_calls] == [1000, 1000, 500]
+
+
+@mark.asyncio
+async def test_dispatches_split_batches_concurrently():
+    in_flight = []
+    max_in_flight = 0
+    load_calls = []
+
+    async def slow_load(keys):
+        nonlocal max_in_flight
+        in_flight.append(keys)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        load_calls.append(keys)
+        await sleep(0.01)
+        in_flight.remove(keys)
+        return keys
+
+    loader = DataLoader(slow_load, max_batch_size=2)
+
+    assert await loader.load_many([1, 2, 3, 4, 5]) == [1, 2, 3, 4, 5]
+    assert load_calls == [[1, 2], [3, 4], [5]]
+    assert max_in_flight == 3
+
+
+@mark.asyncio
+async def test_limits_concurrent_batches():
+    in_flight = []
+    max_in_flight = 0
+    load_calls = []
+
+    async def slow_load(keys):
+        nonlocal max_in_flight
+        in_flight.append(keys)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        load_calls.append(keys)
+        await sleep(0.01)
+        in_flight.remove(keys)
+        return keys
+
+    loader = DataLoader(slow_load, max_batch_size=2, max_concurrent_batches=2)
+
+    assert await loader.load_many([1, 2, 3, 4, 5, 6, 7]) == [1, 2, 3, 4, 5, 6, 7]
+    assert load_calls == [[1, 2], [3, 4], [5, 6], [7]]
+    assert max_in_flight == 2
+
+
+@mark.asyncio
+async def test_limited_concurrent_batches_propagate_failures():
+    async def failing_load(keys):
+        raise Exception("Load failed")
+
+    loader = DataLoader(failing_load, max_batch_size=1, max_concurrent_batches=1)
+
+    with raises(Exception) as exc_info:
+        await loader.load_many([1, 2])
+
+    assert str(exc_info.value) == "Load failed"
@@ -0,0 +1,115 @@
+from pytest import mark, raises
+
+from graphql import Source
+
+from ..document_cache import DocumentCache
+from ...types import ObjectType, Schema, String
+
+
+class Query(ObjectType):
+    hello = String(name=String())
+
+    def resolve_hello(root, info, name="World"):
+        return f"Hello {name}"
+
+
+schema = Schema(query=Query)
+
+
+def test_document_cache_parses_and_validates_once():
+    cache = DocumentCache()
+    document, errors = cache.get(schema.graphql_schema, "{ hello }")
+    assert document is not None
+    assert errors == []
+
+    assert cache.get(schema.graphql_schema, "{ hello }") == (document, errors)
+    assert cache.get(schema.graphql_schema, Source("{ hello }"))[0] is document
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 1, 0)
+    assert len(cache) == 1
+
+
+def test_document_cache_keeps_syntax_and_validation_errors():
+    cache = DocumentCache()
+    document, errors = cache.get(schema.graphql_schema, "{ hello ")
+    assert document is None
+    assert errors[0].message == "Syntax Error: Expected Name, found <EOF>."
+
+    document, errors = cache.get(schema.graphql_schema, "{ goodbye }")
+    assert document is not None
+    assert errors[0].message == "Cannot query field 'goodbye' on type 'Query'."
+
+    assert cache.get(schema.graphql_schema, "{ goodbye }")[1] == errors
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_document_cache_is_keyed_by_schema():
+    other_schema = Schema(query=Query)
+    cache = DocumentCache()
+    cache.get(schema.graphql_schema, "{ hello }")
+    cache.get(other_schema.graphql_schema, "{ hello }")
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_document_cache_evicts_least_recently_used():
+    cache = DocumentCache(max_size=2)
+    a, _ = cache.get(schema.graphql_schema, "{ a: hello }")
+    cache.get(schema.graphql_schema, "{ b: hello }")
+    assert cache.get(schema.graphql_schema, "{ a: hello }")[0] is a
+    cache.get(schema.graphql_schema, "{ c: hello }")
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get(schema.graphql_schema, "{ a: hello }")[0] is a
+    assert cache.misses == 3
+
+    cache.get(schema.graphql_schema, "{ b: hello }")
+    assert cache.misses == 4
+
+
+def test_document_cache_clear():
+    cache = DocumentCache()
+    cache.get(schema.graphql_schema, "{ hello }")
+    cache.get(schema.graphql_schema, "{ hello }")
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+
+def test_document_cache_requires_positive_size():
+    with raises(AssertionError):
+        DocumentCache(max_size=0)
+
+
+def test_schema_execute_uses_document_cache():
+    cache = DocumentCache()
+    cached_schema = Schema(query=Query, document_cache=cache)
+    query = "query sayHello($name: String) { hello(name: $name) }"
+
+    result = cached_schema.execute(query, variables={"name": "Peter"})
+    assert not result.errors
+    assert result.data == {"hello": "Hello Peter"}
+
+    result = cached_schema.execute(query, variable_values={"name": "Paul"})
+    assert not result.errors
+    assert result.data == {"hello": "Hello Paul"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_schema_execute_returns_cached_errors():
+    cached_schema = Schema(query=Query, document_cache=DocumentCache())
+    for _ in range(2):
+        result = cached_schema.execute("{ goodbye }")
+        assert result.data is None
+        assert result.errors[0].message == "Cannot query field 'goodbye' on type 'Query'."
+
+
+@mark.asyncio
+async def test_schema_execute_async_uses_document_cache():
+    cache = DocumentCache()
+    cached_schema = Schema(query=Query, document_cache=cache)
+
+    for _ in range(2):
+        result = await cached_schema.execute_async("{ hello }")
+        assert not result.errors
+        assert result.data == {"hello": "Hello World"}
+    assert (cache.hits, cache.misses) == (1, 1)
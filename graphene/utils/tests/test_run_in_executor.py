@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from threading import current_thread
+from time import sleep
+
+from pytest import mark
+
+from ...types import Field, Int, ObjectType, Schema, String
+from ..run_in_executor import run_in_executor
+
+request_id = ContextVar("request_id", default=None)
+custom_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="custom")
+
+
+class Query(ObjectType):
+    thread = String()
+    slow = String(delay=Int())
+    field_thread = Field(String, run_in_executor=True)
+    custom_thread = Field(String, run_in_executor=custom_executor)
+    request = String()
+
+    @run_in_executor
+    def resolve_thread(root, info):
+        return current_thread().name
+
+    @run_in_executor
+    def resolve_slow(root, info, delay):
+        sleep(delay / 1000)
+        return "done"
+
+    def resolve_field_thread(root, info):
+        return current_thread().name
+
+    def resolve_custom_thread(root, info):
+        return current_thread().name
+
+    @run_in_executor()
+    def resolve_request(root, info):
+        return request_id.get()
+
+
+schema = Schema(query=Query)
+
+
+@mark.asyncio
+async def test_runs_resolvers_in_a_thread_pool():
+    result = await schema.execute_async("{ thread fieldThread }")
+
+    assert not result.errors
+    assert result.data["thread"] != current_thread().name
+    assert result.data["fieldThread"] != current_thread().name
+
+
+@mark.asyncio
+async def test_runs_blocking_resolvers_concurrently():
+    from time import perf_counter
+
+    start = perf_counter()
+    result = await schema.execute_async(
+        "{ a: slow(delay: 200) b: slow(delay: 200) c: slow(delay: 200) }"
+    )
+
+    assert not result.errors
+    assert result.data == {"a": "done", "b": "done", "c": "done"}
+    assert perf_counter() - start < 0.5
+
+
+@mark.asyncio
+async def test_runs_resolvers_in_the_given_executor():
+    result = await schema.execute_async("{ customThread }")
+
+    assert not result.errors
+    assert result.data["customThread"].startswith("custom")
+
+
+@mark.asyncio
+async def test_copies_the_context_variables():
+    request_id.set("request-1")
+
+    result = await schema.execute_async("{ request }")
+
+    assert not result.errors
+    assert result.data == {"request": "request-1"}
+
+
+def test_calls_resolvers_directly_in_sync_execution():
+    result = schema.execute("{ thread fieldThread }")
+
+    assert not result.errors
+    assert result.data == {"thread": current_thread().name, "fieldThread": current_thread().name}
+
+
+@mark.asyncio
+async def test_calls_resolvers_directly_in_sync_execution_from_a_coroutine():
+    result = schema.execute("{ thread fieldThread }")
+
+    assert not result.errors
+    assert result.data == {"thread": current_thread().name, "fieldThread": current_thread().name}
+
+
+@mark.asyncio
+async def test_runs_resolvers_in_a_thread_pool_with_a_compiled_query():
+    result = await schema.compile("{ thread }").execute_async()
+
+    assert not result.errors
+    assert result.data["thread"] != current_thread().name
@@ -0,0 +1,134 @@
+from pytest import raises
+
+from ..sync_dataloader import SyncDataLoader, SyncFuture, dispatch_pending_loaders
+
+
+def id_loader(**options):
+    load_calls = []
+
+    def fn(keys):
+        load_calls.append(keys)
+        return keys
+
+    return SyncDataLoader(fn, **options), load_calls
+
+
+def test_batches_loads_until_a_result_is_requested():
+    identity_loader, load_calls = id_loader()
+
+    future1 = identity_loader.load(1)
+    future2 = identity_loader.load(2)
+
+    assert not future1.done()
+    assert load_calls == []
+
+    assert future1.result() == 1
+    assert future2.result() == 2
+    assert load_calls == [[1, 2]]
+
+
+def test_load_many():
+    identity_loader, load_calls = id_loader()
+
+    assert identity_loader.load_many([1, 2, 3]).result() == [1, 2, 3]
+    assert load_calls == [[1, 2, 3]]
+
+
+def test_batches_with_max_batch_size():
+    identity_loader, load_calls = id_loader(max_batch_size=2)
+
+    assert identity_loader.load_many([1, 2, 3]).result() == [1, 2, 3]
+    assert load_calls == [[1, 2], [3]]
+
+
+def test_without_batching():
+    identity_loader, load_calls = id_loader(batch=False)
+
+    future1 = identity_loader.load(1)
+    future2 = identity_loader.load(2)
+
+    assert future1.done() and future2.done()
+    assert load_calls == [[1], [2]]
+
+
+def test_caches_repeated_requests():
+    identity_loader, load_calls = id_loader()
+
+    assert identity_loader.load("A") is identity_loader.load("A")
+    assert identity_loader.load_many(["A", "B"]).result() == ["A", "B"]
+    assert identity_loader.load("B").result() == "B"
+    assert load_calls == [["A", "B"]]
+
+
+def test_then_chains_values_and_futures():
+    identity_loader, load_calls = id_loader()
+
+    future = identity_loader.load(1).then(lambda value: identity_loader.load(value + 1))
+
+    assert future.result() == 2
+    assert load_calls == [[1], [2]]
+
+
+def test_resolves_to_error_to_indicate_failure():
+    def even_loader_fn(keys):
+        return [key if key % 2 == 0 else Exception(f"Odd: {key}") for key in keys]
+
+    even_loader = SyncDataLoader(even_loader_fn)
+
+    future1 = even_loader.load(1)
+    future2 = even_loader.load(2)
+
+    with raises(Exception) as exc_info:
+        future1.result()
+    assert str(exc_info.value) == "Odd: 1"
+    assert future2.result() == 2
+    assert (
+        future1.catch(lambda error: f"Caught: {error}").result() == "Caught: Odd: 1"
+    )
+
+
+def test_does_not_cache_failed_dispatches():
+    calls = []
+
+    def failing_fn(keys):
+        calls.append(keys)
+        raise Exception("Failed")
+
+    loader = SyncDataLoader(failing_fn)
+
+    with raises(Exception):
+        loader.load(1).result()
+    with raises(Exception):
+        loader.load(1).result()
+
+    assert calls == [[1], [1]]
+
+
+def test_requires_a_list_of_the_same_length():
+    loader = SyncDataLoader(lambda keys: [])
+
+    with raises(ValueError) as exc_info:
+        loader.load(1).result()
+    assert "Expected 1 values, received 0." in str(exc_info.value)
+
+
+def test_prime():
+    identity_loader, load_calls = id_loader()
+    identity_loader.prime("A", "Primed")
+
+    assert identity_loader.load_many(["A", "B"]).result() == ["Primed", "B"]
+    assert load_calls == [["B"]]
+
+
+def test_rejects_coroutine_batch_load_fn():
+    async def fn(keys):
+        return keys
+
+    with raises(AssertionError):
+        SyncDataLoader(fn)
+
+
+def test_unresolvable_future():
+    assert not dispatch_pending_loaders()
+    with raises(RuntimeError):
+        SyncFuture().result()
@@ -83,7 +83,7 @@ setup(
     keywords="api graphql protocol rest relay graphene",
     packages=find_packages(exclude=["examples*"]),
     install_requires=[
-        "graphql-core>=3.1,<3.3",
+        "graphql-core>=3.2,<3.3",
         "graphql-relay>=3.1,<3.3",
         "aniso8601>=8,<10",
     ],